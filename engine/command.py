@@ -1,4 +1,3 @@
-import pyttsx3
 import re
 import speech_recognition as sr
 import eel
@@ -6,20 +5,13 @@ import time
 import threading
 import os
 import json
-import tempfile
-
-# Optional faster-whisper import (used for multilingual offline transcription)
-_whisper_available = False
-try:
-    from faster_whisper import WhisperModel
-    _whisper_available = True
-except Exception:
-    _whisper_available = False
 
 from engine import config as config_module
-
-# whisper model cache
-whisper_model = None
+# Resident faster-whisper service (multilingual offline transcription)
+from engine.speech_service import audio_to_float32, speech_service
+from engine.streaming_asr import StreamingTranscriber
+from engine.tts_pipeline import NORMAL, tts_pipeline
+from engine.wake_channel import wake_metrics
 
 # runtime speech language (default read from config)
 try:
@@ -27,6 +19,14 @@ try:
 except Exception:
     current_speech_lang = 'en-IN'
 
+# held while allCommands captures a spoken command from the microphone
+_capture_lock = threading.Lock()
+
+
+def capture_active():
+    """True while a voice command is being captured."""
+    return _capture_lock.locked()
+
 
 @eel.expose
 def set_speech_language(lang_code):
@@ -49,102 +49,77 @@ def set_speech_language(lang_code):
         return False
 
 
+@eel.expose
+def get_speech_service_status():
+    """Readiness of the offline Whisper service (state, load/warm-up timings)."""
+    return speech_service.status()
+
+
+@eel.expose
+def get_startup_status():
+    """Readiness of the startup stages (DB, TTS, Whisper, ...) with their timings."""
+    from engine.startup import startup
+    return startup.status()
+
+
+@eel.expose
+def get_wake_metrics():
+    """Hotword-to-capture latency for wake events received from the hotword process."""
+    return wake_metrics.stats()
+
+
+@eel.expose
+def get_db_writer_stats():
+    """Writes queued/committed by the database writer thread and how they were grouped."""
+    from engine.db_writer import db_writer
+    return db_writer.stats()
+
+
+@eel.expose
+def get_http_metrics():
+    """Per-endpoint latency of networked commands (YouTube, translation, ...)."""
+    from engine.http_client import http_client
+    return http_client.metrics()
+
+
 @eel.expose
 def get_speech_language():
     try:
         return current_speech_lang
     except Exception:
         return getattr(config_module, 'DEFAULT_SPEECH_LANG', 'en-IN')
-# Global speech lock to prevent threading issues
-_speech_lock = threading.Lock()
-
-# Lazy-init TTS engine to avoid initialization side-effects during import
-_tts_engine = None
-_preferred_voice_id = None
-
-def _get_tts_engine():
-    """Lazily initialize and configure the pyttsx3 engine on first use."""
-    global _tts_engine, _preferred_voice_id
-    if _tts_engine is not None:
-        return _tts_engine
-    try:
-        eng = pyttsx3.init('sapi5')
-        # Pick a softer voice if available (prefer female or 'Zira' on Windows)
-        try:
-            voices = eng.getProperty('voices')
-            for v in voices:
-                name = getattr(v, 'name', '').lower()
-                if 'zira' in name or 'female' in name or 'susan' in name:
-                    _preferred_voice_id = v.id
-                    break
-            if not _preferred_voice_id and len(voices) > 0:
-                _preferred_voice_id = voices[0].id
-            if _preferred_voice_id:
-                eng.setProperty('voice', _preferred_voice_id)
-        except Exception:
-            pass
 
-        # Set gentler defaults
-        try:
-            eng.setProperty('rate', 150)
-            eng.setProperty('volume', 0.85)
-        except Exception:
-            pass
 
-        _tts_engine = eng
-        return _tts_engine
-    except Exception:
-        _tts_engine = None
-        return None
-
-
-def _speak_chunks(engine, text):
-    """Split text into sentence-like chunks and speak with small pauses to sound smoother."""
-    # Very simple splitter: split on ., ?, ! and commas to create natural pauses
-    import time as _time
-    chunks = []
-    # Prefer splitting on punctuation while preserving meaningful short clauses
-    for part in re.split(r'(?<=[\.!?])\s+|,\s+', text):
-        p = part.strip()
-        if p:
-            chunks.append(p)
-
-    # Fallback if nothing was split
-    if not chunks:
-        chunks = [text]
-
-    for i, c in enumerate(chunks):
-        # Slightly reduce intensity for shorter chunks by adding a leading pause
-        try:
-            # Engine may be None in headless/envs; try to get or fallback to print
-            eng = engine or _get_tts_engine()
-            if eng is not None:
-                eng.say(c)
-                eng.runAndWait()
-            else:
-                raise RuntimeError('TTS engine unavailable')
-        except Exception:
-            # If runAndWait fails (rare), fallback to print
-            print(f"Jarvis: {c}")
-        # Small pause between chunks to sound calm and measured
-        if i < len(chunks) - 1:
-            _time.sleep(0.25)
+@eel.expose
+def get_tts_status():
+    """Readiness of the speech engine and recent utterance latency."""
+    from engine.tts_engine import tts_engine
+    return tts_engine.status()
+
 
+def speak(text, wait=True, priority=NORMAL, key=None, display=True):
+    """Show text in the UI and speak it through the shared TTS pipeline.
 
-def speak(text):
-    """Thread-safe speech function with softer delivery"""
+    With wait=False the call returns as soon as the text is queued. `key` marks
+    an announcement that supersedes an earlier one with the same key that has
+    not been spoken yet. display=False skips the chat bubble, for callers that
+    speak a streamed answer piece by piece and show it once at the end.
+    Returns the queued Utterance.
+    """
     text = str(text)
     try:
         # Update UI first (only if eel is available)
         try:
             eel.DisplayMessage(text)
-            eel.receiverText(text)
+            if display:
+                eel.receiverText(text)
         except:
             pass  # Skip UI updates if eel is not available
 
-        with _speech_lock:
-            # Use the persistent engine
-            _speak_chunks(_tts_engine, text)
+        utterance = tts_pipeline.say(text, priority=priority, key=key)
+        if wait:
+            utterance.wait()
+        return utterance
 
     except Exception as e:
         print(f"Error in speak function: {e}")
@@ -152,6 +127,15 @@ def speak(text):
         print(f"Jarvis: {text}")
 
 
+def _calibrate_for_capture(r, source):
+    # A wake-word trigger already proves the mic is live, so calibrate briefly and start capturing sooner
+    r.adjust_for_ambient_noise(source, duration=0.3 if wake_metrics.pending() else 1)
+    ms = wake_metrics.mark_listening()
+    if ms is not None:
+        print(f"wake-to-listen: {ms:.0f} ms")
+        _log_voice_metric('wake_to_listen', {'ms': round(ms, 1)})
+
+
 def takecommand():
 
     r = sr.Recognizer()
@@ -170,6 +154,19 @@ def takecommand():
     except Exception:
         pass
 
+    # Determine runtime language preference (default from config)
+    try:
+        runtime_lang = current_speech_lang
+    except Exception:
+        runtime_lang = getattr(config_module, 'DEFAULT_SPEECH_LANG', 'en-IN')
+
+    # Stream to the resident Whisper model when it is warm; otherwise capture a whole phrase first
+    if getattr(config_module, 'STREAMING_ASR', True) and speech_service.is_ready():
+        try:
+            return _takecommand_streaming(r, runtime_lang)
+        except Exception as e:
+            print(f"Streaming recognition failed, falling back to phrase capture: {e}")
+
     with sr.Microphone() as source:
         print('listening....')
         try:
@@ -177,7 +174,7 @@ def takecommand():
         except:
             pass
         r.pause_threshold = 1
-        r.adjust_for_ambient_noise(source)
+        _calibrate_for_capture(r, source)
     # Use background listening so we can honor cancel requests
         audio = None
         audio_container = []
@@ -245,42 +242,14 @@ def takecommand():
 
         # Prefer local whisper model if available (multilingual, auto-detect)
         recognized_text = ""
-        try:
-            wav_bytes = audio.get_wav_data()
-        except Exception:
-            wav_bytes = None
 
-        # Determine runtime language preference (default from config)
-        try:
-            runtime_lang = current_speech_lang
-        except Exception:
-            runtime_lang = getattr(config_module, 'DEFAULT_SPEECH_LANG', 'en-IN')
-
-        if _whisper_available and wav_bytes:
-            # Lazily load model
+        if speech_service.is_available():
+            # The model is normally already warm (started at startup); otherwise this waits for it
             try:
-                global whisper_model
-                if 'whisper_model' not in globals() or whisper_model is None:
-                    # load a small model by default (device: cpu)
-                    whisper_model = WhisperModel('small', device='cpu')
-                # write wav to temp file
-                tmp = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                try:
-                    tmp.write(wav_bytes)
-                    tmp.flush()
-                    tmp_name = tmp.name
-                finally:
-                    tmp.close()
-
-                # Use 'auto' if runtime_lang is 'auto' or empty
-                wh_lang = 'auto' if not runtime_lang or str(runtime_lang).lower() in ('auto', 'detect') else runtime_lang
-                segments, info = whisper_model.transcribe(tmp_name, beam_size=5, language=wh_lang)
-                parts = [s.text for s in segments]
-                recognized_text = ' '.join(parts).strip()
-                try:
-                    os.unlink(tmp_name)
-                except Exception:
-                    pass
+                # Hand the captured frames to Whisper as an in-memory 16 kHz float32 buffer
+                samples = audio_to_float32(audio)
+                # 'auto'/empty lets Whisper detect the language; 'en-IN' is mapped to 'en'
+                recognized_text = speech_service.transcribe(samples, language=runtime_lang)
             except Exception as e:
                 print(f"Whisper transcription failed: {e}")
                 recognized_text = ""
@@ -301,7 +270,6 @@ def takecommand():
             eel.DisplayMessage(recognized_text)
         except:
             pass
-        time.sleep(2)
 
     except Exception as e:
         print(f"Error recognizing audio: {e}")
@@ -310,6 +278,73 @@ def takecommand():
     return recognized_text.lower()
 
 
+def _takecommand_streaming(r, runtime_lang):
+    """Listen with incremental Whisper decoding.
+
+    Partial hypotheses are shown in the UI while the user is speaking and the
+    final text is returned as soon as the trailing pause is detected.
+    """
+    global _cancel_listen_event
+
+    def _show_partial(text):
+        try:
+            eel.DisplayMessage(text)
+        except Exception:
+            pass
+
+    with sr.Microphone(sample_rate=16000) as source:
+        print('listening....')
+        try:
+            eel.DisplayMessage('listening....')
+        except:
+            pass
+        r.pause_threshold = 1
+        _calibrate_for_capture(r, source)
+
+        streamer = StreamingTranscriber(
+            lambda samples: speech_service.submit(samples, language=runtime_lang),
+            sample_rate=source.SAMPLE_RATE,
+            energy_threshold=r.energy_threshold,
+            pause_seconds=r.pause_threshold,
+            on_partial=_show_partial,
+        )
+        recognized_text = None
+        start_t = time.time()
+        while recognized_text is None:
+            if _cancel_listen_event.is_set():
+                _cancel_listen_event.clear()
+                try:
+                    eel.DisplayMessage('Listening cancelled')
+                except:
+                    pass
+                return ""
+            if not streamer.speaking and time.time() - start_t > 10:
+                print('Listening timed out while waiting for phrase to start')
+                try:
+                    eel.DisplayMessage('Listening timed out')
+                except:
+                    pass
+                return ""
+            chunk = source.stream.read(source.CHUNK)
+            recognized_text = streamer.feed(chunk)
+
+    # Whisper heard nothing useful: give the online recognizer the same utterance
+    if not recognized_text and streamer.last_utterance:
+        try:
+            audio = sr.AudioData(streamer.last_utterance, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+            recognized_text = r.recognize_google(audio, language=runtime_lang or 'en-IN')
+        except Exception as e:
+            print(f"Google recognizer failed or no speech: {e}")
+            recognized_text = ""
+
+    print(f'user said: {recognized_text}')
+    try:
+        eel.DisplayMessage(recognized_text)
+    except:
+        pass
+    return recognized_text.lower()
+
+
 # (runtime setter is defined earlier as set_speech_language)
 
 
@@ -371,7 +406,8 @@ def allCommands(message=1):
     if message == 1:
         try:
             # Use retrying voice capture to improve reliability when no speech is heard
-            query = takecommand_with_retries(max_retries=2)
+            with _capture_lock:
+                query = takecommand_with_retries(max_retries=2)
         except Exception as e:
             print(f"Error during takecommand: {e}")
             query = ""
@@ -506,14 +542,16 @@ def execute_single_command(query):
         if execute_complex_command(query):
             return  # Complex command handled
         
-        if "open" in query:
+        from engine.intent_router import classify
+        intent = classify(query, table='single_command')
+        if intent.name == 'open':
             from engine.features import openCommand
             openCommand(query)
-        elif "on youtube" in query:
+        elif intent.name == 'play_youtube':
             from engine.features import PlayYoutube
             PlayYoutube(query)
         
-        elif "send message" in query or "phone call" in query or "video call" in query:
+        elif intent.name == 'contact':
             from engine.features import findContact, whatsApp, makeCall, sendMessage
             contact_no, name = findContact(query)
             if(contact_no != 0):
@@ -522,22 +560,22 @@ def execute_single_command(query):
                 print(preferance)
 
                 if "mobile" in preferance:
-                    if "send message" in query or "send sms" in query: 
+                    if intent.has("send message", "send sms"):
                         speak("what message to send")
                         message = takecommand()
                         sendMessage(message, contact_no, name)
-                    elif "phone call" in query:
+                    elif intent.has("phone call"):
                         makeCall(name, contact_no)
                     else:
                         speak("please try again")
                 elif "whatsapp" in preferance:
                     message = ""
-                    if "send message" in query:
+                    if intent.has("send message"):
                         message = 'message'
                         speak("what message to send")
                         query = takecommand()
                                         
-                    elif "phone call" in query:
+                    elif intent.has("phone call"):
                         message = 'call'
                     else:
                         message = 'video call'
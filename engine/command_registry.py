@@ -0,0 +1,108 @@
+import threading
+
+
+def normalize_name(name):
+    """Registry key for an app/site name (case- and surrounding-space-insensitive)."""
+    return (name or '').strip().lower()
+
+
+def _load_from_db():
+    from engine.thread_safe_db import thread_safe_db
+    with thread_safe_db.get_connection() as cursor:
+        cursor.execute('SELECT name, path FROM sys_command')
+        system_rows = cursor.fetchall()
+        cursor.execute('SELECT name, url FROM web_command')
+        web_rows = cursor.fetchall()
+    return system_rows, web_rows
+
+
+class CommandRegistry:
+    """In-process copy of the sys_command and web_command tables.
+
+    Both tables are loaded once into dicts keyed by normalized name, so lookups
+    never touch SQLite. Writers keep it coherent by calling put_system() after an
+    insert or invalidate() after any other change; either bumps `version` and
+    notifies listeners registered with add_listener().
+    """
+
+    def __init__(self, loader=_load_from_db):
+        self._loader = loader
+        self._lock = threading.RLock()
+        # (system map, web map, system names, web names) or None until loaded
+        self._tables = None
+        self._listeners = []
+        self.version = 0
+
+    def _snapshot(self):
+        tables = self._tables
+        if tables is not None:
+            return tables
+        with self._lock:
+            if self._tables is not None:
+                return self._tables
+            system_rows, web_rows = self._loader()
+            system, web = {}, {}
+            system_names, web_names = [], []
+            # First row wins, matching the old `results[0]` of the SQL lookup
+            for name, path in system_rows:
+                if name:
+                    system_names.append(name)
+                    system.setdefault(normalize_name(name), path)
+            for name, url in web_rows:
+                if name:
+                    web_names.append(name)
+                    web.setdefault(normalize_name(name), url)
+            self._tables = (system, web, system_names, web_names)
+            return self._tables
+
+    def get_system(self, name):
+        """Return the saved executable path for an app name, or None."""
+        return self._snapshot()[0].get(normalize_name(name))
+
+    def get_web(self, name):
+        """Return the saved URL for a site name, or None."""
+        return self._snapshot()[1].get(normalize_name(name))
+
+    def has_system(self, name):
+        return normalize_name(name) in self._snapshot()[0]
+
+    def system_names(self):
+        return list(self._snapshot()[2])
+
+    def web_names(self):
+        return list(self._snapshot()[3])
+
+    def put_system(self, name, path):
+        """Record a sys_command row that was just inserted."""
+        with self._lock:
+            if self._tables is not None:
+                system, web, system_names, web_names = self._tables
+                system = dict(system)
+                system.setdefault(normalize_name(name), path)
+                self._tables = (system, web, system_names + [name], web_names)
+            self.version += 1
+        self._notify()
+
+    def invalidate(self):
+        """Drop the cached tables; they are reloaded on the next lookup."""
+        with self._lock:
+            self._tables = None
+            self.version += 1
+        self._notify()
+
+    def add_listener(self, callback):
+        """Call `callback(version)` whenever the registry changes."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _notify(self):
+        version = self.version
+        for callback in list(self._listeners):
+            try:
+                callback(version)
+            except Exception as e:
+                print(f"CommandRegistry listener failed: {e}")
+
+
+# Global registry instance
+command_registry = CommandRegistry()
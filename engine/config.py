@@ -7,6 +7,12 @@ LLM_KEY = ""  # Google Gemini AI API key
 # Examples: 'en-US', 'en-GB', 'hi-IN', 'te-IN', 'es-ES', 'fr-FR'
 DEFAULT_SPEECH_LANG = os.getenv('JARVIS_SPEECH_LANG', 'en-IN')
 
+# Offline Whisper (faster-whisper) model used by the speech service
+WHISPER_MODEL_SIZE = os.getenv('JARVIS_WHISPER_MODEL', 'small')
+WHISPER_DEVICE = os.getenv('JARVIS_WHISPER_DEVICE', 'cpu')
+# Decode while the user is speaking (partial results in the UI, final text on end of speech)
+STREAMING_ASR = os.getenv('JARVIS_STREAMING_ASR', '1') != '0'
+
 # You can get a free API key from: https://makersuite.google.com/app/apikey
 # For now, we'll use a placeholder that won't cause errors
 if not LLM_KEY:
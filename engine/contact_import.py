@@ -0,0 +1,219 @@
+import argparse
+import csv
+import os
+import re
+import time
+
+from engine.thread_safe_db import DB_PATH
+
+DEFAULT_COUNTRY_CODE = '+91'
+
+CREATE_CONTACTS = ('CREATE TABLE IF NOT EXISTS contacts (id integer primary key, name VARCHAR(200), '
+                   'mobile_no VARCHAR(255), email VARCHAR(255) NULL, address VARCHAR(255) NULL)')
+
+# Header names used by Google, Outlook and phone exports, checked in order
+NAME_COLUMNS = ('name', 'full name', 'display name', 'given name', 'first name')
+PHONE_COLUMNS = ('mobile_no', 'mobile', 'mobile phone', 'phone', 'phone 1 - value', 'primary phone',
+                 'home phone', 'business phone', 'phone number')
+EMAIL_COLUMNS = ('email', 'e-mail address', 'e-mail 1 - value', 'email address')
+ADDRESS_COLUMNS = ('address', 'city', 'address 1 - formatted', 'home address', 'home city')
+
+
+def normalize_phone(raw, country_code=DEFAULT_COUNTRY_CODE):
+    """Return the number in +<country><number> form, or '' if it doesn't look like a phone number.
+
+    Local 10-digit numbers (and 0-prefixed trunk numbers) get `country_code`,
+    '00' international prefixes become '+', separators are dropped.
+    """
+    raw = (raw or '').strip()
+    digits = re.sub(r'\D', '', raw)
+    if len(digits) < 7:
+        return ''
+    if raw.startswith('+'):
+        return '+' + digits
+    if digits.startswith('00'):
+        return '+' + digits[2:]
+    code = country_code.lstrip('+')
+    if len(digits) == 11 and digits.startswith('0'):
+        digits = digits[1:]
+    if len(digits) == 10:
+        return '+' + code + digits
+    if digits.startswith(code) and len(digits) == len(code) + 10:
+        return '+' + digits
+    return '+' + code + digits
+
+
+def _pick_column(fieldnames, wanted, candidates):
+    if wanted is not None:
+        if isinstance(wanted, int) or (isinstance(wanted, str) and wanted.isdigit()):
+            return fieldnames[int(wanted)]
+        return wanted
+    lowered = {name.strip().lower(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    return None
+
+
+def iter_csv(path, name_column=None, phone_column=None, email_column=None, address_column=None):
+    """Yield (name, phone, email, address) from a CSV export with a header row.
+
+    Columns are found by their usual header names unless given explicitly
+    (by header or 0-based index).
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        name_col = _pick_column(header, name_column, NAME_COLUMNS)
+        phone_col = _pick_column(header, phone_column, PHONE_COLUMNS)
+        if name_col is None or phone_col is None:
+            raise ValueError(f"{path}: could not find name/phone columns in {header}")
+        email_col = _pick_column(header, email_column, EMAIL_COLUMNS)
+        address_col = _pick_column(header, address_column, ADDRESS_COLUMNS)
+        positions = [header.index(c) if c in header else None for c in (name_col, phone_col, email_col, address_col)]
+        if positions[0] is None or positions[1] is None:
+            raise ValueError(f"{path}: no column named {name_col if positions[0] is None else phone_col}")
+        for row in reader:
+            values = [row[i].strip() if i is not None and i < len(row) else '' for i in positions]
+            # exports often hold several numbers as "a ::: b"; the first one is the primary
+            values[1] = values[1].split(':::')[0]
+            yield tuple(values)
+
+
+def _vcard_lines(f):
+    # unfold continuation lines (RFC 6350: a line starting with a space or tab continues the previous one)
+    pending = None
+    for line in f:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+
+def iter_vcard(path):
+    """Yield (name, phone, email, address) for each card in a .vcf file, preferring mobile numbers."""
+    card = None
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for line in _vcard_lines(f):
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            prop, _, params = key.partition(';')
+            prop = prop.upper().split('.')[-1]
+            if prop == 'BEGIN' and value.strip().upper() == 'VCARD':
+                card = {'FN': '', 'N': '', 'TEL': [], 'EMAIL': '', 'ADR': ''}
+            elif card is None:
+                continue
+            elif prop == 'END':
+                name = card['FN'] or ' '.join(p for p in reversed(card['N'].split(';')[:2]) if p)
+                phones = sorted(card['TEL'], key=lambda t: not t[0])
+                yield name.strip(), phones[0][1] if phones else '', card['EMAIL'], card['ADR']
+                card = None
+            elif prop == 'TEL':
+                card['TEL'].append(('CELL' in params.upper(), value.strip()))
+            elif prop in ('FN', 'N') or (prop in ('EMAIL', 'ADR') and not card[prop]):
+                value = value.strip()
+                if prop == 'ADR':
+                    value = ', '.join(p for p in value.split(';') if p)
+                card[prop] = value
+
+
+def iter_contacts(path, **columns):
+    """Stream contacts from a .vcf/.vcard or CSV file."""
+    if os.path.splitext(path)[1].lower() in ('.vcf', '.vcard'):
+        return iter_vcard(path)
+    return iter_csv(path, **columns)
+
+
+def _contacts_repository(db_path):
+    """(repository, writer, own pool) for `db_path`; the app's shared ones for jarvis.db."""
+    from engine.db_writer import DBWriter, db_writer
+    from engine.repositories import ContactRepository, contacts
+    from engine.thread_safe_db import ConnectionPool
+    if os.path.abspath(db_path) == os.path.abspath(DB_PATH):
+        return contacts, db_writer, None
+    pool = ConnectionPool(db_path, max_size=2)
+    writer = DBWriter(pool)
+    return ContactRepository(pool, writer), writer, pool
+
+
+def import_contacts(records, db_path=DB_PATH, country_code=DEFAULT_COUNTRY_CODE, dedupe=True):
+    """Insert (name, phone, email, address) records into the contacts table in one transaction.
+
+    Phone numbers are normalized; rows without a usable name or number are
+    skipped, and with `dedupe` numbers already in the table (or seen earlier
+    in the input) are too. Parsing runs on the calling thread; the insert is
+    a single ContactRepository.add_many() on the database writer thread, so
+    other writers queue behind it instead of hitting "database is locked".
+    Returns counts and the import rate.
+    """
+    report = {'read': 0, 'inserted': 0, 'duplicates': 0, 'invalid': 0}
+    t0 = time.perf_counter()
+    repo, writer, own_pool = _contacts_repository(db_path)
+    try:
+        writer.execute(CREATE_CONTACTS).result()
+        seen = set()
+        if dedupe:
+            for contact in repo.all():
+                phone = normalize_phone(str(contact.mobile_no or ''), country_code)
+                if phone:
+                    seen.add(phone)
+
+        rows = []
+        for name, phone, email, address in records:
+            report['read'] += 1
+            phone = normalize_phone(phone, country_code)
+            if not name or not phone:
+                report['invalid'] += 1
+                continue
+            if dedupe:
+                if phone in seen:
+                    report['duplicates'] += 1
+                    continue
+                seen.add(phone)
+            rows.append((name, phone, email or None, address or None))
+
+        # add_many also refreshes the contact index and the settings change log
+        report['inserted'] = repo.add_many(rows).result() if rows else 0
+    finally:
+        if own_pool is not None:
+            writer.shutdown()
+            own_pool.close_all()
+    seconds = time.perf_counter() - t0
+    report['seconds'] = round(seconds, 3)
+    report['rows_per_sec'] = round(report['read'] / seconds) if seconds > 0 else None
+    return report
+
+
+def import_file(path, db_path=DB_PATH, country_code=DEFAULT_COUNTRY_CODE, dedupe=True, **columns):
+    """Stream a CSV/vCard file into the contacts table (see import_contacts)."""
+    return import_contacts(iter_contacts(path, **columns), db_path, country_code, dedupe)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bulk-import contacts from CSV or vCard files into jarvis.db')
+    parser.add_argument('files', nargs='+', help='.csv, .vcf or .vcard files')
+    parser.add_argument('--db', default=DB_PATH, help='database path (default: %(default)s)')
+    parser.add_argument('--country-code', default=DEFAULT_COUNTRY_CODE, help='prefix for local numbers (default: %(default)s)')
+    parser.add_argument('--name-column', help='CSV column (header or 0-based index) holding the name')
+    parser.add_argument('--phone-column', help='CSV column (header or 0-based index) holding the number')
+    parser.add_argument('--no-dedupe', action='store_true', help='insert numbers that already exist')
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        report = import_file(path, args.db, args.country_code, not args.no_dedupe,
+                             name_column=args.name_column, phone_column=args.phone_column)
+        print(f"{path}: {report['inserted']} inserted, {report['duplicates']} duplicates, "
+              f"{report['invalid']} skipped of {report['read']} rows in {report['seconds']}s "
+              f"({report['rows_per_sec']} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+import collections
+import re
+import threading
+from difflib import SequenceMatcher
+
+ContactMatch = collections.namedtuple('ContactMatch', 'id name mobile_no score kind')
+
+# Score for each kind of match (token matches are scaled by how many query words matched)
+EXACT, PREFIX, TOKEN, FUZZY, CONTAINS = 1.0, 0.9, 0.8, 0.6, 0.3
+
+_SOUNDEX_CODES = {}
+for _letters, _digit in (('bfpv', '1'), ('cgjkqsxz', '2'), ('dt', '3'), ('l', '4'), ('mn', '5'), ('r', '6')):
+    for _ch in _letters:
+        _SOUNDEX_CODES[_ch] = _digit
+
+
+def normalize_contact_name(name):
+    """Lowercase and collapse everything that isn't a letter or digit to single spaces."""
+    return ' '.join(re.findall(r'[^\W_]+', (name or '').lower()))
+
+
+def soundex(word):
+    """American Soundex code ('R163' for 'Rupert'); '' for words without letters."""
+    letters = [ch for ch in word.lower() if ch.isalpha() and ch.isascii()]
+    if not letters:
+        return ''
+    code = letters[0].upper()
+    last = _SOUNDEX_CODES.get(letters[0], '')
+    for ch in letters[1:]:
+        digit = _SOUNDEX_CODES.get(ch, '')
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if ch not in 'hw':
+            last = digit
+    return code.ljust(4, '0')
+
+
+class _Trie:
+    """Prefix trie whose nodes keep the ids of every key passing through them."""
+
+    def __init__(self):
+        self.root = {'ids': set()}
+
+    def add(self, key, contact_id):
+        node = self.root
+        node['ids'].add(contact_id)
+        for ch in key:
+            node = node.setdefault(ch, {'ids': set()})
+            node['ids'].add(contact_id)
+
+    def remove(self, key, contact_id):
+        node = self.root
+        node['ids'].discard(contact_id)
+        for ch in key:
+            child = node.get(ch)
+            if child is None:
+                return
+            child['ids'].discard(contact_id)
+            if not child['ids']:
+                del node[ch]
+                return
+            node = child
+
+    def prefixed(self, prefix):
+        """Ids of keys starting with `prefix`."""
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return set()
+        return node['ids']
+
+
+def _load_from_db():
+    from engine.thread_safe_db import thread_safe_db
+    with thread_safe_db.get_connection() as cursor:
+        cursor.execute('SELECT id, name, mobile_no FROM contacts')
+        return cursor.fetchall()
+
+
+class ContactIndex:
+    """In-memory search index over the contacts table.
+
+    Names are indexed three ways: a trie of whole normalized names (name
+    prefixes), a token map plus token trie (any word of the name, or its
+    prefix) and Soundex keys (misheard spellings). search() only scores the
+    candidates these return, ranked exact > name prefix > token > fuzzy;
+    a substring scan is used as the last resort, like the old LIKE query.
+    The table is loaded on first use; add()/remove() keep it current after
+    inserts and deletes, invalidate() reloads it.
+    """
+
+    def __init__(self, loader=_load_from_db):
+        self._loader = loader
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._contacts = {}
+        self._names = _Trie()
+        self._token_trie = _Trie()
+        self._tokens = {}
+        self._phonetic = {}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._reset()
+            for contact_id, name, mobile_no in self._loader():
+                self._add(contact_id, name, mobile_no)
+            self._loaded = True
+
+    def _add(self, contact_id, name, mobile_no):
+        norm = normalize_contact_name(name)
+        if not norm:
+            return
+        tokens = norm.split()
+        self._contacts[contact_id] = (name, mobile_no, norm, tokens)
+        self._names.add(norm, contact_id)
+        for token in set(tokens):
+            self._token_trie.add(token, contact_id)
+            self._tokens.setdefault(token, set()).add(contact_id)
+            code = soundex(token)
+            if code:
+                self._phonetic.setdefault(code, set()).add(contact_id)
+
+    def _remove(self, contact_id):
+        entry = self._contacts.pop(contact_id, None)
+        if entry is None:
+            return
+        norm, tokens = entry[2], entry[3]
+        self._names.remove(norm, contact_id)
+        for token in set(tokens):
+            self._token_trie.remove(token, contact_id)
+            for index, key in ((self._tokens, token), (self._phonetic, soundex(token))):
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(contact_id)
+                    if not ids:
+                        del index[key]
+
+    def add(self, contact_id, name, mobile_no):
+        """Record a contacts row that was just inserted (or updated)."""
+        with self._lock:
+            if self._loaded:
+                self._remove(contact_id)
+                self._add(contact_id, name, mobile_no)
+
+    def remove(self, contact_id):
+        """Forget a contacts row that was just deleted."""
+        with self._lock:
+            if self._loaded:
+                # ids arrive as strings from the UI
+                if isinstance(contact_id, str) and contact_id.isdigit():
+                    contact_id = int(contact_id)
+                self._remove(contact_id)
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt from the table on the next search."""
+        with self._lock:
+            self._loaded = False
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._contacts)
+
+    def _token_score(self, query_tokens, tokens):
+        total = 0.0
+        for q in query_tokens:
+            best = 0.0
+            q_code = soundex(q)
+            for token in tokens:
+                if token == q:
+                    best = 1.0
+                    break
+                if len(q) >= 2 and token.startswith(q):
+                    best = max(best, 0.85)
+                elif q_code and soundex(token) == q_code:
+                    ratio = SequenceMatcher(None, q, token).ratio()
+                    if ratio >= 0.5:
+                        best = max(best, 0.75 * ratio)
+            total += best
+        return total / len(query_tokens)
+
+    def search(self, query, limit=5, fuzzy=True):
+        """Return up to `limit` ContactMatch tuples, best first.
+
+        With fuzzy=False, Soundex-only matches are left out (and no longer
+        stop the substring fallback), for callers that act on the result.
+        """
+        q = normalize_contact_name(query)
+        if not q:
+            return []
+        self._ensure_loaded()
+        with self._lock:
+            contacts = self._contacts
+            scored = {}
+
+            def _keep(contact_id, score, kind):
+                if score > scored.get(contact_id, (0.0, ''))[0]:
+                    scored[contact_id] = (score, kind)
+
+            for contact_id in self._names.prefixed(q):
+                if contacts[contact_id][2] == q:
+                    _keep(contact_id, EXACT, 'exact')
+                else:
+                    _keep(contact_id, PREFIX, 'prefix')
+
+            query_tokens = q.split()
+            candidates = set()
+            for token in query_tokens:
+                if len(token) >= 2:
+                    candidates |= self._token_trie.prefixed(token)
+                else:
+                    candidates |= self._tokens.get(token, set())
+                code = soundex(token)
+                if code:
+                    candidates |= self._phonetic.get(code, set())
+            for contact_id in candidates:
+                score = self._token_score(query_tokens, contacts[contact_id][3])
+                if score >= 0.85:
+                    _keep(contact_id, TOKEN * score, 'token')
+                elif score > 0 and fuzzy:
+                    _keep(contact_id, FUZZY * score, 'fuzzy')
+
+            if not scored:
+                for contact_id, entry in contacts.items():
+                    if q in entry[2]:
+                        _keep(contact_id, CONTAINS, 'contains')
+
+            ranked = sorted(scored.items(), key=lambda item: (-item[1][0], len(contacts[item[0]][2]), str(item[0])))
+            return [ContactMatch(contact_id, contacts[contact_id][0], contacts[contact_id][1], round(score, 3), kind)
+                    for contact_id, (score, kind) in ranked[:limit]]
+
+    def best(self, query, fuzzy=True):
+        """Highest-ranked match for `query`, or None (see search() for `fuzzy`)."""
+        matches = self.search(query, limit=1, fuzzy=fuzzy)
+        return matches[0] if matches else None
+
+
+# Global contact index (loaded from jarvis.db on first search)
+contact_index = ContactIndex()
@@ -29,20 +29,8 @@ cursor = con.cursor()
 # cursor.execute('''CREATE TABLE IF NOT EXISTS contacts (id integer primary key, name VARCHAR(200), mobile_no VARCHAR(255), email VARCHAR(255) NULL, address VARCHAR(255) NULL)''')
 
 
-# Specify the column indices you want to import (0-based index)
-# Example: Importing the 1st and 3rd columns
-# desired_columns_indices = [0, 30]
-
-# # Read data from CSV and insert into SQLite table for the desired columns
-# with open('contacts.csv', 'r', encoding='utf-8') as csvfile:
-#     csvreader = csv.reader(csvfile)
-#     for row in csvreader:
-#         selected_data = [row[i] for i in desired_columns_indices]
-#         cursor.execute(''' INSERT INTO contacts (id, 'name', 'mobile_no') VALUES (null, ?, ?);''', tuple(selected_data))
-
-# # Commit changes and close connection
-# con.commit()
-# con.close()
+# Bulk-import contacts from a CSV/vCard export (one transaction, normalized and deduplicated numbers):
+#   python -m engine.contact_import contacts.csv
 
 # query = "INSERT INTO contacts VALUES (null,'pawan', '1234567890', 'null')"
 # cursor.execute(query)
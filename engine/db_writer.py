@@ -0,0 +1,160 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+from engine.thread_safe_db import pooled_cursor
+
+
+class _Write:
+    __slots__ = ('op', 'args', 'on_commit', 'future', 'queued_at')
+
+    def __init__(self, op, args, on_commit):
+        self.op = op
+        self.args = args
+        self.on_commit = on_commit
+        self.future = Future()
+        self.queued_at = time.perf_counter()
+
+
+class DBWriter:
+    """Single thread that performs every write to jarvis.db.
+
+    submit(op, *args) queues `op(cursor, *args)` and returns a Future for its
+    return value. The worker drains whatever is queued (up to `max_batch`)
+    and runs it as one transaction, each op inside its own savepoint so a
+    failing op only fails its own future. `on_commit(result)` callbacks run
+    after the commit, before the future resolves, so caches updated there
+    are current by the time a caller sees the result. Callers that don't
+    need the result never wait on the disk. flush() waits for everything
+    queued so far; shutdown() is registered with atexit so writes still
+    queued when the process exits are committed, not dropped with the
+    daemon thread.
+    """
+
+    def __init__(self, pool=None, max_batch=64):
+        self._pool = pool
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {'ops': 0, 'failed': 0, 'transactions': 0, 'max_group': 0, 'last_wait_ms': None}
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+                self._thread.start()
+                # the thread is a daemon; don't lose queued writes when the process exits
+                atexit.register(self.shutdown)
+
+    def submit(self, op, *args, on_commit=None):
+        """Queue `op(cursor, *args)`; returns a Future resolved after the commit."""
+        write = _Write(op, args, on_commit)
+        self._ensure_started()
+        self._queue.put(write)
+        return write.future
+
+    def execute(self, sql, params=(), on_commit=None):
+        """Queue a single statement; the future's result is the cursor's lastrowid."""
+        def _op(cursor):
+            cursor.execute(sql, params)
+            return cursor.lastrowid
+        return self.submit(_op, on_commit=on_commit)
+
+    def executemany(self, sql, rows, on_commit=None):
+        """Queue a batch statement; the future's result is the number of rows."""
+        rows = list(rows)
+
+        def _op(cursor):
+            cursor.executemany(sql, rows)
+            return len(rows)
+        return self.submit(_op, on_commit=on_commit)
+
+    def call(self, fn, *args):
+        """Queue a non-SQL side effect (e.g. saving a file) to run in order with the writes."""
+        return self.submit(lambda cursor: fn(*args))
+
+    def flush(self, timeout=None):
+        """Block until every write queued before this call is committed; False on timeout."""
+        try:
+            return self.submit(lambda cursor: None).exception(timeout) is None
+        except TimeoutError:
+            return False
+
+    def shutdown(self, timeout=10.0):
+        """Commit everything still queued (registered with atexit on the first write)."""
+        if self._thread is None:
+            return True
+        pending = self._queue.qsize()
+        done = self.flush(timeout)
+        if not done:
+            print(f"DBWriter: {pending} queued writes not committed within {timeout}s at shutdown")
+        return done
+
+    def _get_pool(self):
+        if self._pool is None:
+            from engine.thread_safe_db import thread_safe_db
+            self._pool = thread_safe_db.pool
+        return self._pool
+
+    def _run(self):
+        while True:
+            group = [self._queue.get()]
+            while len(group) < self.max_batch:
+                try:
+                    group.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_group(group)
+
+    def _write_group(self, group):
+        outcomes = []
+        started = time.perf_counter()
+        try:
+            with pooled_cursor(self._get_pool()) as cursor:
+                # explicit BEGIN: releasing the outermost savepoint would otherwise commit each op
+                cursor.execute('BEGIN')
+                for write in group:
+                    cursor.execute('SAVEPOINT db_writer_op')
+                    try:
+                        outcomes.append((True, write.op(cursor, *write.args)))
+                        cursor.execute('RELEASE db_writer_op')
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO db_writer_op')
+                        cursor.execute('RELEASE db_writer_op')
+                        outcomes.append((False, e))
+        except Exception as e:
+            print(f"DBWriter: transaction of {len(group)} writes failed: {e}")
+            outcomes = [(False, e)] * len(group)
+
+        with self._lock:
+            self._stats['transactions'] += 1
+            self._stats['ops'] += len(group)
+            self._stats['failed'] += sum(1 for ok, _ in outcomes if not ok)
+            self._stats['max_group'] = max(self._stats['max_group'], len(group))
+            self._stats['last_wait_ms'] = round((started - group[0].queued_at) * 1000.0, 2)
+
+        for write, (ok, value) in zip(group, outcomes):
+            if not ok:
+                write.future.set_exception(value)
+                continue
+            if write.on_commit is not None:
+                try:
+                    write.on_commit(value)
+                except Exception as e:
+                    print(f"DBWriter: on_commit callback failed: {e}")
+            write.future.set_result(value)
+
+    def stats(self):
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot['queued'] = self._queue.qsize()
+        return snapshot
+
+
+# Global writer for jarvis.db (started on the first write)
+db_writer = DBWriter()
@@ -1,6 +1,8 @@
 import re
 import os
 import json
+from engine.cache import LRUCache
+from engine.fuzzy_index import AppNameIndex
 
 class EnhancedCommandParser:
     def __init__(self):
@@ -22,22 +24,58 @@ class EnhancedCommandParser:
             'and', 'also', 'then', 'after that', 'next', '&', ';', ',',
             'while', 'during', 'at the same time', 'simultaneously'
         ]
+        # memoized results for repeated utterances, keyed on _cache_version()
+        self._synonyms_version = 0
+        self._normalize_cache = LRUCache(maxsize=512)
+        self._extract_cache = LRUCache(maxsize=256)
+        # fuzzy app-name index, built on first use (see _get_app_index)
+        self._app_index = None
+        self._app_index_version = None
         # load persisted synonyms (user-trained corrections)
         try:
             self.synonyms = self._load_synonyms()
         except Exception:
             self.synonyms = {}
     
+    def _cache_version(self):
+        """Version of everything a cached result depends on (synonyms + command registry)."""
+        try:
+            from engine.command_registry import command_registry
+            registry_version = command_registry.version
+        except Exception:
+            registry_version = None
+        return (self._synonyms_version, registry_version)
+
+    def cache_stats(self):
+        """Hit/miss counters of the normalization and parse caches."""
+        return {
+            'normalize': self._normalize_cache.stats(),
+            'extract': self._extract_cache.stats(),
+        }
+
+    def clear_caches(self):
+        self._normalize_cache.clear()
+        self._extract_cache.clear()
+
     def extract_commands(self, query):
         """Extract individual commands from a complex query"""
-        commands = []
-
         # Normalize query first (apply trained corrections)
         try:
             normalized_query = self.normalize_query(query)
         except Exception:
             normalized_query = query
 
+        key = (normalized_query, self._cache_version())
+        cached = self._extract_cache.get(key)
+        if cached is None:
+            cached = self._extract_commands(normalized_query)
+            self._extract_cache.put(key, cached)
+        # hand out copies so callers can't mutate the cached entries
+        return [dict(c) for c in cached]
+
+    def _extract_commands(self, normalized_query):
+        commands = []
+
         # Split by multitask indicators
         parts = self._split_by_multitask_indicators(normalized_query)
         
@@ -91,10 +129,10 @@ class EnhancedCommandParser:
             pass
         return {}
 
-    def _save_synonyms(self):
+    def _save_synonyms(self, synonyms=None, path=None):
         try:
-            with open(self.SYNONYMS_PATH, "w", encoding="utf-8") as f:
-                json.dump(self.synonyms, f, ensure_ascii=False, indent=2)
+            with open(path or self.SYNONYMS_PATH, "w", encoding="utf-8") as f:
+                json.dump(self.synonyms if synonyms is None else synonyms, f, ensure_ascii=False, indent=2)
         except Exception:
             pass
 
@@ -107,13 +145,48 @@ class EnhancedCommandParser:
         if not w or not c:
             return False
         self.synonyms[w] = c
-        self._save_synonyms()
+        self._synonyms_version += 1
+        self.clear_caches()
+        # saved on the database writer thread (in order with other writes) so the caller doesn't wait on the disk
+        from engine.db_writer import db_writer
+        db_writer.call(self._save_synonyms, dict(self.synonyms), self.SYNONYMS_PATH)
         return True
 
+    # curated app names, always fuzzy-matched in addition to the DB-backed ones
+    COMMON_APPS = ['youtube', 'brave', 'chrome', 'edge', 'firefox', 'notepad', 'calculator', 'whatsapp', 'spotify', 'vscode', 'pycharm']
+
+    def _get_app_index(self):
+        """Return the fuzzy app-name index, rebuilding it when the command registry changed."""
+        from engine.command_registry import command_registry
+        version = command_registry.version
+        if self._app_index is not None and self._app_index_version == version:
+            return self._app_index
+        try:
+            db_names = command_registry.system_names() + command_registry.web_names()
+        except Exception:
+            db_names = []
+        # merge and dedupe
+        candidate_apps = list(dict.fromkeys(self.COMMON_APPS + [n.lower() for n in db_names if isinstance(n, str)]))
+        self._app_index = AppNameIndex(candidate_apps, cutoff=0.78)
+        self._app_index_version = version
+        return self._app_index
+
+    def warm(self):
+        """Load the command tables and build the fuzzy app index now; returns the number of indexed names."""
+        return self._get_app_index().size
+
     def normalize_query(self, query: str) -> str:
         """Apply known corrections to the query. Replaces standalone tokens that match keys in synonyms."""
         if not query:
             return query
+        key = (query, self._cache_version())
+        normalized = self._normalize_cache.get(key)
+        if normalized is None:
+            normalized = self._normalize_query(query)
+            self._normalize_cache.put(key, normalized)
+        return normalized
+
+    def _normalize_query(self, query):
         # Don't normalize text that is part of a body after write/type/translate
         # Find position of writing verbs and split the query into (pre, post)
         lower_q = query.lower()
@@ -123,21 +196,7 @@ class EnhancedCommandParser:
             post_start = split_match.end()
 
         tokens = re.findall(r"\w+|\W+", query)
-        # curated and DB-backed app list
-        common_apps = ['youtube', 'brave', 'chrome', 'edge', 'firefox', 'notepad', 'calculator', 'whatsapp', 'spotify', 'vscode', 'pycharm']
-        try:
-            from engine.thread_safe_db import get_all_system_names, get_all_web_names
-            db_names = []
-            try:
-                db_names = get_all_system_names() + get_all_web_names()
-            except Exception:
-                db_names = []
-            # merge and dedupe
-            candidate_apps = list(dict.fromkeys(common_apps + [n.lower() for n in db_names if isinstance(n, str)]))
-        except Exception:
-            candidate_apps = common_apps
-
-        import difflib
+        app_index = self._get_app_index()
 
         # For each token, only normalize if it's before the 'post_start' index (i.e., not in body text)
         idx = 0
@@ -162,9 +221,9 @@ class EnhancedCommandParser:
 
             # fuzzy-match against candidate apps with a high cutoff
             try:
-                matches = difflib.get_close_matches(key, candidate_apps, n=1, cutoff=0.78)
-                if matches:
-                    tokens[i] = matches[0]
+                match = app_index.best_match(key)
+                if match:
+                    tokens[i] = match
             except Exception:
                 pass
 
@@ -246,42 +305,35 @@ class EnhancedCommandParser:
     
     def suggest_parallel_execution(self, commands):
         """Suggest which commands can be executed in parallel (optimized for 4-5 tasks)"""
-        parallel_groups = []
-        sequential_commands = []
-        
-        for command in commands:
-            command_type = command.get('type', 'general')
-            command_text = (command.get('query') or command.get('original') or '').lower()
-            
-            # Commands that can run in parallel
-            if command_type in ['open', 'youtube', 'search', 'weather', 'time', 'date', 'calculate']:
-                parallel_groups.append(command)
-            # Telegram/WhatsApp messaging can run in parallel (uses API/desktop automation)
-            elif 'telegram' in command_text or 'whatsapp' in command_text:
-                if 'send' in command_text or 'message' in command_text:
-                    parallel_groups.append(command)  # Telegram/WhatsApp messaging can be parallel
-                else:
-                    parallel_groups.append(command)
-            # Traditional calls/messages that need user interaction should be sequential
-            elif command_type in ['call']:
-                sequential_commands.append(command)
-            # Traditional SMS messages might need user interaction
-            elif command_type in ['message']:
-                # Check if it's a simple message command without user prompts
-                if 'send message' in command_text and not ('which mode' in command_text or 'whatsapp or mobile' in command_text):
-                    parallel_groups.append(command)  # Can run in parallel if no user interaction needed
-                else:
-                    sequential_commands.append(command)
-            elif command_type in ['note', 'reminder']:
-                sequential_commands.append(command)
-            else:
-                # Default to parallel for unknown types
-                parallel_groups.append(command)
-        
+        flags = [self._is_parallel(c) for c in commands]
+
         return {
-            'parallel': parallel_groups,
-            'sequential': sequential_commands
+            'parallel': [c for c, par in zip(commands, flags) if par],
+            'sequential': [c for c, par in zip(commands, flags) if not par]
         }
 
+    def _is_parallel(self, command):
+        """True if the command can run in the parallel group, False if it must run sequentially"""
+        command_type = command.get('type', 'general')
+        command_text = (command.get('query') or command.get('original') or '').lower()
+
+        # Commands that can run in parallel
+        if command_type in ['open', 'youtube', 'search', 'weather', 'time', 'date', 'calculate']:
+            return True
+        # Telegram/WhatsApp messaging can run in parallel (uses API/desktop automation)
+        if 'telegram' in command_text or 'whatsapp' in command_text:
+            return True
+        # Traditional calls/messages that need user interaction should be sequential
+        if command_type in ['call']:
+            return False
+        # Traditional SMS messages might need user interaction
+        if command_type in ['message']:
+            # Can run in parallel if it's a simple message command without user prompts
+            return 'send message' in command_text and not ('which mode' in command_text or 'whatsapp or mobile' in command_text)
+        if command_type in ['note', 'reminder']:
+            return False
+        # Default to parallel for unknown types
+        return True
+
 # Global parser instance
 enhanced_parser = EnhancedCommandParser()
@@ -2,8 +2,6 @@ import json
 import os
 from pipes import quote
 import re
-import sqlite3
-import struct
 import subprocess
 import time
 import webbrowser
@@ -52,22 +50,23 @@ except Exception:
             return _noop
 
     eel = _EelStub()
-import pyaudio
-import pyautogui
+from engine.lazy_imports import lazy_import
 from engine.command import speak
-from engine.config import ASSISTANT_NAME, LLM_KEY
+from engine.config import ASSISTANT_NAME
 # Playing assiatnt sound function
-import pywhatkit as kit
-import pvporcupine
-import requests
 from urllib.parse import quote_plus
 
 from engine.helper import extract_yt_term, markdown_to_text, remove_words
-from hugchat import hugchat
-import pyperclip
+from engine.intent_router import classify
+from engine.repositories import contacts, personal_info, sys_commands, web_commands
+from engine.table_pages import fetch_changes, fetch_page
 
-con = sqlite3.connect("jarvis.db")
-cursor = con.cursor()
+# Heavy third-party modules are imported on first use (see engine.lazy_imports)
+pyautogui = lazy_import('pyautogui')
+kit = lazy_import('pywhatkit')
+pvporcupine = lazy_import('pvporcupine')
+hugchat = lazy_import('hugchat.hugchat')
+pyperclip = lazy_import('pyperclip')
 
 
 def safe_speak(text):
@@ -134,10 +133,11 @@ def openCommand(query):
 
     # Preserve original query for complex-command detection
     orig_query = query
+    intent = classify(orig_query)
 
     # If the user simply said 'play <term>' (no explicit app), assume YouTube for short/music queries
     try:
-        if re.search(r"\bplay\b", (orig_query or ''), flags=re.IGNORECASE):
+        if intent.has_word('play'):
             # Determine if it's a likely music/video request
             rest = re.sub(r"^.*?\bplay\b", '', orig_query, flags=re.IGNORECASE).strip()
             words_after = len(rest.split()) if rest else 0
@@ -169,7 +169,7 @@ def openCommand(query):
         # If this utterance contains messaging intents (send/message/dm) and mentions a platform
         # (whatsapp/telegram/instagram), forward to the complex command handler which can extract
         # platform, contact name and message and perform the send.
-        if re.search(r"\b(type|write|translate)\b", (orig_query or ""), flags=re.IGNORECASE):
+        if intent.has_word('type', 'write', 'translate'):
             try:
                 # execute_complex_command expects the full textual command, so pass the original
                 from engine.features import execute_complex_command
@@ -181,8 +181,8 @@ def openCommand(query):
                 pass
 
         # Detect messaging intents explicitly and forward them to the complex command handler
-        if re.search(r"\b(send|message|dm|text|chat)\b", (orig_query or ""), flags=re.IGNORECASE) and \
-           re.search(r"\b(whatsapp|telegram|instagram|insta)\b", (orig_query or ""), flags=re.IGNORECASE):
+        if intent.has_word('send', 'message', 'dm', 'text', 'chat') and \
+           intent.has_word('whatsapp', 'telegram', 'instagram', 'insta'):
             try:
                 from engine.features import execute_complex_command
                 handled = execute_complex_command(orig_query)
@@ -409,9 +409,15 @@ def openCommand(query):
             # Persist this mapping for next time
             try:
                 from engine.thread_safe_db import save_system_command
-                saved = save_system_command(app_name, exe_name)
-                if saved:
-                    print(f"Saved sys_command: {app_name} -> {exe_name}")
+                pending = save_system_command(app_name, exe_name)
+                if pending is not None:
+                    # the insert is committed by the writer thread; report the real outcome from there
+                    def _report_saved(future, app_name=app_name, exe_name=exe_name):
+                        if future.exception() is not None:
+                            print(f"Could not save sys_command {app_name}: {future.exception()}")
+                        elif future.result() is not None:
+                            print(f"Saved sys_command: {app_name} -> {exe_name}")
+                    pending.add_done_callback(_report_saved)
             except Exception:
                 pass
             method_used = 'exe'
@@ -623,124 +629,21 @@ def PlayYoutube(query, show_modal=False):
             speak('Cancelled')
             return False
 
-        # Try to deterministically find the top video URL from YouTube search page
-        def _get_candidate_video_ids(term, max_candidates=6):
-            try:
-                search_url = f"https://www.youtube.com/results?search_query={quote_plus(term)}"
-                headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-                resp = requests.get(search_url, headers=headers, timeout=8)
-                text = resp.text
-                ids = []
-                # Find multiple occurrences of videoId
-                for m in re.finditer(r'"videoId"\s*:\s*"([\w-]{11})"', text):
-                    vid = m.group(1)
-                    if vid not in ids:
-                        ids.append(vid)
-                        if len(ids) >= max_candidates:
-                            break
-                # Fallback: /watch?v= regex
-                if not ids:
-                    for m in re.finditer(r"/watch\?v=([\w-]{11})", text):
-                        vid = m.group(1)
-                        if vid not in ids:
-                            ids.append(vid)
-                            if len(ids) >= max_candidates:
-                                break
-                return ids
-            except Exception:
-                return []
-
-        from difflib import SequenceMatcher
-
-        def _score_candidate(vid, target_term):
-            # Query oEmbed for metadata (title, author_name)
-            url = f"https://www.youtube.com/watch?v={vid}"
-            title = None
-            author = None
-            try:
-                resp = requests.get(f'https://www.youtube.com/oembed?url={quote_plus(url)}&format=json', timeout=4)
-                if resp.status_code == 200:
-                    j = resp.json()
-                    title = (j.get('title') or '').strip()
-                    author = (j.get('author_name') or '').strip()
-            except Exception:
-                pass
-
-            score = 0
-            t = (title or '').lower()
-            a = (author or '').lower()
-            target = (target_term or '').lower()
-            # Strong boost for exact title (after stripping non-alphanum)
-            def _clean(s):
-                return re.sub(r"[^a-z0-9 ]", "", (s or '').lower()).strip()
-
-            ct = _clean(t)
-            ctarget = _clean(target)
-            if ct and ctarget and ct == ctarget:
-                score += 150
-            # If the full target appears in title (word sequence), strong boost
-            elif ctarget and ctarget in ct:
-                score += 80
-            else:
-                # Partial matches: count how many target words appear in title
-                if ctarget:
-                    target_words = [w for w in ctarget.split() if w]
-                    matched = sum(1 for w in target_words if w in ct)
-                    score += matched * 15
-
-            # Similarity boost via SequenceMatcher
-            try:
-                if title and target:
-                    ratio = SequenceMatcher(None, ct, ctarget).ratio()
-                    if ratio > 0.9:
-                        score += 60
-                    elif ratio > 0.75:
-                        score += 25
-            except Exception:
-                pass
-
-            # Moderate bonus if author/channel name indicates a music label
-            if any(k in a for k in ('vevo', 'official', 'music', 'tseries', 'lahari', 'sony', 'saregama', 'universal')):
-                score += 10
-
-            # small bonus for short titles (likely exact song title)
-            if title and len(title) <= 60:
-                score += 3
-
-            return score, url, title, author
-
-        candidates = _get_candidate_video_ids(search_term, max_candidates=8)
-        top_url = None
-        top_title = None
-        if candidates:
-            best = ( -1, None, None, None )
-            for vid in candidates:
-                sc, url, title, author = _score_candidate(vid, search_term)
-                # print debug only when verbose
-                if verbose:
-                    print(f"candidate {vid} -> score={sc} title={repr(title)} author={repr(author)}")
-                if sc > best[0]:
-                    best = (sc, url, title, author)
-            if best[1]:
-                top_url = best[1]
-                top_title = best[2]
+        # Rank the search results (cached per term; candidate metadata is fetched concurrently)
+        from engine.youtube_search import youtube_search
+        ranked = youtube_search.rank(search_term, max_candidates=8)
+        if verbose:
+            for sc, url, title, author in ranked:
+                print(f"candidate {url} -> score={sc} title={repr(title)} author={repr(author)}")
+        top_url = ranked[0][1] if ranked else None
+        # The winner's title already came from oEmbed while ranking
+        title = ranked[0][2] if ranked else None
         if top_url:
             if verbose:
-                print(f"Top YouTube URL found: {top_url} title={repr(top_title)}")
+                print(f"Top YouTube URL found: {top_url} title={repr(title)}")
             if headless:
                 print(f"[headless] would open: {top_url}")
                 return True
-            # Try to get a friendly title via oEmbed for UI display
-            try:
-                oembed = requests.get(f'https://www.youtube.com/oembed?url={quote_plus(top_url)}&format=json', timeout=4)
-                title = None
-                if oembed.status_code == 200:
-                    j = oembed.json()
-                    title = j.get('title')
-                else:
-                    title = None
-            except Exception:
-                title = None
 
             try:
                 # If eel is available, not headless, and show_modal is requested, notify the front-end with title+url
@@ -776,43 +679,41 @@ def PlayYoutube(query, show_modal=False):
         return False
 
 
-def hotword():
-    porcupine=None
-    paud=None
-    audio_stream=None
+def hotword(wake_conn=None):
+    from engine.hotword import HotwordDetector, MicrophoneSource, PorcupineEngine
+    from engine.wake_channel import WakeSender
+
+    sender = WakeSender(wake_conn) if wake_conn is not None else None
+
+    def _on_wake(keyword_index, detector):
+        nonlocal sender
+        print("hotword detected")
+
+        # tell the UI process directly (with the last ~0.5s of audio as pre-roll)
+        if sender is not None:
+            if sender.send(detector.engine.keywords[keyword_index], detector.preroll(), detector.engine.sample_rate):
+                return
+            sender = None
+
+        # fallback: pressing shorcut key win+j
+        pyautogui.keyDown("win")
+        pyautogui.press("j")
+        time.sleep(0.2)
+        pyautogui.keyUp("win")
+
+    engine = None
     try:
-       
-        # pre trained keywords    
-        porcupine=pvporcupine.create(keywords=["jarvis","alexa"]) 
-        paud=pyaudio.PyAudio()
-        audio_stream=paud.open(rate=porcupine.sample_rate,channels=1,format=pyaudio.paInt16,input=True,frames_per_buffer=porcupine.frame_length)
-        
-        # loop for streaming
-        while True:
-            keyword=audio_stream.read(porcupine.frame_length)
-            keyword=struct.unpack_from("h"*porcupine.frame_length,keyword)
-
-            # processing keyword comes from mic 
-            keyword_index=porcupine.process(keyword)
-
-            # checking first keyword detetcted for not
-            if keyword_index>=0:
-                print("hotword detected")
-
-                # pressing shorcut key win+j
-                import pyautogui as autogui
-                autogui.keyDown("win")
-                autogui.press("j")
-                time.sleep(0.2)
-                autogui.keyUp("win")
-                
-    except:
-        if porcupine is not None:
-            porcupine.delete()
-        if audio_stream is not None:
-            audio_stream.close()
-        if paud is not None:
-            paud.terminate()
+        # pre trained keywords
+        engine = PorcupineEngine(keywords=("jarvis", "alexa"))
+
+        # blocking mic stream read frame by frame
+        source = MicrophoneSource(engine.sample_rate, engine.frame_length)
+        HotwordDetector(engine, source, _on_wake).run()
+    except Exception as e:
+        print(f"hotword error: {e}")
+    finally:
+        if engine is not None:
+            engine.delete()
 
 
 
@@ -823,17 +724,23 @@ def findContact(query):
     query = remove_words(query, words_to_remove)
 
     try:
+        from engine.contact_import import normalize_phone
+        from engine.contact_index import contact_index
         query = query.strip().lower()
-        cursor.execute("SELECT mobile_no FROM contacts WHERE LOWER(name) LIKE ? OR LOWER(name) LIKE ?", ('%' + query + '%', query + '%'))
-        results = cursor.fetchall()
-        print(results[0][0])
-        mobile_number_str = str(results[0][0])
-
-        if not mobile_number_str.startswith('+91'):
-            mobile_number_str = '+91' + mobile_number_str
-
-        return mobile_number_str, query
-    except:
+        # a misheard-spelling (Soundex) match is too weak to call or message someone
+        match = contact_index.best(query, fuzzy=False)
+        if match is None:
+            speak('not exist in contacts')
+            return 0, 0
+        mobile_number_str = normalize_phone(str(match.mobile_no))
+        if not mobile_number_str:
+            print(f"findContact: unusable number for {match.name}")
+            speak('not exist in contacts')
+            return 0, 0
+
+        return mobile_number_str, match.name
+    except Exception as e:
+        print(f"findContact error: {e}")
         speak('not exist in contacts')
         return 0, 0
     
@@ -1475,17 +1382,15 @@ def execute_complex_command(query):
                     t = t.strip()
                     # Prefer using Google Generative API if configured
                     try:
-                        if LLM_KEY:
+                        from engine.llm_client import llm_client
+                        if llm_client.available():
                             try:
-                                import google.generativeai as _genai
-                                _genai.configure(api_key=LLM_KEY)
-                                model = _genai.GenerativeModel("gemini-2.0-flash")
                                 if short:
                                     prompt = f"Write a concise 1-2 sentence summary about {t} in clear English."
                                 else:
                                     prompt = f"Write a short, engaging 4-6 sentence story about {t} in clear English."
-                                response = model.generate_content(prompt)
-                                return response.text
+                                # creative prompt: a repeated request should get a new story
+                                return llm_client.generate(prompt, use_cache=False)
                             except Exception as e:
                                 print(f"genai error: {e}")
                                 # fall through to template
@@ -1533,10 +1438,10 @@ def execute_complex_command(query):
         print(f"Error in execute_complex_command: {e}")
         return False
 
-import google.generativeai as genai
 def geminai(query):
+    from engine.llm_client import llm_client
     try:
-        if not LLM_KEY:
+        if not llm_client.available():
             # Fallback to basic responses when no API key
             fallback_responses = {
                 "hello": "Hello! How can I help you today?",
@@ -1557,16 +1462,20 @@ def geminai(query):
         
         query = query.replace(ASSISTANT_NAME, "")
         query = query.replace("search", "")
-        # Set your API key
-        genai.configure(api_key=LLM_KEY)
-
-        # Select a model
-        model = genai.GenerativeModel("gemini-2.0-flash")
-
-        # Generate a response
-        response = model.generate_content(query)
-        filter_text = markdown_to_text(response.text)
-        speak(filter_text)
+        # Queue each sentence as soon as it has been generated (the model is created once);
+        # the chat shows the whole answer as one message once the stream ends
+        last = None
+        sentences = []
+        for sentence in llm_client.stream_sentences(query, clean=markdown_to_text):
+            sentences.append(sentence)
+            last = speak(sentence, wait=False, display=False)
+        if sentences:
+            try:
+                eel.receiverText(" ".join(sentences))
+            except Exception:
+                pass
+        if last is not None:
+            last.wait()
     except Exception as e:
         print("Error:", e)
         speak("I'm having trouble processing that request right now.")
@@ -1659,53 +1568,26 @@ def send_telegram(contact, message):
             print(f"[headless] send_telegram to={contact} msg={message}")
             return True
 
-        api_id = os.environ.get('TELEGRAM_API_ID')
-        api_hash = os.environ.get('TELEGRAM_API_HASH')
-        session = os.environ.get('TELEGRAM_SESSION', 'jarvis_telegram')
-        if not api_id or not api_hash:
+        if not os.environ.get('TELEGRAM_API_ID') or not os.environ.get('TELEGRAM_API_HASH'):
             print('Telethon credentials not set (TELEGRAM_API_ID/TELEGRAM_API_HASH)')
             return False
 
+        # The session manager keeps one authenticated client connected between sends
+        from engine.telegram_session import telegram_session
         try:
-            # Import telethon dynamically to avoid static import-time resolution errors in editors/linters
-            import importlib
-            telethon_mod = importlib.import_module('telethon')
-            TelegramClient = getattr(telethon_mod, 'TelegramClient', None)
-            # errors submodule may sometimes need explicit import
-            try:
-                errors_mod = importlib.import_module('telethon.errors')
-            except Exception:
-                errors_mod = getattr(telethon_mod, 'errors', None)
-            SessionPasswordNeededError = getattr(errors_mod, 'SessionPasswordNeededError', None)
-            if TelegramClient is None or SessionPasswordNeededError is None:
-                raise ImportError('telethon not installed or missing required symbols')
-        except Exception as e:
-            print(f'Telethon not installed: {e}')
-            return False
-
-        client = TelegramClient(session, int(api_id), api_hash)
-        try:
-            client.connect()
-            
-            # If not authorized, start authentication
-            if not client.is_user_authorized():
-                print('Telegram session not authorized. Starting authentication...')
-                print('You will be prompted for your phone number and authentication code.')
-                client.start()
-            
-            # Send the message
-            client.send_message(contact, message)
+            telegram_session.send_sync(contact, message)
             print(f'Successfully sent Telegram message to {contact}')
             return True
-        except SessionPasswordNeededError:
-            print('Two-step verification is enabled. Password required.')
-            print('This feature needs manual password input - please authenticate manually first.')
+        except ImportError as e:
+            print(f'Telethon not installed: {e}')
             return False
         except Exception as e:
-            print(f"Error sending Telegram message: {e}")
+            if type(e).__name__ == 'SessionPasswordNeededError':
+                print('Two-step verification is enabled. Password required.')
+                print('This feature needs manual password input - please authenticate manually first.')
+            else:
+                print(f"Error sending Telegram message: {e}")
             return False
-        finally:
-            client.disconnect()
     except Exception as e:
         print(f"send_telegram error: {e}")
         return False
@@ -1727,26 +1609,16 @@ def send_instagram(username, message):
             print('Instagram credentials not set (IG_USERNAME/IG_PASSWORD)')
             return False
 
+        # Reuses the saved login and cached user ids instead of logging in per message
+        from engine.instagram_session import instagram_session
         try:
-            from instagrapi import Client
-        except Exception as e:
+            instagram_session.send_sync(username, message)
+        except ImportError as e:
             print(f'instagrapi not installed: {e}')
             return False
-
-        cl = Client()
-        cl.login(ig_user, ig_pass)
-        # resolve user id
-        try:
-            uid = cl.user_id_from_username(username)
-        except Exception:
-            # maybe username provided is already numeric id
-            try:
-                uid = int(username)
-            except Exception:
-                print(f'Could not resolve Instagram user: {username}')
-                return False
-
-        cl.direct_send(message, [uid])
+        except LookupError as e:
+            print(e)
+            return False
         return True
     except Exception as e:
         print(f"send_instagram error: {e}")
@@ -2001,102 +1873,66 @@ def assistantName():
 @eel.expose
 def personalInfo():
     try:
-        cursor.execute("SELECT * FROM info")
-        results = cursor.fetchall()
-        jsonArr = json.dumps(results[0])
+        info = personal_info.get()
+        if info is None:
+            print("no data")
+            return
+        jsonArr = json.dumps(list(info))
         eel.getData(jsonArr)
         return 1    
-    except:
-        print("no data")
+    except Exception as e:
+        print(f"no data: {e}")
 
 
 @eel.expose
 def updatePersonalInfo(name, designation, mobileno, email, city):
-    cursor.execute("SELECT COUNT(*) FROM info")
-    count = cursor.fetchone()[0]
-
-    if count > 0:
-        # Update existing record
-        cursor.execute(
-            '''UPDATE info 
-               SET name=?, designation=?, mobileno=?, email=?, city=?''',
-            (name, designation, mobileno, email, city)
-        )
-    else:
-        # Insert new record if no data exists
-        cursor.execute(
-            '''INSERT INTO info (name, designation, mobileno, email, city) 
-               VALUES (?, ?, ?, ?, ?)''',
-            (name, designation, mobileno, email, city)
-        )
-
-    con.commit()
+    # Updates the existing record, or inserts one if no data exists
+    personal_info.save(name, designation, mobileno, email, city).result()
     personalInfo()
     return 1
 
 
 
-@eel.expose
-def displaySysCommand():
-    cursor.execute("SELECT * FROM sys_command")
-    results = cursor.fetchall()
-    jsonArr = json.dumps(results)
-    eel.displaySysCommand(jsonArr)
-    return 1
-
+# Settings writes go through the database writer thread; the endpoints wait for the
+# commit so the page's follow-up getTableChanges() sees the change
 
 @eel.expose
 def deleteSysCommand(id):
-    cursor.execute("DELETE FROM sys_command WHERE id = ?", (id,))
-    con.commit()
+    sys_commands.delete(id).result()
 
 
 @eel.expose
 def addSysCommand(key, value):
-    cursor.execute(
-        '''INSERT INTO sys_command VALUES (?, ?, ?)''', (None,key, value))
-    con.commit()
+    sys_commands.add(key, value).result()
 
 
 @eel.expose
-def displayWebCommand():
-    cursor.execute("SELECT * FROM web_command")
-    results = cursor.fetchall()
-    jsonArr = json.dumps(results)
-    eel.displayWebCommand(jsonArr)
-    return 1
+def addWebCommand(key, value):
+    web_commands.add(key, value).result()
 
 
 @eel.expose
-def addWebCommand(key, value):
-    cursor.execute(
-        '''INSERT INTO web_command VALUES (?, ?, ?)''', (None, key, value))
-    con.commit()
+def deleteWebCommand(id):
+    web_commands.delete(id).result()
 
 
 @eel.expose
-def deleteWebCommand(id):
-    cursor.execute("DELETE FROM web_command WHERE Id = ?", (id,))
-    con.commit()
+def getTablePage(table, offset=0, limit=50, search=''):
+    """One page of sys_command, web_command or contacts for the settings tables (filtered by `search`)."""
+    return fetch_page(table, offset, limit, search)
 
 
 @eel.expose
-def displayPhoneBookCommand():
-    cursor.execute("SELECT * FROM contacts")
-    results = cursor.fetchall()
-    jsonArr = json.dumps(results)
-    eel.displayPhoneBookCommand(jsonArr)
-    return 1
+def getTableChanges(table, since):
+    """Rows added/deleted since the cursor returned by getTablePage (or reset=True to reload)."""
+    return fetch_changes(table, since)
 
 
 @eel.expose
 def deletePhoneBookCommand(id):
-    cursor.execute("DELETE FROM contacts WHERE Id = ?", (id,))
-    con.commit()
+    contacts.delete(id).result()
 
 
 @eel.expose
 def InsertContacts(Name, MobileNo, Email, City):
-    cursor.execute(
-        '''INSERT INTO contacts VALUES (?, ?, ?, ?, ?)''', (None,Name, MobileNo, Email, City))
-    con.commit()
\ No newline at end of file
+    contacts.add(Name, MobileNo, Email, City).result()
\ No newline at end of file
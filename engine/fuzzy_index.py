@@ -0,0 +1,71 @@
+from collections import Counter
+from difflib import SequenceMatcher
+
+
+def _ratio_bound(matches, length):
+    # Same arithmetic as difflib._calculate_ratio so cutoff comparisons agree exactly
+    return 2.0 * matches / length if length else 1.0
+
+
+class AppNameIndex:
+    """Prebuilt index answering difflib.get_close_matches(word, names, n=1, cutoff).
+
+    Candidates are bucketed by length and carry a precomputed character bag.
+    A query only reaches SequenceMatcher.ratio() for candidates whose length
+    bound (real_quick_ratio) and bag bound (quick_ratio) both clear the cutoff,
+    which are the same filters difflib applies, so the winner is identical.
+    Answers are memoized until the next rebuild().
+    """
+
+    MEMO_LIMIT = 4096
+
+    def __init__(self, candidates=(), cutoff=0.78):
+        self.cutoff = cutoff
+        self.rebuild(candidates)
+
+    def rebuild(self, candidates):
+        """Replace the indexed names (duplicates are ignored)."""
+        by_length = {}
+        for name in dict.fromkeys(candidates):
+            by_length.setdefault(len(name), []).append((name, dict(Counter(name))))
+        self._by_length = by_length
+        self._memo = {}
+        self.size = sum(len(v) for v in by_length.values())
+
+    def best_match(self, word):
+        """Return the closest indexed name scoring >= cutoff, or None."""
+        memo = self._memo
+        if word in memo:
+            return memo[word]
+
+        cutoff = self.cutoff
+        word_len = len(word)
+        word_bag = None
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        best = None
+        for length, bucket in self._by_length.items():
+            total = word_len + length
+            if _ratio_bound(min(word_len, length), total) < cutoff:
+                continue
+            if word_bag is None:
+                word_bag = tuple(Counter(word).items())
+            for name, bag in bucket:
+                shared = 0
+                for ch, count in word_bag:
+                    have = bag.get(ch)
+                    if have:
+                        shared += count if count < have else have
+                if _ratio_bound(shared, total) < cutoff:
+                    continue
+                matcher.set_seq1(name)
+                score = matcher.ratio()
+                # get_close_matches keeps the largest (score, name) pair
+                if score >= cutoff and (best is None or (score, name) > best):
+                    best = (score, name)
+
+        result = best[1] if best else None
+        if len(memo) >= self.MEMO_LIMIT:
+            memo.clear()
+        memo[word] = result
+        return result
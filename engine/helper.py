@@ -1,8 +1,12 @@
 import os
 import re
 import time
-import markdown2
-from bs4 import BeautifulSoup
+
+from engine.lazy_imports import lazy_import
+
+markdown2 = lazy_import('markdown2')
+bs4 = lazy_import('bs4')
+
 
 def extract_yt_term(command):
     """Extract a YouTube search/play term from a free-form command.
@@ -97,5 +101,5 @@ def replace_spaces_with_percent_s(input_string):
 
 def markdown_to_text(md):
     html = markdown2.markdown(md)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = bs4.BeautifulSoup(html, "html.parser")
     return soup.get_text().strip()
\ No newline at end of file
@@ -0,0 +1,149 @@
+import abc
+import collections
+import os
+import struct
+import time
+import wave
+
+
+class KeywordEngine(abc.ABC):
+    """Interface for keyword spotters: process(pcm) returns the keyword index or -1.
+
+    `pcm` is a sequence of `frame_length` int16 samples.
+    """
+
+    sample_rate = 16000
+    frame_length = 512
+    keywords = ()
+
+    @abc.abstractmethod
+    def process(self, pcm):
+        """Return the index of the keyword heard in this frame, or -1."""
+
+    def delete(self):
+        pass
+
+
+class PorcupineEngine(KeywordEngine):
+    """pvporcupine behind the KeywordEngine interface."""
+
+    def __init__(self, keywords=("jarvis", "alexa"), access_key=None):
+        import pvporcupine
+        kwargs = {'keywords': list(keywords)}
+        access_key = access_key or os.environ.get('PICOVOICE_ACCESS_KEY')
+        if access_key:
+            kwargs['access_key'] = access_key
+        self._porcupine = pvporcupine.create(**kwargs)
+        self.keywords = tuple(keywords)
+        self.sample_rate = self._porcupine.sample_rate
+        self.frame_length = self._porcupine.frame_length
+
+    def process(self, pcm):
+        return self._porcupine.process(pcm)
+
+    def delete(self):
+        self._porcupine.delete()
+
+
+class MicrophoneSource:
+    """Blocking PyAudio input stream; read() returns one frame of 16-bit PCM bytes."""
+
+    def __init__(self, sample_rate, frame_length):
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self._pa = None
+        self._stream = None
+
+    def open(self):
+        import pyaudio
+        self._pa = pyaudio.PyAudio()
+        self._stream = self._pa.open(rate=self.sample_rate, channels=1, format=pyaudio.paInt16, input=True,
+                                     frames_per_buffer=self.frame_length)
+
+    def read(self):
+        return self._stream.read(self.frame_length)
+
+    def close(self):
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+
+
+class WavFileSource:
+    """Reads a 16-bit mono WAV file frame by frame (for tests/benchmarks); b'' at the end."""
+
+    def __init__(self, path, frame_length):
+        self.path = path
+        self.frame_length = frame_length
+        with wave.open(path, 'rb') as wf:
+            if wf.getsampwidth() != 2 or wf.getnchannels() != 1:
+                raise ValueError('WavFileSource needs 16-bit mono audio')
+            self.sample_rate = wf.getframerate()
+        self._wav = None
+
+    def open(self):
+        self._wav = wave.open(self.path, 'rb')
+
+    def read(self):
+        return self._wav.readframes(self.frame_length)
+
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+class HotwordDetector:
+    """The always-on loop: read a frame, unpack it, hand it to the engine.
+
+    `on_wake(keyword_index, detector)` is called for every detection;
+    detector.preroll() returns the raw audio of the last `preroll_frames`
+    frames, ending with the wake word.
+    """
+
+    def __init__(self, engine, source, on_wake, preroll_frames=16):
+        self.engine = engine
+        self.source = source
+        self.on_wake = on_wake
+        self._recent = collections.deque(maxlen=preroll_frames)
+        self._running = False
+        self.stats = {'frames': 0, 'detections': 0, 'process_seconds': 0.0}
+
+    def preroll(self):
+        return b''.join(self._recent)
+
+    def run(self, max_frames=None):
+        """Process audio until stop(), the source ends, or `max_frames` frames were seen."""
+        fl = self.engine.frame_length
+        unpack = struct.Struct(f'<{fl}h').unpack_from
+        stats = self.stats
+        self._running = True
+        self.source.open()
+        try:
+            while self._running:
+                data = self.source.read()
+                if len(data) < fl * 2:
+                    break
+                t0 = time.perf_counter()
+                index = self.engine.process(unpack(data))
+                stats['process_seconds'] += time.perf_counter() - t0
+                stats['frames'] += 1
+                self._recent.append(data)
+                if index >= 0:
+                    stats['detections'] += 1
+                    self.on_wake(index, self)
+                if max_frames is not None and stats['frames'] >= max_frames:
+                    break
+        finally:
+            self._running = False
+            self.source.close()
+        return stats
+
+    def stop(self):
+        self._running = False
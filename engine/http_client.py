@@ -0,0 +1,93 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+
+
+class HttpClient:
+    """Shared HTTP layer for network-bound commands.
+
+    One requests.Session with keep-alive connection pools (at most
+    `pool_maxsize` connections per host), a default timeout on every call, and
+    urllib3 retries with exponential backoff for requests that fail to connect
+    and for idempotent requests that get a transient status. A request that
+    timed out or broke after it was sent is never retried: the server may
+    already have acted on it, and a retried read timeout would multiply the
+    caller's wait. Each call is timed under an endpoint
+    name (default "host/path") and summarized by metrics().
+    """
+
+    def __init__(self, timeout=(3.05, 10), pool_connections=8, pool_maxsize=10, retries=2,
+                 backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), user_agent=USER_AGENT):
+        self.timeout = timeout
+        retry = Retry(total=retries, connect=retries, read=0, other=0, status=retries,
+                      backoff_factor=backoff_factor, status_forcelist=status_forcelist,
+                      allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              max_retries=retry, pool_block=True)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, endpoint=None, **kwargs):
+        """Send a request through the pooled session; `endpoint` names it in metrics()."""
+        kwargs.setdefault('timeout', self.timeout)
+        if endpoint is None:
+            parsed = urlparse(url)
+            endpoint = f"{parsed.netloc}{parsed.path}"
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self._record(endpoint, (time.perf_counter() - t0) * 1000.0, failed)
+
+    def get(self, url, endpoint=None, **kwargs):
+        return self.request('GET', url, endpoint=endpoint, **kwargs)
+
+    def post(self, url, endpoint=None, **kwargs):
+        return self.request('POST', url, endpoint=endpoint, **kwargs)
+
+    def _record(self, endpoint, ms, failed):
+        with self._lock:
+            m = self._metrics.get(endpoint)
+            if m is None:
+                m = self._metrics[endpoint] = {'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0}
+            m['count'] += 1
+            m['errors'] += 1 if failed else 0
+            m['total_ms'] += ms
+            m['max_ms'] = max(m['max_ms'], ms)
+            m['last_ms'] = ms
+
+    def metrics(self):
+        """Per-endpoint call count, error count and latency (ms)."""
+        with self._lock:
+            return {
+                name: {'count': m['count'], 'errors': m['errors'],
+                       'avg_ms': round(m['total_ms'] / m['count'], 1),
+                       'max_ms': round(m['max_ms'], 1), 'last_ms': round(m['last_ms'], 1)}
+                for name, m in self._metrics.items()
+            }
+
+    def reset_metrics(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def close(self):
+        self.session.close()
+
+
+# Global client shared by YouTube search, translation and other networked commands
+http_client = HttpClient()
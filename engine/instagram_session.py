@@ -0,0 +1,142 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+from engine.cache import TTLCache
+
+SETTINGS_PATH = os.getenv('IG_SESSION_FILE', 'instagram_session.json')
+
+
+def _default_client_factory():
+    from instagrapi import Client
+    return Client()
+
+
+def _env_credentials():
+    return os.environ.get('IG_USERNAME'), os.environ.get('IG_PASSWORD')
+
+
+class InstagramSessionManager:
+    """Reusable logged-in instagrapi client with a DM send queue.
+
+    The client's session settings are saved to `settings_path` after login and
+    loaded again by later processes, so Instagram sees a resumed session rather
+    than a new login. Username -> user id lookups are kept in a TTL cache and
+    DMs are sent one at a time by a worker thread that owns the client.
+    """
+
+    def __init__(self, client_factory=_default_client_factory, settings_path=SETTINGS_PATH,
+                 credentials=_env_credentials, uid_ttl=24 * 60 * 60):
+        self._client_factory = client_factory
+        self.settings_path = settings_path
+        self._credentials = credentials
+        self._client = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.uid_cache = TTLCache(maxsize=1024, ttl=uid_ttl)
+        self._stats = {'logins': 0, 'resumed': 0, 'sent': 0, 'failed': 0}
+
+    def _login(self, fresh=False):
+        """Log in, resuming the saved session unless `fresh`; a fresh login replaces the saved one."""
+        username, password = self._credentials()
+        if not username or not password:
+            raise RuntimeError('Instagram credentials not set (IG_USERNAME/IG_PASSWORD)')
+        cl = self._client_factory()
+        if not fresh and self.settings_path and os.path.exists(self.settings_path):
+            try:
+                cl.load_settings(self.settings_path)
+                cl.login(username, password)
+                self._stats['resumed'] += 1
+                self._client = cl
+                return cl
+            except Exception as e:
+                # stale or corrupt session; start over with a fresh device
+                print(f"Instagram saved session rejected ({e}); logging in again")
+                cl = self._client_factory()
+        cl.login(username, password)
+        self._stats['logins'] += 1
+        if self.settings_path:
+            try:
+                cl.dump_settings(self.settings_path)
+            except Exception as e:
+                print(f"Could not save Instagram session: {e}")
+        self._client = cl
+        return cl
+
+    def client(self):
+        """Return the logged-in client, logging in (or resuming) on first use."""
+        with self._lock:
+            if self._client is None:
+                self._login()
+            return self._client
+
+    def user_id(self, username):
+        """Resolve a username to a user id (cached); numeric ids are passed through."""
+        key = str(username).strip().lstrip('@').lower()
+        uid = self.uid_cache.get(key)
+        if uid is not None:
+            return uid
+        client = self.client()
+        try:
+            uid = client.user_id_from_username(key)
+        except Exception:
+            # maybe username provided is already numeric id
+            try:
+                uid = int(username)
+            except Exception:
+                raise LookupError(f'Could not resolve Instagram user: {username}')
+        self.uid_cache.put(key, uid)
+        return uid
+
+    def send(self, username, message):
+        """Queue a DM; the Future resolves to True once it was sent."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='instagram-send', daemon=True)
+                self._thread.start()
+        future = Future()
+        self._queue.put((username, message, future))
+        return future
+
+    def send_sync(self, username, message, timeout=60):
+        return self.send(username, message).result(timeout)
+
+    def _deliver(self, username, message):
+        uid = self.user_id(username)
+        try:
+            self.client().direct_send(message, [uid])
+        except Exception as e:
+            if type(e).__name__ not in ('LoginRequired', 'ReloginAttemptExceeded'):
+                raise
+            # the server dropped the session: the saved settings hold the same dead
+            # session, so log in from scratch (which saves the new one) and retry
+            with self._lock:
+                self._client = None
+                client = self._login(fresh=True)
+            client.direct_send(message, [uid])
+
+    def _run(self):
+        while True:
+            username, message, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self._deliver(username, message)
+            except Exception as e:
+                self._stats['failed'] += 1
+                future.set_exception(e)
+                continue
+            self._stats['sent'] += 1
+            future.set_result(True)
+
+    def stats(self):
+        stats = dict(self._stats)
+        stats['uid_cache'] = self.uid_cache.stats()
+        stats['logged_in'] = self._client is not None
+        return stats
+
+
+# Global session used by send_instagram
+instagram_session = InstagramSessionManager()
@@ -0,0 +1,109 @@
+import re
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+
+# Keywords the entry points look for. They are matched as plain substrings of the
+# lower-cased utterance (same semantics as the old `"x" in command_lower` checks).
+INTENT_KEYWORDS = (
+    'open', 'youtube', 'on youtube', 'open_and_type', 'play',
+    'send message', 'send sms', 'phone call', 'video call',
+    'telegram', 'whatsapp', 'send', 'message',
+)
+
+# Ordered intent table: first row whose conditions hold wins.
+# Each row is (intent name, all_of keywords, any_of keywords, structured command type).
+INTENT_TABLE = (
+    ('open_youtube', ('open', 'youtube'), (), None),
+    ('open_and_type', ('open_and_type',), (), None),
+    ('open_and_type', (), (), 'open_and_type'),
+    ('play_youtube', ('play',), ('youtube',), None),
+    ('open', ('open',), (), None),
+    ('contact', (), ('send message', 'phone call', 'video call'), None),
+    ('telegram', ('telegram',), ('send', 'message'), None),
+)
+
+# Precedence of the single-command path (command.execute_single_command):
+# anything with "open" goes to openCommand before the YouTube and contact checks.
+SINGLE_COMMAND_TABLE = (
+    ('open', ('open',), (), None),
+    ('play_youtube', ('on youtube',), (), None),
+    ('contact', (), ('send message', 'phone call', 'video call'), None),
+)
+
+TABLES = {
+    'task': INTENT_TABLE,
+    'single_command': SINGLE_COMMAND_TABLE,
+}
+
+DEFAULT_INTENT = 'ai'
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class Intent:
+    """Result of classifying one utterance (`text` is the stripped, lower-cased utterance)."""
+    __slots__ = ('name', 'text', '_keywords', '_words')
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.text = text
+        self._keywords = None
+        self._words = None
+
+    @property
+    def keywords(self) -> FrozenSet[str]:
+        """The INTENT_KEYWORDS present in the utterance, computed on first use."""
+        if self._keywords is None:
+            self._keywords = frozenset([k for k in INTENT_KEYWORDS if k in self.text])
+        return self._keywords
+
+    @property
+    def words(self) -> FrozenSet[str]:
+        """Lower-cased word tokens, computed on first use."""
+        if self._words is None:
+            self._words = frozenset(_WORD_RE.findall(self.text))
+        return self._words
+
+    def has(self, *keywords):
+        """True if any of the given keywords occurs in the utterance."""
+        text = self.text
+        return any(k in text for k in keywords)
+
+    def has_word(self, *words):
+        """True if any of the given whole words occurs in the utterance."""
+        return any(w in self.words for w in words)
+
+    def __repr__(self):
+        return f"Intent(name={self.name!r}, text={self.text!r})"
+
+
+@lru_cache(maxsize=512)
+def _classify(text, command_type, table):
+    # Walk the rows with plain substring checks, like the old if/elif chain:
+    # each row stops at its first failing keyword and nothing else is probed.
+    for name, all_of, any_of, required_type in TABLES[table]:
+        if required_type is not None and command_type != required_type:
+            continue
+        for k in all_of:
+            if k not in text:
+                break
+        else:
+            if not any_of:
+                return Intent(name, text)
+            for k in any_of:
+                if k in text:
+                    return Intent(name, text)
+    return Intent(DEFAULT_INTENT, text)
+
+
+def classify(command, command_type: Optional[str] = None, table: str = 'task') -> Intent:
+    """Classify a command (plain string or parser dict) against one of TABLES.
+
+    The text is stripped and lower-cased before the cache lookup, so
+    "Open Notepad" and "open notepad" share one cached result.
+    """
+    if isinstance(command, dict):
+        command_type = command_type or command.get('type')
+        command = command.get('query') or command.get('original')
+    return _classify(str(command or '').strip().lower(), command_type, table)
@@ -0,0 +1,84 @@
+import importlib
+import os
+import threading
+import time
+import types
+
+# Set JARVIS_EAGER_IMPORTS=1 to import everything up front (for comparison/debugging)
+EAGER = os.environ.get('JARVIS_EAGER_IMPORTS', '').lower() in ('1', 'true', 'yes')
+
+_modules = {}
+_profile = {}
+_lock = threading.RLock()
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access.
+
+    The import cost of each module is recorded and reported by import_profile().
+    An import error surfaces at the point of use, like a function-level import.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__['_lazy_module']
+            if module is None:
+                t0 = time.perf_counter()
+                try:
+                    module = importlib.import_module(self.__name__)
+                finally:
+                    _profile[self.__name__] = {'seconds': time.perf_counter() - t0,
+                                               'thread': threading.current_thread().name}
+                self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """Return a LazyModule for `name` (dotted names import the submodule)."""
+    with _lock:
+        module = _modules.get(name)
+        if module is None:
+            module = _modules[name] = LazyModule(name)
+    if EAGER:
+        module._load()
+    return module
+
+
+def is_loaded(name):
+    module = _modules.get(name)
+    return module is not None and module.__dict__['_lazy_module'] is not None
+
+
+def import_profile():
+    """Per-module import cost, most expensive first; deferred modules not used yet have seconds=None."""
+    with _lock:
+        rows = [{'module': name, 'seconds': round(_profile[name]['seconds'], 4) if name in _profile else None,
+                 'thread': _profile.get(name, {}).get('thread')}
+                for name in _modules]
+    return sorted(rows, key=lambda r: -(r['seconds'] or 0.0))
+
+
+def report():
+    """Human-readable import_profile()."""
+    lines = ['lazy imports:']
+    for row in import_profile():
+        cost = f"{row['seconds'] * 1000:8.1f} ms" if row['seconds'] is not None else '  not used'
+        lines.append(f"  {cost}  {row['module']}")
+    return '\n'.join(lines)
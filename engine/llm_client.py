@@ -0,0 +1,206 @@
+import re
+import threading
+import time
+
+from engine.cache import LRUCache
+from engine import config as config_module
+
+DEFAULT_MODEL = "gemini-2.0-flash"
+
+# A sentence ends at . ! ? (optionally followed by closing quotes/brackets/markdown) plus
+# whitespace, or at a blank line; see _is_sentence_end for the periods that don't count
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]*_`]*\s+|\n\s*\n")
+_WORD_BEFORE_RE = re.compile(r"[\w.]*$")
+_BULLET_RE = re.compile(r"(?m)^\s*[*+-]\s")
+
+# Lower-cased, without dots: "Dr. Smith", "e.g. this", "vs. that" don't end a sentence
+_ABBREVIATIONS = frozenset('mr mrs ms dr prof sr jr st mt vs etc eg ie cf al approx no fig inc ltd co dept'.split())
+
+
+def normalize_prompt(prompt):
+    """Cache key for a prompt: case, spacing and trailing punctuation don't matter."""
+    text = re.sub(r"\s+", " ", str(prompt or '')).strip().lower()
+    return text.rstrip(' ?!.')
+
+
+def _is_sentence_end(text, m):
+    if text[m.start()] != '.':
+        return True
+    word = _WORD_BEFORE_RE.search(text, 0, m.start()).group()
+    if not word:
+        return True
+    # list numbers ("1. ") and abbreviations ("e.g. ", "Dr. ", initials)
+    if word[-1].isdigit() or '.' in word or len(word) == 1:
+        return False
+    return word.lower() not in _ABBREVIATIONS
+
+
+def _markdown_open(text):
+    """True while `text` ends inside a code span/fence or emphasis that isn't closed yet."""
+    if text.count('```') % 2:
+        return True
+    if text.replace('```', '').count('`') % 2:
+        return True
+    marks = _BULLET_RE.sub('', text)
+    return marks.count('**') % 2 == 1 or marks.replace('**', '').count('*') % 2 == 1
+
+
+def _split(text):
+    """Cut complete text into sentences."""
+    start = 0
+    for m in _SENTENCE_END_RE.finditer(text):
+        if _is_sentence_end(text, m):
+            sentence = text[start:m.end()].strip()
+            if sentence:
+                yield sentence
+            start = m.end()
+    if text[start:].strip():
+        yield text[start:].strip()
+
+
+def iter_sentences(chunks, clean=None):
+    """Re-cut a stream of text chunks into complete sentences as soon as each one ends.
+
+    With `clean` (e.g. markdown_to_text) the text is cleaned before it is cut:
+    everything received since the last sentence is cleaned as one block, once
+    it ends at a sentence boundary outside any open markdown construct.
+    """
+    buffer = ''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        cut = 0
+        for m in _SENTENCE_END_RE.finditer(buffer):
+            if _is_sentence_end(buffer, m) and not _markdown_open(buffer[:m.end()]):
+                cut = m.end()
+        if cut:
+            block, buffer = buffer[:cut], buffer[cut:]
+            yield from _split(clean(block) if clean else block)
+    if buffer.strip():
+        yield from _split(clean(buffer) if clean else buffer)
+
+
+class GeminiBackend:
+    """google.generativeai model, configured and constructed once on first use."""
+
+    def __init__(self, api_key, model_name=DEFAULT_MODEL):
+        self.api_key = api_key
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    import google.generativeai as genai
+                    genai.configure(api_key=self.api_key)
+                    self._model = genai.GenerativeModel(self.model_name)
+        return self._model
+
+    def generate(self, prompt):
+        return self._get_model().generate_content(prompt).text
+
+    def stream(self, prompt):
+        for chunk in self._get_model().generate_content(prompt, stream=True):
+            text = getattr(chunk, 'text', '')
+            if text:
+                yield text
+
+
+class StubLLMBackend:
+    """Offline backend for tests: canned answers (dict or function), streamed word by word."""
+
+    def __init__(self, responses=None, default="I don't know."):
+        self.responses = responses if responses is not None else {}
+        self.default = default
+        self.calls = []
+
+    def generate(self, prompt):
+        self.calls.append(prompt)
+        if callable(self.responses):
+            return self.responses(prompt)
+        return self.responses.get(prompt, self.default)
+
+    def stream(self, prompt):
+        for word in re.findall(r"\S+\s*", self.generate(prompt)):
+            yield word
+
+
+class LLMClient:
+    """Shared entry point for AI answers.
+
+    Wraps one backend instance and a bounded response cache keyed by the
+    normalized prompt. stream_sentences() yields each sentence as soon as the
+    backend has produced it, so the caller can start speaking before the whole
+    answer has been generated.
+    """
+
+    def __init__(self, backend=None, cache_size=128):
+        self.backend = backend
+        self.cache = LRUCache(cache_size)
+        self._stats = {'requests': 0, 'first_sentence_ms': None, 'total_ms': None}
+
+    def available(self):
+        return self.backend is not None
+
+    def generate(self, prompt, use_cache=True):
+        """Return the full answer for `prompt` (from the cache when possible)."""
+        key = normalize_prompt(prompt)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        self._stats['requests'] += 1
+        t0 = time.perf_counter()
+        text = self.backend.generate(prompt)
+        self._stats['total_ms'] = round((time.perf_counter() - t0) * 1000.0, 1)
+        if text:
+            self.cache.put(key, text)
+        return text
+
+    def stream_sentences(self, prompt, use_cache=True, clean=None):
+        """Yield the answer sentence by sentence; the complete answer is cached afterwards.
+
+        `clean` is passed to iter_sentences(); the cache keeps the raw answer.
+        """
+        key = normalize_prompt(prompt)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield from iter_sentences([cached], clean)
+                return
+        self._stats['requests'] += 1
+        t0 = time.perf_counter()
+        parts = []
+
+        def _chunks():
+            for chunk in self.backend.stream(prompt):
+                parts.append(chunk)
+                yield chunk
+
+        first = True
+        for sentence in iter_sentences(_chunks(), clean):
+            if first:
+                self._stats['first_sentence_ms'] = round((time.perf_counter() - t0) * 1000.0, 1)
+                first = False
+            yield sentence
+        self._stats['total_ms'] = round((time.perf_counter() - t0) * 1000.0, 1)
+        text = ''.join(parts)
+        if text.strip():
+            self.cache.put(key, text)
+
+    def stats(self):
+        stats = dict(self._stats)
+        stats['cache'] = self.cache.stats()
+        return stats
+
+
+def _default_backend():
+    api_key = getattr(config_module, 'LLM_KEY', '')
+    return GeminiBackend(api_key) if api_key else None
+
+
+# Global client; backend is None when no API key is configured
+llm_client = LLMClient(_default_backend())
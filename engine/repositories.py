@@ -0,0 +1,164 @@
+import collections
+
+from engine.thread_safe_db import pooled_cursor
+
+Contact = collections.namedtuple('Contact', 'id name mobile_no email address')
+Command = collections.namedtuple('Command', 'id name target')
+Info = collections.namedtuple('Info', 'name designation mobileno email city')
+
+
+class _Repository:
+    """Base for the table repositories.
+
+    Reads check out this thread's connection from the pool (WAL, so they run
+    concurrently). Writes are queued on the database writer thread and
+    return a Future; caches are updated once the write is committed.
+    `pool` and `writer` default to the shared thread_safe_db pool and db_writer.
+    """
+
+    def __init__(self, pool=None, writer=None):
+        self._pool = pool
+        self._writer = writer
+
+    def _cursor(self):
+        pool = self._pool
+        if pool is None:
+            from engine.thread_safe_db import thread_safe_db
+            pool = thread_safe_db.pool
+        return pooled_cursor(pool)
+
+    def _write(self, op, *args, on_commit=None):
+        writer = self._writer
+        if writer is None:
+            from engine.db_writer import db_writer
+            writer = db_writer
+        return writer.submit(op, *args, on_commit=on_commit)
+
+
+class ContactRepository(_Repository):
+    """The contacts table; writes keep the contact index and the settings change log current."""
+
+    def get(self, contact_id):
+        with self._cursor() as cursor:
+            cursor.execute('SELECT id, name, mobile_no, email, address FROM contacts WHERE id = ?', (contact_id,))
+            row = cursor.fetchone()
+        return Contact(*row) if row else None
+
+    def all(self):
+        with self._cursor() as cursor:
+            cursor.execute('SELECT id, name, mobile_no, email, address FROM contacts ORDER BY id')
+            return [Contact(*row) for row in cursor.fetchall()]
+
+    def add(self, name, mobile_no, email=None, address=None):
+        """Insert one contact; the future's result is its id."""
+        def _insert(cursor):
+            cursor.execute('INSERT INTO contacts (name, mobile_no, email, address) VALUES (?, ?, ?, ?)',
+                           (name, mobile_no, email, address))
+            return cursor.lastrowid
+
+        def _added(contact_id):
+            from engine.contact_index import contact_index
+            from engine.table_pages import change_tracker
+            contact_index.add(contact_id, name, mobile_no)
+            change_tracker.record('contacts', 'upsert', contact_id)
+
+        return self._write(_insert, on_commit=_added)
+
+    def add_many(self, rows):
+        """Insert (name, mobile_no, email, address) rows in one transaction; the future's result is the count."""
+        rows = list(rows)
+
+        def _insert(cursor):
+            cursor.executemany('INSERT INTO contacts (name, mobile_no, email, address) VALUES (?, ?, ?, ?)', rows)
+            return len(rows)
+
+        def _added(count):
+            from engine.contact_index import contact_index
+            from engine.table_pages import change_tracker
+            if count:
+                contact_index.invalidate()
+                change_tracker.reset('contacts')
+
+        return self._write(_insert, on_commit=_added)
+
+    def delete(self, contact_id):
+        def _delete(cursor):
+            cursor.execute('DELETE FROM contacts WHERE id = ?', (contact_id,))
+
+        def _deleted(_):
+            from engine.contact_index import contact_index
+            from engine.table_pages import change_tracker
+            contact_index.remove(contact_id)
+            change_tracker.record('contacts', 'delete', contact_id)
+
+        return self._write(_delete, on_commit=_deleted)
+
+
+class CommandRepository(_Repository):
+    """sys_command (name -> path) or web_command (name -> url); writes refresh the command registry."""
+
+    def __init__(self, table, target_column, pool=None, writer=None):
+        super().__init__(pool, writer)
+        self.table = table
+        self.target_column = target_column
+
+    def all(self):
+        with self._cursor() as cursor:
+            cursor.execute(f'SELECT id, name, {self.target_column} FROM {self.table} ORDER BY id')
+            return [Command(*row) for row in cursor.fetchall()]
+
+    def add(self, name, target):
+        """Insert one command; the future's result is its id."""
+        def _insert(cursor):
+            cursor.execute(f'INSERT INTO {self.table} (name, {self.target_column}) VALUES (?, ?)', (name, target))
+            return cursor.lastrowid
+
+        def _added(command_id):
+            self._changed('upsert', command_id)
+
+        return self._write(_insert, on_commit=_added)
+
+    def delete(self, command_id):
+        def _delete(cursor):
+            cursor.execute(f'DELETE FROM {self.table} WHERE id = ?', (command_id,))
+
+        def _deleted(_):
+            self._changed('delete', command_id)
+
+        return self._write(_delete, on_commit=_deleted)
+
+    def _changed(self, op, command_id):
+        from engine.command_registry import command_registry
+        from engine.table_pages import change_tracker
+        command_registry.invalidate()
+        change_tracker.record(self.table, op, command_id)
+
+
+class InfoRepository(_Repository):
+    """The single-row info table (owner's personal details)."""
+
+    def get(self):
+        with self._cursor() as cursor:
+            cursor.execute('SELECT name, designation, mobileno, email, city FROM info LIMIT 1')
+            row = cursor.fetchone()
+        return Info(*row) if row else None
+
+    def save(self, name, designation, mobileno, email, city):
+        """Update the row, or insert it if there is none yet (one transaction); returns a Future."""
+        values = (name, designation, mobileno, email, city)
+
+        def _upsert(cursor):
+            cursor.execute('UPDATE info SET name=?, designation=?, mobileno=?, email=?, city=?', values)
+            if cursor.rowcount == 0:
+                cursor.execute('INSERT INTO info (name, designation, mobileno, email, city) VALUES (?, ?, ?, ?, ?)',
+                               values)
+            return Info(*values)
+
+        return self._write(_upsert)
+
+
+# Global repositories on the shared connection pool
+contacts = ContactRepository()
+sys_commands = CommandRepository('sys_command', 'path')
+web_commands = CommandRepository('web_command', 'url')
+personal_info = InfoRepository()
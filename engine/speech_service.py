@@ -0,0 +1,135 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from engine import config as config_module
+
+
+def whisper_language(lang):
+    """Map a recognizer language code ('en-IN', 'auto') to a Whisper language ('en', None)."""
+    if not lang or str(lang).lower() in ('auto', 'detect'):
+        return None
+    return str(lang).split('-')[0].lower()
+
+
+def audio_to_float32(audio, sample_rate=16000):
+    """Convert a speech_recognition AudioData to the mono float32 waveform Whisper expects.
+
+    The captured frames are resampled to 16-bit `sample_rate` PCM in memory, so
+    no WAV file is written and no ffmpeg process is spawned.
+    """
+    import numpy as np
+    raw = audio.get_raw_data(convert_rate=sample_rate, convert_width=2)
+    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
+def _default_model_factory(model_size, device):
+    from faster_whisper import WhisperModel
+    return WhisperModel(model_size, device=device)
+
+
+class SpeechService:
+    """Resident Whisper transcriber.
+
+    start() loads the model on a background worker thread and runs a warm-up
+    decode on a second of silence, so the first real utterance doesn't pay for
+    model load. Requests are queued to the same worker (submit/transcribe) and
+    answered through futures; status() reports readiness and timings.
+    """
+
+    def __init__(self, model_size='small', device='cpu', model_factory=_default_model_factory):
+        self.model_size = model_size
+        self.device = device
+        self._model_factory = model_factory
+        self._requests = queue.Queue()
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._model = None
+        self._status = {'state': 'stopped', 'load_seconds': None, 'warmup_seconds': None,
+                        'error': None, 'requests': 0}
+
+    def start(self):
+        """Start loading the model in the background (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._status['state'] = 'loading'
+            self._thread = threading.Thread(target=self._run, name='speech-service', daemon=True)
+            self._thread.start()
+
+    def _load(self):
+        t0 = time.time()
+        try:
+            self._model = self._model_factory(self.model_size, self.device)
+        except Exception as e:
+            self._status.update(state='unavailable', error=str(e))
+            print(f"SpeechService: Whisper model unavailable: {e}")
+            return False
+        self._status['load_seconds'] = round(time.time() - t0, 3)
+
+        t1 = time.time()
+        try:
+            import numpy as np
+            segments, _ = self._model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1, language='en')
+            list(segments)
+        except Exception as e:
+            print(f"SpeechService: warm-up decode failed: {e}")
+        self._status['warmup_seconds'] = round(time.time() - t1, 3)
+        self._status['state'] = 'ready'
+        print(f"SpeechService: Whisper '{self.model_size}' ready (load={self._status['load_seconds']}s, warmup={self._status['warmup_seconds']}s)")
+        return True
+
+    def _run(self):
+        loaded = self._load()
+        self._ready.set()
+        while True:
+            audio, language, future = self._requests.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if not loaded:
+                future.set_exception(RuntimeError('Whisper model unavailable'))
+                continue
+            try:
+                segments, _ = self._model.transcribe(audio, beam_size=5, language=whisper_language(language))
+                future.set_result(' '.join(s.text.strip() for s in segments).strip())
+            except Exception as e:
+                future.set_exception(e)
+
+    def is_ready(self):
+        return self._status['state'] == 'ready'
+
+    def is_available(self):
+        """False once loading has failed (e.g. faster-whisper not installed)."""
+        return self._status['state'] != 'unavailable'
+
+    def wait_ready(self, timeout=None):
+        """Block until loading finished; True if the model is usable."""
+        self.start()
+        self._ready.wait(timeout)
+        return self.is_ready()
+
+    def status(self):
+        return dict(self._status)
+
+    def submit(self, audio, language=None):
+        """Queue a transcription request; returns a Future resolving to the text."""
+        self.start()
+        future = Future()
+        self._status['requests'] += 1
+        self._requests.put((audio, language, future))
+        return future
+
+    def transcribe(self, audio, language=None, timeout=None):
+        """Transcribe audio (path or float32 array) and return the text."""
+        return self.submit(audio, language).result(timeout)
+
+
+# Global speech service (started from main.start so the model is warm before the first utterance)
+speech_service = SpeechService(
+    model_size=getattr(config_module, 'WHISPER_MODEL_SIZE', 'small'),
+    device=getattr(config_module, 'WHISPER_DEVICE', 'cpu'),
+)
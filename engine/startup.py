@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StartupOrchestrator:
+    """Runs independent initialization stages concurrently and times them.
+
+    Stages are registered with add() and all start together on run(). Callers
+    only wait() for the stages they actually need (e.g. the port before the
+    UI server starts), so slow ones such as model warm-up finish while the UI
+    is already usable. status() is what the UI polls for readiness.
+    """
+
+    def __init__(self, max_workers=6):
+        self.max_workers = max_workers
+        self._stages = {}
+        self._order = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._t0 = None
+        self._all_done = threading.Event()
+
+    def add(self, name, func):
+        """Register a stage; `func()` runs on a worker thread and its return value is kept."""
+        with self._lock:
+            if name in self._stages:
+                raise ValueError(f"duplicate startup stage: {name}")
+            self._stages[name] = {'func': func, 'state': 'pending', 'started': None, 'seconds': None,
+                                  'error': None, 'result': None, 'done': threading.Event()}
+            self._order.append(name)
+
+    def run(self):
+        """Start every registered stage at once (non-blocking)."""
+        self._t0 = time.perf_counter()
+        if not self._order:
+            self._all_done.set()
+            return self
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='startup')
+        for name in self._order:
+            self._executor.submit(self._run_stage, name)
+        self._executor.shutdown(wait=False)
+        return self
+
+    def _run_stage(self, name):
+        stage = self._stages[name]
+        start = time.perf_counter()
+        stage.update(state='running', started=round(start - self._t0, 3))
+        try:
+            stage['result'] = stage['func']()
+            stage['state'] = 'ok'
+        except Exception as e:
+            stage.update(state='failed', error=str(e))
+            print(f"Startup stage '{name}' failed: {e}")
+        stage['seconds'] = round(time.perf_counter() - start, 3)
+        stage['done'].set()
+        with self._lock:
+            finished = not self._all_done.is_set() and all(s['done'].is_set() for s in self._stages.values())
+            if finished:
+                self._all_done.set()
+        if finished:
+            print(self.summary())
+
+    def wait(self, name, timeout=None):
+        """Block until stage `name` finished; returns its result (None if it failed)."""
+        stage = self._stages[name]
+        stage['done'].wait(timeout)
+        return stage['result']
+
+    def is_ready(self, name=None):
+        if name is None:
+            return self._all_done.is_set()
+        return self._stages[name]['state'] == 'ok'
+
+    def status(self):
+        """Readiness and per-stage state/timings (seconds since run() and duration)."""
+        stages = {}
+        for name in self._order:
+            s = self._stages[name]
+            stages[name] = {'state': s['state'], 'started': s['started'], 'seconds': s['seconds'], 'error': s['error']}
+        elapsed = round(time.perf_counter() - self._t0, 3) if self._t0 is not None else None
+        return {'ready': self._all_done.is_set(), 'elapsed': elapsed, 'stages': stages}
+
+    def summary(self):
+        lines = ['startup stages:']
+        for name, s in self.status()['stages'].items():
+            took = f"{s['seconds']:.3f}s" if s['seconds'] is not None else '...'
+            lines.append(f"  {name:<10} {s['state']:<8} start=+{s['started'] or 0:.3f}s took={took}")
+        return '\n'.join(lines)
+
+
+# Global orchestrator for the UI process (stages are added in main.start)
+startup = StartupOrchestrator()
@@ -0,0 +1,145 @@
+import collections
+
+import numpy as np
+
+
+class StreamingTranscriber:
+    """Incremental recognizer over raw 16-bit mono PCM chunks.
+
+    feed() is called with every chunk read from the microphone. Once the energy
+    rises above `energy_threshold` an utterance starts; while it lasts, the last
+    `window_seconds` of audio are decoded every `partial_interval` seconds and
+    the hypothesis is passed to `on_partial`. When `pause_seconds` of silence
+    follow the speech (or `max_seconds` is reached) the utterance is committed
+    and feed() returns the final text.
+
+    `submit(samples)` must return a Future resolving to the text for a float32
+    16 kHz buffer (see SpeechService.submit); partial decodes never block feed().
+    """
+
+    def __init__(self, submit, sample_rate=16000, energy_threshold=300, pause_seconds=0.8,
+                 partial_interval=0.6, window_seconds=8.0, max_seconds=15.0,
+                 preroll_seconds=0.3, on_partial=None):
+        self._submit = submit
+        self.sample_rate = sample_rate
+        self.energy_threshold = energy_threshold
+        self.pause_seconds = pause_seconds
+        self.partial_interval = partial_interval
+        self.window_seconds = window_seconds
+        self.max_seconds = max_seconds
+        self.preroll_seconds = preroll_seconds
+        self.on_partial = on_partial
+        self._preroll = collections.deque()
+        self._preroll_samples = 0
+        self._chunks = []
+        self._samples = 0
+        self._silence = 0.0
+        self._since_partial = 0.0
+        self._pending = None
+        self._partial_text = ''
+        self._partial_covers = 0
+        self.speaking = False
+        self.last_utterance = b''
+
+    def _to_float(self, pcm):
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        samples *= 1.0 / 32768.0
+        return samples
+
+    def _collect_partial(self):
+        if self._pending is not None and self._pending.done():
+            future, covers = self._pending
+            self._pending = None
+            try:
+                text = future.result()
+            except Exception as e:
+                print(f"StreamingTranscriber: partial decode failed: {e}")
+                return
+            self._partial_text, self._partial_covers = text, covers
+            if text and self.on_partial:
+                try:
+                    self.on_partial(text)
+                except Exception:
+                    pass
+
+    def _start_partial(self):
+        pcm = b''.join(self._chunks)
+        window_bytes = int(self.window_seconds * self.sample_rate) * 2
+        self._pending = _Pending(self._submit(self._to_float(pcm[-window_bytes:])), self._samples)
+        self._since_partial = 0.0
+
+    def feed(self, chunk):
+        """Consume one PCM chunk; returns the final text when the utterance ends, else None."""
+        chunk_samples = len(chunk) // 2
+        duration = chunk_samples / float(self.sample_rate)
+        rms = float(np.sqrt(np.mean(np.square(np.frombuffer(chunk, dtype=np.int16), dtype=np.float64)))) if chunk_samples else 0.0
+        voiced = rms > self.energy_threshold
+
+        if not self.speaking:
+            # keep a little audio from before the onset so the first syllable isn't clipped
+            self._preroll.append(chunk)
+            self._preroll_samples += chunk_samples
+            while len(self._preroll) > 1 and self._preroll_samples - len(self._preroll[0]) // 2 >= self.preroll_seconds * self.sample_rate:
+                self._preroll_samples -= len(self._preroll.popleft()) // 2
+            if not voiced:
+                return None
+            self.speaking = True
+            self._chunks = list(self._preroll)
+            self._samples = self._preroll_samples
+            self._preroll.clear()
+            self._preroll_samples = 0
+        else:
+            self._chunks.append(chunk)
+            self._samples += chunk_samples
+
+        self._silence = 0.0 if voiced else self._silence + duration
+        self._since_partial += duration
+        self._collect_partial()
+
+        if self._silence >= self.pause_seconds or self._samples >= self.max_seconds * self.sample_rate:
+            return self._commit()
+        if self._pending is None and self._since_partial >= self.partial_interval:
+            self._start_partial()
+        return None
+
+    def _commit(self):
+        pcm = b''.join(self._chunks)
+        speech_end = self._samples - int(self._silence * self.sample_rate)
+        window_samples = int(self.window_seconds * self.sample_rate)
+        if self._pending is not None:
+            try:
+                self._pending.future.result()
+            except Exception:
+                pass
+            self._collect_partial()
+        # Reuse the latest partial when it already saw all of the speech (only silence followed)
+        if self._partial_text and self._partial_covers >= speech_end and self._samples <= window_samples:
+            text = self._partial_text
+        else:
+            text = self._submit(self._to_float(pcm)).result()
+        self._reset()
+        self.last_utterance = pcm
+        return text
+
+    def finish(self):
+        """Force-commit a started utterance (e.g. on timeout); returns '' if none was started."""
+        if not self.speaking:
+            return ''
+        return self._commit()
+
+    def _reset(self):
+        self.speaking = False
+        self._chunks = []
+        self._samples = 0
+        self._silence = 0.0
+        self._since_partial = 0.0
+        self._pending = None
+        self._partial_text = ''
+        self._partial_covers = 0
+
+
+class _Pending(collections.namedtuple('_Pending', 'future covers')):
+    """An in-flight partial decode and how many utterance samples it was given."""
+
+    def done(self):
+        return self.future.done()
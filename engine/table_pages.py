@@ -0,0 +1,143 @@
+import collections
+import threading
+
+# Tables the settings page can browse: columns returned (id first) and columns searched
+TABLES = {
+    'sys_command': (('id', 'name', 'path'), ('name', 'path')),
+    'web_command': (('id', 'name', 'url'), ('name', 'url')),
+    'contacts': (('id', 'name', 'mobile_no', 'email', 'address'), ('name', 'mobile_no', 'email')),
+}
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+class ChangeTracker:
+    """Per-table change log the settings page polls with a cursor.
+
+    Every write records (version, op, row id). A client that last saw
+    version N asks for changes_since(table, N) and gets just the touched ids;
+    if its cursor is older than the retained log (or a bulk change called
+    reset()), it is told to reload instead.
+    """
+
+    def __init__(self, max_log=500):
+        self.max_log = max_log
+        self._lock = threading.Lock()
+        self._versions = collections.defaultdict(int)
+        # version below which the log is incomplete (bulk changes, trimmed entries)
+        self._floor = collections.defaultdict(int)
+        self._logs = collections.defaultdict(collections.deque)
+
+    def version(self, table):
+        with self._lock:
+            return self._versions[table]
+
+    def record(self, table, op, row_id):
+        """Log an 'upsert' or 'delete' of `row_id`; returns the new version."""
+        with self._lock:
+            self._versions[table] += 1
+            version = self._versions[table]
+            log = self._logs[table]
+            log.append((version, op, row_id))
+            if len(log) > self.max_log:
+                self._floor[table] = log.popleft()[0]
+            return version
+
+    def reset(self, table):
+        """Mark a change too large to describe row by row (e.g. a bulk import)."""
+        with self._lock:
+            self._versions[table] += 1
+            self._floor[table] = self._versions[table]
+            self._logs[table].clear()
+            return self._versions[table]
+
+    def changes_since(self, table, since):
+        """Return (version, {'upsert': ids, 'delete': ids}), or (version, None) if the client must reload."""
+        with self._lock:
+            version = self._versions[table]
+            try:
+                since = int(since)
+            except (TypeError, ValueError):
+                return version, None
+            if since < self._floor[table] or since > version:
+                return version, None
+            latest = {}
+            for v, op, row_id in self._logs[table]:
+                if v > since:
+                    latest[str(row_id)] = (op, row_id)
+        changes = {'upsert': [], 'delete': []}
+        for op, row_id in latest.values():
+            changes[op].append(row_id)
+        return version, changes
+
+
+def _table(table):
+    if table not in TABLES:
+        raise ValueError(f"unknown table: {table}")
+    return TABLES[table]
+
+
+def _search_clause(search_columns, search):
+    search = (search or '').strip().lower()
+    if not search:
+        return '', ()
+    pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    clause = ' WHERE ' + ' OR '.join(f"LOWER({c}) LIKE ? ESCAPE '\\'" for c in search_columns)
+    return clause, (pattern,) * len(search_columns)
+
+
+def _default_db():
+    from engine.thread_safe_db import thread_safe_db
+    return thread_safe_db
+
+
+def fetch_page(table, offset=0, limit=DEFAULT_LIMIT, search='', db=None, tracker=None):
+    """One page of `table` ordered by id, optionally filtered by a search term.
+
+    Returns {'rows', 'total', 'offset', 'limit', 'cursor'}; pass `cursor` to
+    fetch_changes() afterwards to get only what changed.
+    """
+    columns, search_columns = _table(table)
+    tracker = tracker or change_tracker
+    offset = max(0, int(offset or 0))
+    limit = min(MAX_LIMIT, max(1, int(limit or DEFAULT_LIMIT)))
+    where, params = _search_clause(search_columns, search)
+    # read the cursor first: a write landing during the query shows up again as a change
+    cursor_version = tracker.version(table)
+    with (db or _default_db()).get_connection() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}{where}", params)
+        total = cursor.fetchone()[0]
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY id LIMIT ? OFFSET ?",
+                       params + (limit, offset))
+        rows = [list(r) for r in cursor.fetchall()]
+    return {'rows': rows, 'total': total, 'offset': offset, 'limit': limit, 'cursor': cursor_version}
+
+
+def fetch_changes(table, since, db=None, tracker=None):
+    """Rows changed since `since`: {'cursor', 'reset', 'upserted', 'deleted', 'total'}.
+
+    'reset' is True when the client should reload its page with fetch_page().
+    """
+    columns, _ = _table(table)
+    tracker = tracker or change_tracker
+    version, changes = tracker.changes_since(table, since)
+    result = {'cursor': version, 'reset': changes is None, 'upserted': [], 'deleted': []}
+    with (db or _default_db()).get_connection() as cursor:
+        if changes is not None:
+            result['deleted'] = changes['delete']
+            ids = changes['upsert']
+            if ids:
+                marks = ', '.join('?' * len(ids))
+                cursor.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE id IN ({marks}) ORDER BY id", ids)
+                result['upserted'] = [list(r) for r in cursor.fetchall()]
+                found = {str(r[0]) for r in result['upserted']}
+                # rows inserted and deleted again in between
+                result['deleted'] += [i for i in ids if str(i) not in found]
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        result['total'] = cursor.fetchone()[0]
+    return result
+
+
+# Global change log for the settings tables (written by the add/delete endpoints)
+change_tracker = ChangeTracker()
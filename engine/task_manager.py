@@ -5,6 +5,7 @@ import queue
 from concurrent.futures import ThreadPoolExecutor, as_completed, wait, ALL_COMPLETED
 from engine.command import speak
 from engine.features import openCommand, PlayYoutube, findContact, whatsApp, makeCall, sendMessage, geminai, chatBot
+from engine.intent_router import classify
 import eel
 
 class TaskManager:
@@ -33,49 +34,31 @@ class TaskManager:
 
             start_t = time.time()
             print(f"Executing command: '{command}' [thread={threading.current_thread().name}] start={start_t}")
-            command_lower = (command or '').lower()
+            intent = classify(command, cmd_obj.get('type') if cmd_obj else None)
             
-            if "open" in command_lower and "youtube" in command_lower:
+            if intent.name == 'open_youtube':
                 # Handle "open youtube" command
                 result = openCommand(command)
                 if result:
                     print(f"Successfully executed: {command}")
                 else:
                     print(f"Failed to execute: {command}")
-            elif command_lower.startswith('open_and_type') or 'open_and_type' in command_lower:
-                # Expect command in form: 'open X and type Y' -> try open then type
+            elif intent.name == 'open_and_type':
+                # Expect command in form: 'open X and type Y' -> try open then type.
+                # Structured commands carry the full text in 'original'.
                 try:
+                    combined = (cmd_obj.get('original') or cmd_obj.get('query')) if cmd_obj else command
                     # Best-effort: find the 'type' portion
-                    parts = command.split(' and ', 1)
-                    open_part = parts[0] if parts else command
-                    type_part = parts[1] if len(parts) > 1 else ''
-                    if open_part:
-                        openCommand(open_part)
-                    if type_part:
-                        # Delegate to notepad-typing helper if it looks like notepad
-                        try:
-                            from engine.features import openNotepadAndType
-                            # Strip leading verbs
-                            t = re.sub(r'^(type|write)\s+', '', type_part.strip(), flags=re.IGNORECASE)
-                            openNotepadAndType(t)
-                        except Exception:
-                            print('open_and_type: typing helper failed')
-                    print(f"Successfully executed: {command}")
-                except Exception as e:
-                    print(f"Error in open_and_type: {e}")
-            elif cmd_obj and cmd_obj.get('type') == 'open_and_type':
-                # Structured open_and_type command: open the app then type
-                try:
-                    combined = cmd_obj.get('original') or cmd_obj.get('query')
-                    # Split into open and type portion
                     parts = combined.split(' and ', 1)
                     open_part = parts[0] if parts else combined
                     type_part = parts[1] if len(parts) > 1 else ''
                     if open_part:
                         openCommand(open_part)
                     if type_part:
+                        # Delegate to notepad-typing helper if it looks like notepad
                         try:
                             from engine.features import openNotepadAndType
+                            # Strip leading verbs
                             t = re.sub(r'^(type|write)\s+', '', type_part.strip(), flags=re.IGNORECASE)
                             openNotepadAndType(t)
                         except Exception:
@@ -83,23 +66,23 @@ class TaskManager:
                     print(f"Successfully executed: {command}")
                 except Exception as e:
                     print(f"Error in open_and_type: {e}")
-            elif "play" in command_lower and ("youtube" in command_lower or "on youtube" in command_lower):
+            elif intent.name == 'play_youtube':
                 # Handle "play song on youtube" command
                 result = PlayYoutube(command)
                 if result:
                     print(f"Successfully executed: {command}")
                 else:
                     print(f"Failed to execute: {command}")
-            elif "open" in command_lower:
+            elif intent.name == 'open':
                 # Handle other open commands
                 result = openCommand(command)
                 if result:
                     print(f"Successfully executed: {command}")
                 else:
                     print(f"Failed to execute: {command}")
-            elif "send message" in command_lower or "phone call" in command_lower or "video call" in command_lower:
+            elif intent.name == 'contact':
                 # Handle messaging and calls - check if it's a Telegram/WhatsApp command first
-                if "telegram" in command_lower or "whatsapp" in command_lower:
+                if intent.has('telegram', 'whatsapp'):
                     # This is handled by execute_complex_command for Telegram/WhatsApp
                     try:
                         from engine.features import execute_complex_command
@@ -115,14 +98,14 @@ class TaskManager:
                 if contact_no != 0:
                     # In multitasking mode, use mobile by default to avoid blocking
                     # Don't ask for user input in parallel execution
-                    if "send message" in command_lower or "send sms" in command_lower:
+                    if intent.has('send message', 'send sms'):
                         sendMessage("Hello from Jarvis", contact_no, name)
-                    elif "phone call" in command_lower:
+                    elif intent.has('phone call'):
                         makeCall(name, contact_no)
                     print(f"Successfully executed: {command}")
                 else:
                     print(f"Contact not found for: {command}")
-            elif "telegram" in command_lower and ("send" in command_lower or "message" in command_lower):
+            elif intent.name == 'telegram':
                 # Handle Telegram messaging commands directly
                 try:
                     from engine.features import execute_complex_command
@@ -159,12 +142,9 @@ class TaskManager:
         
         total_commands = len(commands)
         print(f"[TaskManager] Processing {total_commands} commands simultaneously")
-        # Run speak in a separate thread to avoid blocking the task manager
-        try:
-            print("[TaskManager] Speaking announcement (non-blocking)")
-            threading.Thread(target=speak, args=(f"Executing {total_commands} commands",), daemon=True).start()
-        except Exception as e:
-            print(f"[TaskManager] Failed to start speak thread: {e}")
+        # Queue the announcement without blocking the task manager
+        print("[TaskManager] Speaking announcement (non-blocking)")
+        speak(f"Executing {total_commands} commands", wait=False, key='task-status')
 
         # Detect GUI-sensitive tasks that involve typing or notepad; these should run sequentially
         def _is_gui_sensitive(cmd):
@@ -359,10 +339,11 @@ class TaskManager:
 
         total_success = completed_tasks + gui_success + seq_success
         print(f"[TaskManager] All tasks completed. {total_success} out of {total_commands} successful")
+        # Supersedes the "Executing ..." announcement if that hasn't been spoken yet
         if total_success == total_commands:
-            speak(f"Successfully completed all {total_commands} tasks")
+            speak(f"Successfully completed all {total_commands} tasks", wait=False, key='task-status')
         else:
-            speak(f"Completed {total_success} out of {total_commands} tasks")
+            speak(f"Completed {total_success} out of {total_commands} tasks", wait=False, key='task-status')
     
     def parse_multiple_commands(self, query):
         """Parse a query to extract multiple commands"""
@@ -0,0 +1,227 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+
+def _default_client_factory():
+    """Build a Telethon client from TELEGRAM_API_ID / TELEGRAM_API_HASH / TELEGRAM_SESSION."""
+    api_id = os.environ.get('TELEGRAM_API_ID')
+    api_hash = os.environ.get('TELEGRAM_API_HASH')
+    session = os.environ.get('TELEGRAM_SESSION', 'jarvis_telegram')
+    if not api_id or not api_hash:
+        raise RuntimeError('Telethon credentials not set (TELEGRAM_API_ID/TELEGRAM_API_HASH)')
+    from telethon import TelegramClient
+    return TelegramClient(session, int(api_id), api_hash)
+
+
+class TelegramSessionManager:
+    """One long-lived, authenticated Telegram client on a background event loop.
+
+    send() queues a message and returns a Future. The worker drains whatever
+    is queued within `batch_window` seconds, groups it per peer, resolves each
+    peer's entity once and sends its messages in order. A dropped connection is
+    re-established with exponential backoff; stats() reports send latency
+    (enqueue to delivery) and connection counters.
+    """
+
+    def __init__(self, client_factory=_default_client_factory, batch_window=0.05, max_batch=20,
+                 backoff_initial=1.0, backoff_max=30.0, max_connect_attempts=5):
+        self._client_factory = client_factory
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.max_connect_attempts = max_connect_attempts
+        self._client = None
+        self._loop = None
+        self._queue = None
+        self._thread = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {'sent': 0, 'failed': 0, 'batches': 0, 'connects': 0, 'reconnects': 0,
+                       'entity_lookups': 0, 'last_ms': None, 'max_ms': 0.0, 'total_ms': 0.0}
+
+    def start(self):
+        """Start the background loop (idempotent); connecting happens on the first send."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='telegram-session', daemon=True)
+            self._thread.start()
+        self._started.wait()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        worker = self._loop.create_task(self._worker())
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            worker.cancel()
+            self._loop.run_until_complete(asyncio.gather(worker, return_exceptions=True))
+            self._loop.close()
+
+    def send(self, peer, message):
+        """Queue a message for `peer`; the Future resolves to True once delivered."""
+        self.start()
+        future = Future()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (peer, message, future, time.perf_counter()))
+        return future
+
+    def send_sync(self, peer, message, timeout=60):
+        """Send and wait; on timeout the message is withdrawn if it hasn't gone out yet."""
+        future = self.send(peer, message)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def _connect(self):
+        delay = self.backoff_initial
+        for attempt in range(1, self.max_connect_attempts + 1):
+            try:
+                if self._client is None:
+                    self._client = self._client_factory()
+                await self._client.connect()
+                if not await self._client.is_user_authorized():
+                    # start() would prompt on stdin from this background thread and hang the worker
+                    raise RuntimeError('Telegram session not authorized; run '
+                                       '"python -m engine.telegram_session" once to log in')
+                self._stats['connects'] += 1
+                return self._client
+            except Exception as e:
+                # Login problems (2FA password, bad credentials) won't fix themselves by retrying
+                if type(e).__name__ == 'SessionPasswordNeededError' or isinstance(e, (RuntimeError, ImportError)):
+                    raise
+                if attempt == self.max_connect_attempts:
+                    raise
+                print(f"Telegram connect failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.backoff_max)
+                self._stats['reconnects'] += 1
+
+    async def _ensure_client(self):
+        client = self._client
+        if client is not None and client.is_connected():
+            return client
+        return await self._connect()
+
+    async def _next_batch(self):
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self):
+        while True:
+            batch = await self._next_batch()
+            self._stats['batches'] += 1
+            by_peer = {}
+            for item in batch:
+                by_peer.setdefault(item[0], []).append(item)
+            for peer, items in by_peer.items():
+                await self._send_to_peer(peer, items)
+
+    async def _send_to_peer(self, peer, items):
+        entity = None
+        for _, message, future, queued_at in items:
+            # skips messages whose sender gave up waiting (send_sync timeout)
+            if not future.set_running_or_notify_cancel():
+                continue
+            for attempt in (1, 2):
+                try:
+                    client = await self._ensure_client()
+                    if entity is None:
+                        entity = await client.get_input_entity(peer)
+                        self._stats['entity_lookups'] += 1
+                    await client.send_message(entity, message)
+                    self._record(queued_at, ok=True)
+                    future.set_result(True)
+                    break
+                except (ConnectionError, OSError) as e:
+                    if attempt == 2:
+                        self._record(queued_at, ok=False)
+                        future.set_exception(e)
+                    else:
+                        # drop the dead connection and retry once on a fresh one
+                        print(f"Telegram connection lost ({e}); reconnecting")
+                        self._stats['reconnects'] += 1
+                        await self._disconnect()
+                except Exception as e:
+                    self._record(queued_at, ok=False)
+                    future.set_exception(e)
+                    break
+
+    def _record(self, queued_at, ok):
+        ms = (time.perf_counter() - queued_at) * 1000.0
+        stats = self._stats
+        stats['sent' if ok else 'failed'] += 1
+        stats['last_ms'] = round(ms, 1)
+        stats['max_ms'] = max(stats['max_ms'], ms)
+        stats['total_ms'] += ms
+
+    async def _disconnect(self):
+        client = self._client
+        if client is not None:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+
+    def stats(self):
+        """Send counters and latency (ms) from enqueue to delivery."""
+        stats = dict(self._stats)
+        done = stats['sent'] + stats['failed']
+        stats['avg_ms'] = round(stats.pop('total_ms') / done, 1) if done else None
+        stats['max_ms'] = round(stats['max_ms'], 1)
+        stats['connected'] = bool(self._client is not None and self._client.is_connected())
+        return stats
+
+    def stop(self, timeout=5):
+        """Disconnect the client and stop the background loop."""
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._disconnect(), self._loop).result(timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._client = None
+        with self._lock:
+            self._thread = None
+            self._loop = None
+            self._started.clear()
+
+
+async def _authorize(client_factory):
+    client = client_factory()
+    # prompts for the phone number and login code (and 2FA password if set)
+    await client.start()
+    await client.disconnect()
+
+
+def main():
+    """Interactive one-time login that creates the session file the assistant reuses."""
+    asyncio.run(_authorize(_default_client_factory))
+    print('Telegram session authorized')
+
+
+# Global session manager used by send_telegram
+telegram_session = TelegramSessionManager()
+
+
+if __name__ == '__main__':
+    main()
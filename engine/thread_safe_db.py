@@ -1,7 +1,167 @@
+import queue
 import sqlite3
 import threading
 from contextlib import contextmanager
 
+DB_PATH = "jarvis.db"
+
+
+class ConnectionPool:
+    """Bounded pool of reusable SQLite connections.
+
+    Connections are opened lazily up to `max_size`, configured once (WAL,
+    busy timeout, statement cache) and handed back to the pool after each use.
+    A thread that re-enters get_connection() gets the connection it already holds.
+    """
+
+    def __init__(self, db_path=DB_PATH, max_size=16, timeout=10.0, cached_statements=256):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._idle = queue.LifoQueue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._stats = {'created': 0, 'reused': 0, 'waits': 0, 'in_use': 0}
+
+    def _create(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.DatabaseError as e:
+            print(f"ConnectionPool: could not enable WAL on {self.db_path}: {e}")
+        return conn
+
+    def _acquire(self):
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self._stats['reused'] += 1
+            return conn
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_create = self._opened < self.max_size
+            if can_create:
+                # reserve the slot before connecting so the bound holds under contention
+                self._opened += 1
+            else:
+                self._stats['waits'] += 1
+        if can_create:
+            try:
+                conn = self._create()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+            with self._lock:
+                self._stats['created'] += 1
+            return conn
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(f"no pooled connection available after {self.timeout}s")
+        with self._lock:
+            self._stats['reused'] += 1
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of the block (re-entrant per thread)."""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        with self._lock:
+            self._stats['in_use'] += 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            with self._lock:
+                self._stats['in_use'] -= 1
+            self._idle.put(conn)
+
+    def depth(self):
+        """How many connection() blocks this thread is inside (0 when it holds no connection)."""
+        return getattr(self._local, 'depth', 0)
+
+    def stats(self):
+        """Return a snapshot of pool usage counters."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot['open'] = self._opened
+        snapshot['idle'] = self._idle.qsize()
+        snapshot['max_size'] = self.max_size
+        return snapshot
+
+    def close_all(self):
+        """Close the idle connections; checked-out ones are returned to the pool as usual."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self._lock:
+                self._opened -= 1
+
+
+@contextmanager
+def pooled_cursor(pool):
+    """Cursor on this thread's pooled connection.
+
+    The outermost block commits on success and rolls back on error. A nested
+    block runs inside a savepoint of the outer transaction, so if it raises
+    only its own writes are undone, even when the outer block catches the
+    error and commits.
+    """
+    with pool.connection() as conn:
+        depth = pool.depth()
+        savepoint = f'pooled_cursor_{depth}'
+        if depth == 1:
+            if conn.in_transaction:
+                # left open by an earlier user of this connection; don't let it leak into this block
+                print(f"ConnectionPool: rolling back a transaction left open on {pool.db_path}")
+                conn.rollback()
+        else:
+            if not conn.in_transaction:
+                # releasing an outermost savepoint would commit; keep the outer block in charge
+                conn.execute('BEGIN')
+            conn.execute(f'SAVEPOINT {savepoint}')
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            if depth == 1:
+                conn.commit()
+            else:
+                conn.execute(f'RELEASE {savepoint}')
+        except Exception as e:
+            if depth == 1:
+                conn.rollback()
+            elif conn.in_transaction:
+                conn.execute(f'ROLLBACK TO {savepoint}')
+                conn.execute(f'RELEASE {savepoint}')
+            raise e
+        finally:
+            cursor.close()
+
+
 class ThreadSafeDB:
     _instance = None
     _lock = threading.Lock()
@@ -10,80 +170,83 @@ class ThreadSafeDB:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+                    instance = super().__new__(cls)
+                    # Sized above the TaskManager's 15 workers plus the UI thread
+                    instance.pool = ConnectionPool(DB_PATH, max_size=16)
+                    cls._instance = instance
         return cls._instance
     
-    @contextmanager
     def get_connection(self):
-        """Get a thread-safe database connection"""
-        conn = sqlite3.connect("jarvis.db", check_same_thread=False)
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """Get a thread-safe database cursor backed by a pooled connection"""
+        return pooled_cursor(self.pool)
+
+    def get_stats(self):
+        """Pool statistics (connections created/reused, waits, in use, idle)."""
+        return self.pool.stats()
 
 # Global thread-safe database instance
 thread_safe_db = ThreadSafeDB()
 
 def get_system_command(app_name):
-    """Get system command path safely"""
-    with thread_safe_db.get_connection() as cursor:
-        try:
-            cursor.execute('SELECT path FROM sys_command WHERE LOWER(name)=?', (app_name.lower(),))
-            results = cursor.fetchall()
-            if results:
-                return results[0][0]
-        except Exception:
-            pass
+    """Get system command path (served from the in-memory command registry)"""
+    from engine.command_registry import command_registry
+    try:
+        return command_registry.get_system(app_name)
+    except Exception:
         return None
 
 def get_web_command(app_name):
-    """Get web command URL safely"""
-    with thread_safe_db.get_connection() as cursor:
-        try:
-            cursor.execute('SELECT url FROM web_command WHERE LOWER(name)=?', (app_name.lower(),))
-            results = cursor.fetchall()
-            if results:
-                return results[0][0]
-        except Exception:
-            pass
+    """Get web command URL (served from the in-memory command registry)"""
+    from engine.command_registry import command_registry
+    try:
+        return command_registry.get_web(app_name)
+    except Exception:
         return None
 
 
 def get_all_system_names():
     """Return a list of all names registered in sys_command"""
-    with thread_safe_db.get_connection() as cursor:
-        cursor.execute('SELECT name FROM sys_command')
-        results = cursor.fetchall()
-        return [r[0] for r in results if r and r[0]]
+    from engine.command_registry import command_registry
+    return command_registry.system_names()
 
 
 def get_all_web_names():
     """Return a list of all names registered in web_command"""
-    with thread_safe_db.get_connection() as cursor:
-        cursor.execute('SELECT name FROM web_command')
-        results = cursor.fetchall()
-        return [r[0] for r in results if r and r[0]]
+    from engine.command_registry import command_registry
+    return command_registry.web_names()
 
 
 def save_system_command(name: str, path: str):
-    """Save a new system command mapping if it doesn't already exist."""
+    """Queue saving a new system command mapping if it doesn't already exist.
+
+    The insert runs on the database writer thread, so the caller doesn't wait
+    for it. Returns the queued write's Future (its result is the new row id,
+    or None if the name turned out to exist already), or None if nothing was
+    queued because the name is empty or already known.
+    """
+    from engine.command_registry import command_registry
+    from engine.db_writer import db_writer
     if not name or not path:
-        return False
+        return None
     name = name.strip()
     path = path.strip()
     try:
-        with thread_safe_db.get_connection() as cursor:
-            cursor.execute('SELECT COUNT(*) FROM sys_command WHERE LOWER(name)=?', (name.lower(),))
-            if cursor.fetchone()[0] == 0:
-                cursor.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', (name, path))
-                return True
+        if command_registry.has_system(name):
+            return None
     except Exception:
         pass
-    return False
 
+    def _insert(cursor):
+        cursor.execute('SELECT COUNT(*) FROM sys_command WHERE LOWER(name)=?', (name.lower(),))
+        if cursor.fetchone()[0] != 0:
+            return None
+        cursor.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', (name, path))
+        return cursor.lastrowid
+
+    def _saved(row_id):
+        if row_id is not None:
+            from engine.table_pages import change_tracker
+            command_registry.put_system(name, path)
+            change_tracker.record('sys_command', 'upsert', row_id)
+
+    return db_writer.submit(_insert, on_commit=_saved)
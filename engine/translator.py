@@ -1,57 +1,265 @@
-import requests
-import json
-from engine.command import speak
+import re
+import threading
 
-def translate_text(text, target_language='en'):
-    """
-    Translate text using Google Translate API (free version)
-    """
-    try:
-        # Using Google Translate's free web API
-        url = "https://translate.googleapis.com/translate_a/single"
+from engine.http_client import http_client
+
+CACHE_PATH = "translation_cache.db"
+
+# Common romanized Telugu words (typed or recognized in Latin script)
+TELUGU_INDICATORS = frozenset([
+    'nenu', 'chaala', 'chala', 'bagunnanu', 'bagunnava', 'meeru', 'miru', 'nuvvu', 'naaku', 'naku',
+    'ledu', 'kavali', 'unnaru', 'unnanu', 'cheppu', 'cheppandi', 'enti', 'emiti', 'ekkada', 'garu',
+    'andi', 'vachi', 'vellu', 'velli', 'ippudu', 'repu', 'ninna', 'manchi', 'chesanu', 'chestanu',
+])
+
+# Frequent English words; Latin-script text counts as English when most of its words are here
+ENGLISH_WORDS = frozenset("""
+a about after again all also am an and any are as at back be because been before being but by
+can could day did do does doing done down each even every for from get give go going good got great
+had has have he hello her here him his how i if in into is it its just know last let like little
+look make many me more most much my need new no not now of off on one only or other our out over
+people please right said say see she should so some take tell than thank thanks that the their them
+then there these they thing think this those time to today too two up us use very want was way we
+well were what when where which while who why will with without work would write yes yet you your
+call open send message play song music search find show read type note meeting tomorrow morning
+night home office fine sorry okay ok hi bye love happy sad sure
+""".split())
+
+# Share of English words above which Latin-script text is left untranslated
+ENGLISH_RATIO = 0.5
+
+_WORD_RE = re.compile(r"[a-z]+")
+# Sentence/line boundaries; the separators are kept so the text can be rebuilt as it was
+_SEGMENT_RE = re.compile(r"((?<=[.!?\u0964])\s+|\n+)")
+
+
+def detect_script(text):
+    """Return 'telugu', 'devanagari', 'other' (any other non-Latin letters) or 'latin'."""
+    script = 'latin'
+    for ch in text or '':
+        # ASCII and Latin-1/Extended letters are all 'latin'
+        if ch < '\u0250' or not ch.isalpha():
+            continue
+        if '\u0c00' <= ch <= '\u0c7f':
+            return 'telugu'
+        if '\u0900' <= ch <= '\u097f':
+            return 'devanagari'
+        script = 'other'
+    return script
+
+
+def looks_telugu(text):
+    """True for Telugu script or romanized Telugu words."""
+    if detect_script(text) == 'telugu':
+        return True
+    return any(w in TELUGU_INDICATORS for w in _WORD_RE.findall((text or '').lower()))
+
+
+def looks_english(text):
+    """Cheap local check: most words of the Latin-script text are common English words."""
+    words = _WORD_RE.findall((text or '').lower())
+    if not words:
+        return True
+    return sum(1 for w in words if w in ENGLISH_WORDS) >= ENGLISH_RATIO * len(words)
+
+
+def needs_translation(text):
+    """False only for text that is plain English (so other Latin-script languages still go out)."""
+    if not text or not text.strip():
+        return False
+    if detect_script(text) != 'latin' or looks_telugu(text):
+        return True
+    return not looks_english(text)
+
+
+def split_segments(text):
+    """Split text into [segment, separator, segment, ...] on sentence and line ends."""
+    return _SEGMENT_RE.split(text)
+
+
+class GoogleTranslateBackend:
+    """Google Translate's free web endpoint; a batch is sent as newline-joined text."""
+
+    URL = "https://translate.googleapis.com/translate_a/single"
+
+    def __init__(self, client=None, timeout=10, max_chars=1800):
+        self._client = client
+        self.timeout = timeout
+        self.max_chars = max_chars
+
+    @staticmethod
+    def parse(result):
+        """Join every translated segment of a translate_a/single response."""
+        if not result or not result[0]:
+            return None
+        return ''.join(part[0] for part in result[0] if part and part[0])
+
+    def _request(self, text, target_language):
         params = {
             'client': 'gtx',
             'sl': 'auto',  # auto-detect source language
-            'tl': target_language,  # target language
+            'tl': target_language,
             'dt': 't',
-            'q': text
+            'q': text,
         }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result and len(result) > 0 and len(result[0]) > 0:
-                translated_text = result[0][0][0]
-                return translated_text
-            else:
-                return text
-        else:
-            print(f"Translation API error: {response.status_code}")
+        client = self._client or http_client
+        response = client.get(self.URL, endpoint='translate', params=params, timeout=self.timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"Translation API error: {response.status_code}")
+        translated = self.parse(response.json())
+        if translated is None:
+            raise RuntimeError("Translation API returned no text")
+        return translated
+
+    def translate_batch(self, texts, target_language):
+        """Translate a list of single-line texts, one request per `max_chars` chunk."""
+        results = []
+        chunk = []
+        for text in list(texts) + [None]:
+            if text is not None and (not chunk or len('\n'.join(chunk + [text])) <= self.max_chars):
+                chunk.append(text)
+                continue
+            if chunk:
+                lines = self._request('\n'.join(chunk), target_language).split('\n')
+                if len(lines) != len(chunk):
+                    # the service merged or split lines; fall back to one request per text
+                    lines = [self._request(t, target_language) for t in chunk]
+                results.extend(line.strip() for line in lines)
+            chunk = [text]
+        return results
+
+
+class StubTranslationBackend:
+    """Offline backend for tests: looks texts up in a dict (or calls a function)."""
+
+    def __init__(self, mapping=None):
+        self.mapping = mapping if mapping is not None else {}
+        self.calls = []
+
+    def translate_batch(self, texts, target_language):
+        self.calls.append((list(texts), target_language))
+        if callable(self.mapping):
+            return [self.mapping(t, target_language) for t in texts]
+        return [self.mapping.get(t, t) for t in texts]
+
+
+class TranslationCache:
+    """Persistent (text, target) -> translation store in a small SQLite file."""
+
+    def __init__(self, path=CACHE_PATH):
+        from engine.thread_safe_db import ConnectionPool
+        self.path = path
+        self._pool = ConnectionPool(path, max_size=4)
+        with self._pool.connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS translations ('
+                         'text TEXT NOT NULL, target TEXT NOT NULL, translated TEXT NOT NULL, '
+                         'PRIMARY KEY (text, target))')
+            conn.commit()
+
+    def get_many(self, texts, target):
+        """Return {text: translation} for the texts already cached."""
+        found = {}
+        unique = list(dict.fromkeys(texts))
+        with self._pool.connection() as conn:
+            for i in range(0, len(unique), 500):
+                batch = unique[i:i + 500]
+                marks = ','.join('?' * len(batch))
+                rows = conn.execute(f'SELECT text, translated FROM translations WHERE target = ? AND text IN ({marks})',
+                                    [target] + batch).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, pairs, target):
+        with self._pool.connection() as conn:
+            conn.executemany('INSERT OR REPLACE INTO translations (text, target, translated) VALUES (?, ?, ?)',
+                             [(text, target, translated) for text, translated in pairs])
+            conn.commit()
+
+    def close(self):
+        self._pool.close_all()
+
+
+class Translator:
+    """Sentence-level translation with a persistent cache and batched requests.
+
+    Text is split on sentence and line boundaries; cached sentences are served
+    from the cache and the rest go to the backend in a single batch.
+    """
+
+    def __init__(self, backend=None, cache=None, cache_path=CACHE_PATH):
+        self.backend = backend or GoogleTranslateBackend()
+        self._cache = cache
+        self._cache_path = cache_path
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = TranslationCache(self._cache_path)
+        return self._cache
+
+    def translate(self, text, target_language='en'):
+        """Translate `text`; on any failure the untranslated text is returned."""
+        if not text or not text.strip():
             return text
-            
-    except Exception as e:
-        print(f"Translation error: {e}")
-        return text
+        parts = split_segments(text)
+        # even indexes are segments, odd ones the separators between them
+        segments = [p.strip() for p in parts[::2] if p.strip()]
+        try:
+            known = self.cache.get_many(segments, target_language)
+        except Exception as e:
+            print(f"Translation cache unavailable: {e}")
+            known = {}
+        missing = [s for s in dict.fromkeys(segments) if s not in known]
+        if missing:
+            try:
+                translated = self.backend.translate_batch(missing, target_language)
+            except Exception as e:
+                print(f"Translation error: {e}")
+                return text
+            fresh = list(zip(missing, translated))
+            known.update(fresh)
+            try:
+                self.cache.put_many(fresh, target_language)
+            except Exception as e:
+                print(f"Could not store translations: {e}")
+
+        out = []
+        for i, part in enumerate(parts):
+            if i % 2 or not part.strip():
+                out.append(part)
+            else:
+                lead = part[:len(part) - len(part.lstrip())]
+                trail = part[len(part.rstrip()):]
+                out.append(lead + known.get(part.strip(), part.strip()) + trail)
+        return ''.join(out)
+
+
+# Global translator (the cache file is opened on first use)
+translator = Translator()
+
+
+def translate_text(text, target_language='en'):
+    """
+    Translate text using Google Translate API (free version)
+    """
+    return translator.translate(text, target_language)
+
 
 def detect_and_translate_telugu(text):
     """
     Detect if text is in Telugu and translate to English
     """
-    # Common Telugu words/phrases for detection
-    telugu_indicators = ['nenu', 'chaala', 'bagunnanu', 'నేను', 'చాలా', 'బాగున్నాను']
-    
-    # Check if text contains Telugu indicators
-    text_lower = text.lower()
-    if any(indicator in text_lower for indicator in telugu_indicators):
+    # Plain English needs no round-trip
+    if not needs_translation(text):
+        return text
+    if looks_telugu(text):
         print(f"Detected Telugu text: {text}")
-        translated = translate_text(text, 'en')
-        print(f"Translated to English: {translated}")
-        return translated
-    else:
-        # Try to translate anyway in case it's Telugu
-        translated = translate_text(text, 'en')
-        return translated if translated != text else text
+    translated = translate_text(text, 'en')
+    print(f"Translated to English: {translated}")
+    return translated
 
 # Test the translation
 if __name__ == "__main__":
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+
+VOICE_CACHE_PATH = os.getenv('JARVIS_VOICE_CACHE', 'tts_voice.json')
+PREFERRED_VOICES = ('zira', 'female', 'susan')
+
+
+class HeadlessTTSBackend:
+    """pyttsx3-compatible engine that records what would have been spoken."""
+
+    def __init__(self):
+        self.spoken = []
+        self.properties = {'voices': [], 'voice': None, 'rate': 200, 'volume': 1.0}
+        self._queued = []
+
+    def say(self, text):
+        self._queued.append(text)
+
+    def runAndWait(self):
+        self.spoken.extend(self._queued)
+        self._queued = []
+
+    def stop(self):
+        self._queued = []
+
+    def getProperty(self, name):
+        return self.properties.get(name)
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+
+def _default_backend_factory():
+    if os.environ.get('JARVIS_HEADLESS', '').lower() in ('1', 'true', 'yes'):
+        return HeadlessTTSBackend()
+    import pyttsx3
+    return pyttsx3.init('sapi5' if os.name == 'nt' else None)
+
+
+class TTSEngineManager:
+    """Owns creation and configuration of the speech engine.
+
+    start() triggers initialization on the TTS worker thread at startup so the
+    first reply doesn't pay for it. The chosen voice is remembered in a small
+    JSON file and applied directly on later runs instead of enumerating every
+    installed voice. status() reports readiness, init time and per-utterance
+    latency (queue wait and speaking time) recorded by the pipeline.
+    """
+
+    def __init__(self, backend_factory=_default_backend_factory, voice_cache_path=VOICE_CACHE_PATH,
+                 rate=150, volume=0.85):
+        self._backend_factory = backend_factory
+        self.voice_cache_path = voice_cache_path
+        self.rate = rate
+        self.volume = volume
+        self._engine = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._status = {'state': 'stopped', 'init_seconds': None, 'voice': None, 'voice_cached': False,
+                        'error': None, 'utterances': 0, 'last_wait_ms': None, 'last_speak_ms': None,
+                        'avg_speak_ms': None}
+        self._speak_total_ms = 0.0
+
+    def start(self):
+        """Initialize the engine in the background (on the speech worker thread)."""
+        from engine.tts_pipeline import tts_pipeline
+        if self._status['state'] == 'stopped':
+            self._status['state'] = 'starting'
+        tts_pipeline.start()
+
+    def get(self):
+        """Return the engine, creating it on first use; None if no engine is available."""
+        if self._engine is not None or self._status['state'] == 'unavailable':
+            return self._engine
+        with self._lock:
+            if self._engine is None and self._status['state'] != 'unavailable':
+                self._init()
+        return self._engine
+
+    def _init(self):
+        t0 = time.time()
+        self._status['state'] = 'initializing'
+        try:
+            engine = self._backend_factory()
+        except Exception as e:
+            self._status.update(state='unavailable', error=str(e))
+            print(f"TTS engine unavailable: {e}")
+            self._ready.set()
+            return
+        self._select_voice(engine)
+        # Set gentler defaults
+        try:
+            engine.setProperty('rate', self.rate)
+            engine.setProperty('volume', self.volume)
+        except Exception:
+            pass
+        self._engine = engine
+        self._status.update(state='ready', init_seconds=round(time.time() - t0, 3))
+        self._ready.set()
+
+    def _load_cached_voice(self):
+        try:
+            with open(self.voice_cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('voice_id')
+        except Exception:
+            return None
+
+    def _save_cached_voice(self, voice_id, name):
+        try:
+            with open(self.voice_cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'voice_id': voice_id, 'name': name}, f)
+        except Exception as e:
+            print(f"Could not save voice cache: {e}")
+
+    def _select_voice(self, engine):
+        cached = self._load_cached_voice()
+        if cached:
+            # pyttsx3 swallows errors from setProperty, so read the voice back to
+            # confirm it still exists (no voice enumeration needed)
+            try:
+                engine.setProperty('voice', cached)
+                if engine.getProperty('voice') == cached:
+                    self._status.update(voice=cached, voice_cached=True)
+                    return
+            except Exception:
+                pass
+            print(f"Cached TTS voice {cached} is no longer available; choosing again")
+        # Pick a softer voice if available (prefer female or 'Zira' on Windows)
+        try:
+            voices = engine.getProperty('voices') or []
+            chosen = None
+            for v in voices:
+                name = getattr(v, 'name', '').lower()
+                if any(p in name for p in PREFERRED_VOICES):
+                    chosen = v
+                    break
+            if chosen is None and voices:
+                chosen = voices[0]
+            if chosen is not None:
+                engine.setProperty('voice', chosen.id)
+                self._status.update(voice=chosen.id, voice_cached=False)
+                self._save_cached_voice(chosen.id, getattr(chosen, 'name', ''))
+        except Exception:
+            pass
+
+    def is_ready(self):
+        return self._status['state'] == 'ready'
+
+    def wait_ready(self, timeout=None):
+        self._ready.wait(timeout)
+        return self.is_ready()
+
+    def record(self, group, started_at, finished_at):
+        """Pipeline callback: latency of a group of utterances spoken in one run loop."""
+        speak_ms = (finished_at - started_at) * 1000.0
+        status = self._status
+        for item in group:
+            status['utterances'] += 1
+            status['last_wait_ms'] = round((started_at - item.queued_at) * 1000.0, 1)
+            self._speak_total_ms += speak_ms / len(group)
+        status['last_speak_ms'] = round(speak_ms, 1)
+        status['avg_speak_ms'] = round(self._speak_total_ms / status['utterances'], 1)
+
+    def status(self):
+        return dict(self._status)
+
+
+# Global engine manager (initialized from main.start)
+tts_engine = TTSEngineManager()
@@ -0,0 +1,202 @@
+import itertools
+import queue
+import re
+import threading
+import time
+
+from engine.tts_engine import tts_engine
+
+HIGH = 0
+NORMAL = 5
+LOW = 9
+
+
+def split_chunks(text):
+    """Split text into sentence/clause chunks so the voice pauses naturally between them."""
+    chunks = [p.strip() for p in re.split(r'(?<=[\.!?])\s+|,\s+', text) if p.strip()]
+    return chunks or [text]
+
+
+class Utterance:
+    """A queued piece of speech; wait() blocks until it was spoken, cancelled or dropped."""
+
+    __slots__ = ('text', 'priority', 'key', 'cancelled', 'queued_at', '_done')
+
+    def __init__(self, text, priority=NORMAL, key=None):
+        self.text = text
+        self.priority = priority
+        self.key = key
+        self.cancelled = False
+        self.queued_at = time.monotonic()
+        self._done = threading.Event()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+
+class TTSPipeline:
+    """Producer/consumer speech queue with a single worker that owns the engine.
+
+    Any thread can say() text without blocking; the worker takes the most urgent
+    utterance (lowest priority value, FIFO within a priority), plus whatever
+    else is already waiting with the same priority and key, queues all chunks
+    on the engine and runs one runAndWait() for the whole group. Keeping a
+    group to one key means cancel(key) can stop the engine without cutting off
+    anyone else's speech, and keeping it to one priority means an urgent
+    utterance never waits behind a batch of less urgent ones. Saying something
+    with a `key` drops any still-queued utterance with the same key, so stale
+    announcements are never spoken. The engine is requested on the worker
+    thread as soon as it starts, and `on_spoken(group, started_at, finished_at)`
+    is called after each group, before its utterances are marked done.
+    """
+
+    def __init__(self, engine_provider, max_group=8, on_spoken=None):
+        self._engine_provider = engine_provider
+        self.max_group = max_group
+        self._on_spoken = on_spoken
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._pending_keys = {}
+        self._thread = None
+        self._speaking = []
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='tts-worker', daemon=True)
+                self._thread.start()
+
+    def say(self, text, priority=NORMAL, key=None):
+        """Queue text for speaking and return its Utterance."""
+        self.start()
+        item = Utterance(str(text), priority, key)
+        with self._lock:
+            if key is not None:
+                stale = self._pending_keys.get(key)
+                if stale is not None:
+                    stale.cancelled = True
+                self._pending_keys[key] = item
+        self._queue.put((priority, next(self._seq), item))
+        return item
+
+    def cancel(self, key=None):
+        """Drop queued utterances (all, or those with `key`) and stop the one being spoken."""
+        dropped = []
+        with self._lock:
+            kept = []
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if key is None or entry[2].key == key:
+                    dropped.append(entry[2])
+                else:
+                    kept.append(entry)
+            for entry in kept:
+                self._queue.put(entry)
+            speaking = [u for u in self._speaking if key is None or u.key == key]
+        for item in dropped + speaking:
+            item.cancelled = True
+            self._finish(item)
+        if speaking:
+            engine = self._engine_provider()
+            try:
+                if engine is not None:
+                    engine.stop()
+            except Exception:
+                pass
+        return len(dropped) + len(speaking)
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _finish(self, item):
+        with self._lock:
+            if item.key is not None and self._pending_keys.get(item.key) is item:
+                del self._pending_keys[item.key]
+        item._done.set()
+
+    def _next_group(self):
+        head = self._queue.get()[2]
+        group = [head]
+        with self._lock:
+            others = []
+            while len(group) < self.max_group:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry[0] != head.priority:
+                    # the queue is ordered by priority: nothing after this can join
+                    others.append(entry)
+                    break
+                if entry[2].key == head.key:
+                    group.append(entry[2])
+                else:
+                    others.append(entry)
+            for entry in others:
+                self._queue.put(entry)
+        live = []
+        for item in group:
+            if item.cancelled:
+                self._finish(item)
+            else:
+                live.append(item)
+        return live
+
+    def _run(self):
+        # Create the engine on this thread before the first utterance arrives
+        try:
+            self._engine_provider()
+        except Exception as e:
+            print(f"TTS engine unavailable: {e}")
+        while True:
+            group = self._next_group()
+            if not group:
+                continue
+            with self._lock:
+                self._speaking = group
+            started_at = time.monotonic()
+            try:
+                self._speak_group(group)
+            finally:
+                with self._lock:
+                    self._speaking = []
+                # report before waking waiters, so the metrics include this group
+                if self._on_spoken is not None:
+                    try:
+                        self._on_spoken(group, started_at, time.monotonic())
+                    except Exception:
+                        pass
+                for item in group:
+                    self._finish(item)
+
+    def _speak_group(self, group):
+        engine = None
+        try:
+            engine = self._engine_provider()
+        except Exception as e:
+            print(f"TTS engine unavailable: {e}")
+        if engine is None:
+            for item in group:
+                print(f"Jarvis: {item.text}")
+            return
+        try:
+            for item in group:
+                for chunk in split_chunks(item.text):
+                    engine.say(chunk)
+            engine.runAndWait()
+        except Exception as e:
+            # If runAndWait fails (rare), fall back to print
+            print(f"TTS error: {e}")
+            for item in group:
+                print(f"Jarvis: {item.text}")
+
+
+# Global speech pipeline used by speak()
+tts_pipeline = TTSPipeline(tts_engine.get, on_spoken=tts_engine.record)
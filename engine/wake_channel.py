@@ -0,0 +1,108 @@
+import collections
+import multiprocessing
+import threading
+import time
+
+WakeEvent = collections.namedtuple('WakeEvent', 'keyword timestamp preroll sample_rate')
+
+
+def create_channel():
+    """Return (receiver_conn, sender_conn) for the UI and hotword processes."""
+    return multiprocessing.Pipe(duplex=False)
+
+
+class WakeSender:
+    """Hotword-process end: pushes a WakeEvent (time of detection + pre-roll PCM) to the UI process."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def send(self, keyword, preroll=b'', sample_rate=16000):
+        """Send a wake event; returns False if the UI process is gone."""
+        try:
+            self._conn.send(WakeEvent(keyword, time.time(), bytes(preroll), sample_rate))
+            return True
+        except (OSError, EOFError, BrokenPipeError) as e:
+            print(f"Wake channel closed: {e}")
+            return False
+
+
+class WakeMetrics:
+    """Wake-to-listen latency: hotword detection until the UI process starts capturing."""
+
+    def __init__(self, stale_after=10.0):
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._pending = None
+        self._stats = {'wakes': 0, 'last_transport_ms': None, 'last_listen_ms': None, 'avg_listen_ms': None}
+        self._listen_total = 0.0
+        self._listened = 0
+
+    def mark_wake(self, event):
+        with self._lock:
+            self._pending = event.timestamp
+            self._stats['wakes'] += 1
+            self._stats['last_transport_ms'] = round((time.time() - event.timestamp) * 1000.0, 1)
+
+    def pending(self):
+        """True if a wake event arrived recently and capture hasn't started for it yet."""
+        with self._lock:
+            return self._pending is not None and time.time() - self._pending < self.stale_after
+
+    def mark_listening(self):
+        """Called when capture starts; returns the wake-to-listen latency in ms (None if not wake-triggered)."""
+        with self._lock:
+            if self._pending is None:
+                return None
+            ms = (time.time() - self._pending) * 1000.0
+            self._pending = None
+            if ms > self.stale_after * 1000.0:
+                return None
+            self._listened += 1
+            self._listen_total += ms
+            self._stats['last_listen_ms'] = round(ms, 1)
+            self._stats['avg_listen_ms'] = round(self._listen_total / self._listened, 1)
+            return ms
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+class WakeReceiver:
+    """UI-process end: a daemon thread that calls `on_wake(event)` for every wake event."""
+
+    def __init__(self, conn, on_wake, metrics=None):
+        self._conn = conn
+        self._on_wake = on_wake
+        self.metrics = metrics or wake_metrics
+        self._thread = None
+        self.last_event = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='wake-receiver', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                event = self._conn.recv()
+            except (EOFError, OSError):
+                print("Wake channel closed (hotword process exited)")
+                return
+            self.last_event = event
+            self.metrics.mark_wake(event)
+            try:
+                self._on_wake(event)
+            except Exception as e:
+                print(f"Wake handler failed: {e}")
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+# Latency of the most recent wake events in this process
+wake_metrics = WakeMetrics()
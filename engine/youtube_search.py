@@ -0,0 +1,172 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from urllib.parse import quote_plus
+
+from engine.cache import TTLCache
+
+MUSIC_LABELS = ('vevo', 'official', 'music', 'tseries', 'lahari', 'sony', 'saregama', 'universal')
+
+
+def _clean(s):
+    return re.sub(r"[^a-z0-9 ]", "", (s or '').lower()).strip()
+
+
+def score_video(title, author, target_term):
+    """Score how well a video's title/channel matches the spoken search term."""
+    score = 0
+    t = (title or '').lower()
+    a = (author or '').lower()
+    target = (target_term or '').lower()
+
+    ct = _clean(t)
+    ctarget = _clean(target)
+    # Strong boost for exact title (after stripping non-alphanum)
+    if ct and ctarget and ct == ctarget:
+        score += 150
+    # If the full target appears in title (word sequence), strong boost
+    elif ctarget and ctarget in ct:
+        score += 80
+    elif ctarget:
+        # Partial matches: count how many target words appear in title
+        target_words = [w for w in ctarget.split() if w]
+        score += sum(1 for w in target_words if w in ct) * 15
+
+    # Similarity boost via SequenceMatcher
+    if title and target:
+        ratio = SequenceMatcher(None, ct, ctarget).ratio()
+        if ratio > 0.9:
+            score += 60
+        elif ratio > 0.75:
+            score += 25
+
+    # Moderate bonus if author/channel name indicates a music label
+    if any(k in a for k in MUSIC_LABELS):
+        score += 10
+
+    # small bonus for short titles (likely exact song title)
+    if title and len(title) <= 60:
+        score += 3
+
+    return score
+
+
+def parse_video_ids(html, max_candidates=8):
+    """Return the first distinct video ids found in a YouTube results page."""
+    ids = []
+    for pattern in (r'"videoId"\s*:\s*"([\w-]{11})"', r"/watch\?v=([\w-]{11})"):
+        for m in re.finditer(pattern, html):
+            vid = m.group(1)
+            if vid not in ids:
+                ids.append(vid)
+                if len(ids) >= max_candidates:
+                    return ids
+        # The /watch?v= pattern is only a fallback for pages without videoId fields
+        if ids:
+            break
+    return ids
+
+
+class YouTubeSearch:
+    """Resolve a search term to the best matching video.
+
+    The results page is fetched once and the oEmbed metadata of every candidate
+    is requested concurrently through the shared keep-alive HTTP client. Ranked
+    results are kept per search term and (title, author) per video id in TTL
+    caches, so repeating a "play ..." command needs no network at all.
+    """
+
+    def __init__(self, base_url='https://www.youtube.com', client=None, max_workers=8,
+                 search_ttl=30 * 60, meta_ttl=24 * 60 * 60, search_timeout=8, oembed_timeout=4):
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.search_timeout = search_timeout
+        self.oembed_timeout = oembed_timeout
+        self._client = client
+        self._executor = None
+        self._lock = threading.Lock()
+        self.search_cache = TTLCache(maxsize=256, ttl=search_ttl)
+        self.meta_cache = TTLCache(maxsize=2048, ttl=meta_ttl)
+
+    @property
+    def client(self):
+        if self._client is None:
+            from engine.http_client import http_client
+            self._client = http_client
+        return self._client
+
+    def _pool(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix='youtube-oembed')
+        return self._executor
+
+    def watch_url(self, video_id):
+        return f"{self.base_url}/watch?v={video_id}"
+
+    def candidate_ids(self, term, max_candidates=8):
+        """Video ids from the search results page (empty list on any failure)."""
+        try:
+            resp = self.client.get(f"{self.base_url}/results?search_query={quote_plus(term)}",
+                                   endpoint='youtube.search', timeout=self.search_timeout)
+            return parse_video_ids(resp.text, max_candidates)
+        except Exception as e:
+            print(f"YouTubeSearch: search request failed: {e}")
+            return []
+
+    def video_meta(self, video_id):
+        """Return (title, author) for a video, or (None, None) if oEmbed fails."""
+        meta = self.meta_cache.get(video_id)
+        if meta is not None:
+            return meta
+        try:
+            url = quote_plus(self.watch_url(video_id))
+            resp = self.client.get(f"{self.base_url}/oembed?url={url}&format=json",
+                                   endpoint='youtube.oembed', timeout=self.oembed_timeout)
+            if resp.status_code != 200:
+                return None, None
+            j = resp.json()
+        except Exception:
+            # failures are not cached so the next command retries
+            return None, None
+        meta = ((j.get('title') or '').strip(), (j.get('author_name') or '').strip())
+        self.meta_cache.put(video_id, meta)
+        return meta
+
+    def rank(self, term, max_candidates=8):
+        """Return [(score, url, title, author), ...] best first; ties keep search order."""
+        key = (term.strip().lower(), max_candidates)
+        ranked = self.search_cache.get(key)
+        if ranked is not None:
+            return list(ranked)
+
+        ids = self.candidate_ids(term, max_candidates)
+        if not ids:
+            return []
+        metas = list(self._pool().map(self.video_meta, ids))
+        ranked = [(score_video(title, author, term), self.watch_url(vid), title, author)
+                  for vid, (title, author) in zip(ids, metas)]
+        ranked.sort(key=lambda item: -item[0])
+        # a failed oEmbed lookup left a candidate unscored; retry it next time instead of caching the gap
+        if all(title is not None for title, _ in metas):
+            self.search_cache.put(key, tuple(ranked))
+        return ranked
+
+    def best(self, term, max_candidates=8):
+        """Return (url, title) of the best match, or (None, None) if nothing was found."""
+        ranked = self.rank(term, max_candidates)
+        if not ranked:
+            return None, None
+        _, url, title, _ = ranked[0]
+        return url, title
+
+    def clear_caches(self):
+        self.search_cache.clear()
+        self.meta_cache.clear()
+
+
+# Global instance used by PlayYoutube
+youtube_search = YouTubeSearch()
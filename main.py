@@ -1,4 +1,5 @@
 import os
+import threading
 try:
     import eel
 except Exception:
@@ -47,12 +48,81 @@ except Exception:
 
 from engine.features import *
 from engine.command import *
+from engine.speech_service import speech_service
+from engine.tts_engine import tts_engine
+from engine.startup import startup
+from engine.wake_channel import WakeReceiver
 
-def start():
+
+def _find_free_port(first=8000, last=8010):
+    """Pick a free port by trying to bind a socket (safer than starting eel repeatedly)."""
+    import socket
+
+    for port in range(first, last + 1):
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            s.bind(('localhost', port))
+            return port
+        except Exception:
+            pass
+        finally:
+            try:
+                s.close()
+            except:
+                pass
+    return first
+
+
+def _warm_database():
+    # Opens the pooled connection and loads the command tables and the fuzzy app index
+    from engine.enhanced_parser import enhanced_parser
+    return enhanced_parser.warm()
+
+
+def _init_tts():
+    tts_engine.start()
+    return tts_engine.wait_ready(30)
+
+
+# held from a wake event until the command it started has been handled
+_wake_busy = threading.Lock()
+
+
+def _on_wake(event):
+    # Sent by the hotword process; chime, show the listening UI and start capturing right away
+    if capture_active() or not _wake_busy.acquire(blocking=False):
+        print(f"wake event ignored (already listening): {event.keyword}")
+        return
+    print(f"wake event: {event.keyword}")
+    threading.Thread(target=playAssistantSound, name='wake-chime', daemon=True).start()
+    try:
+        eel.ShowListening()
+    except Exception:
+        pass
+
+    def _listen():
+        try:
+            allCommands()
+        finally:
+            _wake_busy.release()
+
+    threading.Thread(target=_listen, name='wake-listen', daemon=True).start()
+
+
+def start(wake_conn=None):
     
-    eel.init("www")
+    # Independent init stages run concurrently; only the port is needed before the UI starts
+    startup.add('port', _find_free_port)
+    startup.add('db', _warm_database)
+    startup.add('tts', _init_tts)
+    startup.add('whisper', lambda: speech_service.wait_ready(300))
+    startup.add('sound', playAssistantSound)
+    startup.run()
+
+    if wake_conn is not None:
+        WakeReceiver(wake_conn, _on_wake).start()
 
-    playAssistantSound()
+    eel.init("www")
     
     @eel.expose
     def init():
@@ -65,31 +135,8 @@ def start():
         speak("Hello, Welcome Sir, How can I Help You")
         eel.hideStart()
         playAssistantSound()
-    
-    # Pick a free port by trying to bind a socket (safer than starting eel repeatedly)
-    import socket
-
-    def _is_port_free(port):
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            s.bind(('localhost', port))
-            s.close()
-            return True
-        except Exception:
-            try:
-                s.close()
-            except:
-                pass
-            return False
-
-    selected_port = None
-    for port in range(8000, 8011):
-        if _is_port_free(port):
-            selected_port = port
-            break
 
-    if selected_port is None:
-        selected_port = 8000
+    selected_port = startup.wait('port') or 8000
 
     # Try to open browser on the selected port
     try:
@@ -4,26 +4,32 @@ import multiprocessing
 import subprocess
 
 # To run Jarvis
-def startJarvis():
+def startJarvis(wake_conn=None):
         # Code for process 1
         print("Process 1 is running.")
         from main import start
-        start()
+        start(wake_conn)
 
 # To run hotword
-def listenHotword():
+def listenHotword(wake_conn=None):
         # Code for process 2
         print("Process 2 is running.")
         from engine.features import hotword
-        hotword()
+        hotword(wake_conn)
 
 
     # Start both processes
 if __name__ == '__main__':
-        p1 = multiprocessing.Process(target=startJarvis)
-        p2 = multiprocessing.Process(target=listenHotword)
+        # wake events go straight from the hotword process to the UI process
+        from engine.wake_channel import create_channel
+        wake_recv, wake_send = create_channel()
+        p1 = multiprocessing.Process(target=startJarvis, args=(wake_recv,))
+        p2 = multiprocessing.Process(target=listenHotword, args=(wake_send,))
         p1.start()
         p2.start()
+        # the children own the pipe ends now; closing ours lets either side see EOF when the other exits
+        wake_recv.close()
+        wake_send.close()
         p1.join()
 
         if p2.is_alive():
@@ -0,0 +1,41 @@
+from engine.command_registry import CommandRegistry
+
+
+def _registry(rows):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return list(rows['sys']), list(rows['web'])
+
+    return CommandRegistry(loader=loader), calls
+
+
+def test_lookups_are_case_insensitive_and_load_once():
+    rows = {'sys': [('Android Studio', 'C:/studio.exe'), ('android studio', 'C:/other.exe')],
+            'web': [('YouTube', 'https://www.youtube.com/')]}
+    reg, calls = _registry(rows)
+    assert reg.get_system('android studio') == 'C:/studio.exe'
+    assert reg.get_system(' ANDROID STUDIO ') == 'C:/studio.exe'
+    assert reg.get_web('youtube') == 'https://www.youtube.com/'
+    assert reg.get_web('missing') is None
+    assert reg.system_names() == ['Android Studio', 'android studio']
+    assert len(calls) == 1
+
+
+def test_put_and_invalidate_bump_version_and_notify():
+    rows = {'sys': [], 'web': []}
+    reg, calls = _registry(rows)
+    seen = []
+    reg.add_listener(seen.append)
+    assert reg.get_system('brave') is None
+
+    reg.put_system('Brave', 'C:/brave.exe')
+    assert reg.get_system('brave') == 'C:/brave.exe'
+    assert len(calls) == 1
+
+    rows['web'].append(('gmail', 'https://mail.google.com/'))
+    reg.invalidate()
+    assert reg.get_web('gmail') == 'https://mail.google.com/'
+    assert len(calls) == 2
+    assert seen == [1, 2] and reg.version == 2
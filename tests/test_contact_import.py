@@ -0,0 +1,73 @@
+import sqlite3
+
+import pytest
+
+from engine.contact_import import import_file, iter_csv, iter_vcard, main, normalize_phone
+
+
+def _rows(db):
+    con = sqlite3.connect(db)
+    try:
+        return con.execute('SELECT name, mobile_no, email, address FROM contacts ORDER BY id').fetchall()
+    finally:
+        con.close()
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('98765 43210', '+919876543210'),
+    ('+91-98765-43210', '+919876543210'),
+    ('919876543210', '+919876543210'),
+    ('09876543210', '+919876543210'),
+    ('0044 20 7946 0958', '+442079460958'),
+    ('+1 (415) 555-0100', '+14155550100'),
+    ('12', ''),
+    ('', ''),
+])
+def test_normalize_phone(raw, expected):
+    assert normalize_phone(raw) == expected
+
+
+def test_csv_import_normalizes_and_dedupes(tmp_path):
+    src = tmp_path / 'google.csv'
+    src.write_text('Name,Given Name,Phone 1 - Value,E-mail 1 - Value\n'
+                   'Rajesh Kumar,Rajesh,98765 43210 ::: 040 1234567,raj@example.com\n'
+                   'Raj Duplicate,Raj,+91 98765 43210,\n'
+                   'No Number,No,,\n'
+                   'Priya,Priya,09123456789,\n', encoding='utf-8')
+    db = str(tmp_path / 'contacts.db')
+
+    report = import_file(str(src), db)
+    assert (report['read'], report['inserted'], report['duplicates'], report['invalid']) == (4, 2, 1, 1)
+    assert report['rows_per_sec'] > 0
+    assert _rows(db) == [('Rajesh Kumar', '+919876543210', 'raj@example.com', None),
+                         ('Priya', '+919123456789', None, None)]
+
+    # numbers already in the table are skipped on re-import
+    assert import_file(str(src), db)['inserted'] == 0
+
+
+def test_csv_columns_by_index(tmp_path):
+    src = tmp_path / 'export.csv'
+    src.write_text('a,b,c\nAnil,x,9000000006\n', encoding='utf-8')
+    assert list(iter_csv(str(src), name_column=0, phone_column='2')) == [('Anil', '9000000006', '', '')]
+    with pytest.raises(ValueError):
+        list(iter_csv(str(src)))
+
+
+def test_vcard_prefers_mobile_and_unfolds_lines(tmp_path):
+    src = tmp_path / 'phone.vcf'
+    src.write_text('BEGIN:VCARD\r\nVERSION:3.0\r\nN:Sharma;Priya;;;\r\n'
+                   'TEL;TYPE=HOME:040 1234567\r\nTEL;TYPE=CELL:98765 43210\r\n'
+                   'ADR;TYPE=HOME:;;12 Long\r\n  Street;Hyderabad;;;\r\nEND:VCARD\r\n'
+                   'BEGIN:VCARD\r\nFN:Mom\r\nitem1.TEL:9000000004\r\nEND:VCARD\r\n', encoding='utf-8')
+    assert list(iter_vcard(str(src))) == [('Priya Sharma', '98765 43210', '', '12 Long Street, Hyderabad'),
+                                         ('Mom', '9000000004', '', '')]
+
+
+def test_cli(tmp_path, capsys):
+    src = tmp_path / 'c.vcf'
+    src.write_text('BEGIN:VCARD\nFN:Mom\nTEL:9000000004\nEND:VCARD\n', encoding='utf-8')
+    db = str(tmp_path / 'contacts.db')
+    main([str(src), '--db', db])
+    assert '1 inserted' in capsys.readouterr().out
+    assert _rows(db) == [('Mom', '+919000000004', None, None)]
@@ -0,0 +1,80 @@
+from engine.contact_index import ContactIndex, normalize_contact_name, soundex
+
+ROWS = [
+    (1, 'Rajesh Kumar', '9876500001'),
+    (2, 'Raj', '9876500002'),
+    (3, 'Priya Sharma', '9876500003'),
+    (4, 'Mom', '9876500004'),
+    (5, 'Ramesh (Office)', '9876500005'),
+]
+
+
+def _index(rows=ROWS):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return list(rows)
+
+    return ContactIndex(loader=loader), calls
+
+
+def test_helpers():
+    assert normalize_contact_name('  Ramesh (Office) ') == 'ramesh office'
+    assert soundex('Robert') == soundex('Rupert') == 'R163'
+    assert soundex('Ashcraft') == 'A261'
+    assert soundex('123') == ''
+
+
+def test_ranking_exact_prefix_token_fuzzy():
+    index, calls = _index()
+    assert index.best('raj').id == 2
+    assert [m.kind for m in index.search('raj')][:2] == ['exact', 'prefix']
+    assert index.best('sharma').id == 3
+    assert index.best('sharma').kind == 'token'
+    assert index.best('kumar rajesh').id == 1
+    assert index.best('office').mobile_no == '9876500005'
+    # misheard spelling found through the Soundex key
+    fuzzy = index.best('preya')
+    assert fuzzy.id == 3 and fuzzy.kind == 'fuzzy'
+    assert index.best('zzz') is None
+    assert len(calls) == 1
+
+
+def test_substring_fallback_matches_old_like_query():
+    index, _ = _index()
+    assert index.best('jesh').id == 1
+
+
+def test_incremental_add_and_remove():
+    index, calls = _index()
+    assert index.best('anil') is None
+    index.add(6, 'Anil Verma', '9000000006')
+    assert index.best('anil').mobile_no == '9000000006'
+    index.remove('6')
+    assert index.best('anil') is None
+    index.remove(2)
+    assert index.best('raj').id == 1
+    assert len(index) == 4
+    assert len(calls) == 1
+
+
+def test_add_before_load_is_picked_up_by_the_load():
+    rows = list(ROWS)
+    index, calls = _index(rows)
+    rows.append((7, 'Zoya', '9000000007'))
+    index.add(7, 'Zoya', '9000000007')
+    assert index.best('zoya').id == 7
+    rows.pop()
+    index.invalidate()
+    assert index.best('zoya') is None
+    assert len(calls) == 2
+
+
+def test_best_without_fuzzy_ignores_soundex_only_matches():
+    index, _ = _index([(1, 'Jane Doe', '9876500001'), (2, 'Mani', '9876500002')])
+    assert index.best('john').kind == 'fuzzy'
+    assert index.best('john', fuzzy=False) is None
+    assert index.best('jane', fuzzy=False).id == 1
+    # the substring fallback still runs when only fuzzy candidates existed
+    assert index.best('ani', fuzzy=False).id == 2
@@ -0,0 +1,88 @@
+import sqlite3
+import threading
+
+import pytest
+
+from engine.db_writer import DBWriter
+from engine.thread_safe_db import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    path = str(tmp_path / 'jarvis.db')
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE sys_command(id integer primary key, name VARCHAR(100) UNIQUE, path VARCHAR(1000))')
+    con.commit()
+    con.close()
+    pool = ConnectionPool(path, max_size=4)
+    yield pool
+    pool.close_all()
+
+
+def _names(pool):
+    with pool.connection() as conn:
+        return [r[0] for r in conn.execute('SELECT name FROM sys_command ORDER BY id')]
+
+
+def test_queued_writes_are_grouped_into_one_transaction(pool):
+    writer = DBWriter(pool)
+    started, gate = threading.Event(), threading.Event()
+    blocker = writer.submit(lambda cursor: started.set() or gate.wait(5))
+    assert started.wait(5)
+    futures = [writer.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', (f'app{i}', 'x'))
+               for i in range(10)]
+    gate.set()
+    assert blocker.result(5) is True
+    assert [f.result(5) for f in futures] == list(range(1, 11))
+    stats = writer.stats()
+    assert stats['ops'] == 11 and stats['transactions'] == 2 and stats['max_group'] == 10
+
+
+def test_failing_op_only_fails_its_own_future(pool):
+    writer = DBWriter(pool)
+    gate = threading.Event()
+    writer.submit(lambda cursor: gate.wait(5))
+    ok = writer.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', ('chrome', 'c.exe'))
+    dup = writer.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', ('chrome', 'other.exe'))
+    also_ok = writer.executemany('INSERT INTO sys_command (name, path) VALUES (?, ?)', [('edge', 'e'), ('brave', 'b')])
+    gate.set()
+    assert ok.result(5) == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        dup.result(5)
+    assert also_ok.result(5) == 2
+    assert _names(pool) == ['chrome', 'edge', 'brave']
+    assert writer.stats()['failed'] == 1
+
+
+def test_on_commit_runs_before_the_future_resolves_and_flush_waits(pool):
+    writer = DBWriter(pool)
+    seen = []
+    future = writer.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', ('notepad', 'n.exe'),
+                            on_commit=seen.append)
+    order = []
+    writer.call(order.append, 'file saved')
+    assert writer.flush(5)
+    assert future.done() and seen == [1]
+    assert order == ['file saved']
+    assert _names(pool) == ['notepad']
+
+
+def test_flush_times_out_while_writer_is_busy(pool):
+    writer = DBWriter(pool)
+    gate = threading.Event()
+    writer.submit(lambda cursor: gate.wait(5))
+    assert writer.flush(0.05) is False
+    gate.set()
+    assert writer.flush(5)
+
+
+def test_shutdown_commits_queued_writes(pool):
+    writer = DBWriter(pool)
+    assert writer.shutdown() is True  # never started
+    started, gate = threading.Event(), threading.Event()
+    writer.submit(lambda cursor: started.set() or gate.wait(5))
+    assert started.wait(5)
+    writer.execute('INSERT INTO sys_command (name, path) VALUES (?, ?)', ('late', 'l.exe'))
+    gate.set()
+    assert writer.shutdown(5)
+    assert _names(pool) == ['late']
@@ -0,0 +1,59 @@
+import json
+
+from engine.command_registry import CommandRegistry
+from engine.db_writer import DBWriter
+from engine.thread_safe_db import ConnectionPool
+import engine.db_writer as writer_module
+from engine.enhanced_parser import EnhancedCommandParser
+import engine.command_registry as registry_module
+
+
+def _parser(tmp_path, monkeypatch):
+    registry = CommandRegistry(loader=lambda: ([('Android Studio', 'C:/studio.exe')], []))
+    monkeypatch.setattr(registry_module, 'command_registry', registry)
+    monkeypatch.setattr(EnhancedCommandParser, 'SYNONYMS_PATH', str(tmp_path / 'synonyms.json'))
+    monkeypatch.setattr(writer_module, 'db_writer', DBWriter(ConnectionPool(str(tmp_path / 'jarvis.db'))))
+    return EnhancedCommandParser(), registry
+
+
+def test_repeated_utterances_hit_the_cache(tmp_path, monkeypatch):
+    parser, _ = _parser(tmp_path, monkeypatch)
+    first = parser.extract_commands("open crome and play lofi on youtube")
+    first[0]['query'] = 'mutated by caller'
+    second = parser.extract_commands("open crome and play lofi on youtube")
+    assert second[0]['query'] == 'open chrome'
+    assert [c['type'] for c in second] == ['open', 'youtube']
+    stats = parser.cache_stats()
+    assert stats['extract'] == {'size': 1, 'maxsize': 256, 'hits': 1, 'misses': 1}
+    assert stats['normalize']['hits'] == 1
+
+
+def test_parallel_plan_returns_callers_objects(tmp_path, monkeypatch):
+    parser, _ = _parser(tmp_path, monkeypatch)
+    commands = parser.extract_commands("call john and open notepad")
+    plan = parser.suggest_parallel_execution(commands)
+    assert plan['sequential'] == [commands[0]] and plan['sequential'][0] is commands[0]
+    assert plan['parallel'] == [commands[1]] and plan['parallel'][0] is commands[1]
+
+
+def test_training_and_registry_changes_invalidate(tmp_path, monkeypatch):
+    parser, registry = _parser(tmp_path, monkeypatch)
+    assert parser.normalize_query("open studi") == "open studi"
+    parser.train_correction("studi", "android studio")
+    assert parser.normalize_query("open studi") == "open android studio"
+    assert writer_module.db_writer.flush(5)
+    assert json.loads((tmp_path / 'synonyms.json').read_text()) == {"studi": "android studio"}
+
+    assert parser.normalize_query("open gmal") == "open gmal"
+    tables = [([], [])]
+    registry = CommandRegistry(loader=lambda: tables[-1])
+    monkeypatch.setattr(registry_module, 'command_registry', registry)
+    assert parser.normalize_query("open gmal") == "open gmal"
+    tables.append(([], [('gmail', 'https://mail.google.com/')]))
+    registry.invalidate()
+    assert parser.normalize_query("open gmal") == "open gmail"
+
+
+def test_warm_builds_the_app_index(tmp_path, monkeypatch):
+    parser, _ = _parser(tmp_path, monkeypatch)
+    assert parser.warm() == len(EnhancedCommandParser.COMMON_APPS) + 1
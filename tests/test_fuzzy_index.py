@@ -0,0 +1,38 @@
+import difflib
+import random
+import string
+
+from engine.fuzzy_index import AppNameIndex
+
+
+def _reference(word, names):
+    matches = difflib.get_close_matches(word, names, n=1, cutoff=0.78)
+    return matches[0] if matches else None
+
+
+def test_matches_difflib_on_app_names():
+    names = ['youtube', 'brave', 'chrome', 'edge', 'firefox', 'notepad', 'calculator',
+             'whatsapp', 'spotify', 'vscode', 'pycharm', 'android studio', 'one note']
+    index = AppNameIndex(names)
+    for word in ['yotube', 'youtub', 'crome', 'chrom', 'notpad', 'whatsap', 'spotfy',
+                 'open', 'and', 'calculater', 'firefx', 'edg', 'pycharn', 'xyz', '']:
+        assert index.best_match(word) == _reference(word, names), word
+
+
+def test_matches_difflib_on_random_names():
+    rng = random.Random(7)
+    alphabet = string.ascii_lowercase[:8]
+    names = [''.join(rng.choice(alphabet) for _ in range(rng.randint(3, 9))) for _ in range(300)]
+    index = AppNameIndex(names)
+    for _ in range(300):
+        base = rng.choice(names)
+        word = ''.join(c if rng.random() > 0.2 else rng.choice(alphabet) for c in base)
+        assert index.best_match(word) == _reference(word, names), word
+
+
+def test_rebuild_clears_memo():
+    index = AppNameIndex(['chrome'])
+    assert index.best_match('chrom') == 'chrome'
+    index.rebuild(['brave'])
+    assert index.best_match('chrom') is None
+    assert index.size == 1
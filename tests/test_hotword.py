@@ -0,0 +1,69 @@
+import wave
+
+import numpy as np
+import pytest
+
+from engine.hotword import HotwordDetector, KeywordEngine, WavFileSource
+
+FRAME = 512
+
+
+class LoudFrameEngine(KeywordEngine):
+    """Fires keyword 0 on the first loud frame after silence."""
+
+    frame_length = FRAME
+
+    def __init__(self):
+        self.armed = True
+        self.frame_types = set()
+
+    def process(self, pcm):
+        self.frame_types.add((type(pcm), len(pcm)))
+        loud = max(abs(s) for s in pcm) > 10000
+        if loud and self.armed:
+            self.armed = False
+            return 0
+        if not loud:
+            self.armed = True
+        return -1
+
+
+def _write_wav(path, samples):
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(samples.astype(np.int16).tobytes())
+
+
+def test_keyword_engine_is_abstract():
+    with pytest.raises(TypeError):
+        KeywordEngine()
+
+
+def test_detector_over_wav_file(tmp_path):
+    silence = np.zeros(FRAME * 10, dtype=np.int16)
+    burst = np.full(FRAME * 3, 20000, dtype=np.int16)
+    path = tmp_path / 'two_wakes.wav'
+    _write_wav(path, np.concatenate([silence, burst, silence, burst, silence]))
+
+    wakes = []
+    engine = LoudFrameEngine()
+    detector = HotwordDetector(engine, WavFileSource(str(path), FRAME), lambda idx, d: wakes.append(
+        (idx, d.stats['frames'], d.preroll())), preroll_frames=2)
+    stats = detector.run()
+
+    assert stats['frames'] == 36
+    assert [(idx, frames) for idx, frames, _ in wakes] == [(0, 11), (0, 24)]
+    # pre-roll: the last silent frame, then the frame that fired
+    preroll = np.frombuffer(wakes[0][2], dtype=np.int16)
+    assert len(preroll) == FRAME * 2
+    assert not preroll[:FRAME].any() and (preroll[FRAME:] == 20000).all()
+    assert engine.frame_types == {(tuple, FRAME)}
+
+
+def test_max_frames_stops_the_loop(tmp_path):
+    path = tmp_path / 'silence.wav'
+    _write_wav(path, np.zeros(FRAME * 10, dtype=np.int16))
+    detector = HotwordDetector(LoudFrameEngine(), WavFileSource(str(path), FRAME), lambda idx, d: None)
+    assert detector.run(max_frames=4)['frames'] == 4
@@ -0,0 +1,96 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from engine.http_client import HttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    peers = []
+    flaky = 0
+
+    def do_GET(self):
+        self.peers.append(self.client_address[1])
+        if self.path == '/slow':
+            time.sleep(0.5)
+        if self.path == '/flaky' and _Handler.flaky > 0:
+            _Handler.flaky -= 1
+            status, body = 503, b'busy'
+        else:
+            status, body = 200, b'ok'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _Handler.peers = []
+    _Handler.flaky = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(server_url):
+    client = HttpClient()
+    for _ in range(3):
+        assert client.get(f'{server_url}/ping').text == 'ok'
+    assert len(set(_Handler.peers)) == 1
+
+
+def test_transient_status_is_retried(server_url):
+    client = HttpClient(retries=2, backoff_factor=0)
+    _Handler.flaky = 2
+    resp = client.get(f'{server_url}/flaky', endpoint='flaky')
+    assert resp.status_code == 200
+    assert len(_Handler.peers) == 3
+    assert client.metrics()['flaky']['errors'] == 0
+
+
+def test_post_is_not_resent(server_url):
+    client = HttpClient(retries=2, backoff_factor=0)
+    _Handler.flaky = 2
+    resp = client.post(f'{server_url}/flaky', data=b'x')
+    assert resp.status_code == 503
+    assert len(_Handler.peers) == 1
+
+
+def test_read_timeout_is_not_retried(server_url):
+    client = HttpClient(retries=2, backoff_factor=0)
+    with pytest.raises(Exception):
+        client.get(f'{server_url}/slow', timeout=(1, 0.1))
+    assert len(_Handler.peers) == 1
+
+
+def test_metrics_per_endpoint(server_url):
+    client = HttpClient()
+    client.get(f'{server_url}/a')
+    client.get(f'{server_url}/a')
+    client.get(f'{server_url}/b', endpoint='b')
+    metrics = client.metrics()
+    host = server_url.split('//')[1]
+    assert metrics[f'{host}/a']['count'] == 2
+    assert metrics['b']['count'] == 1
+    assert metrics['b']['avg_ms'] >= 0
+
+
+def test_connection_errors_are_counted():
+    client = HttpClient(retries=0, timeout=1)
+    with pytest.raises(Exception):
+        client.get('http://127.0.0.1:9/', endpoint='down')
+    down = client.metrics()['down']
+    assert (down['count'], down['errors']) == (1, 1)
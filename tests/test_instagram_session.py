@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from engine.instagram_session import InstagramSessionManager
+
+
+class LoginRequired(Exception):
+    pass
+
+
+class FakeClient:
+    logins = []
+    dumps = 0
+
+    def __init__(self):
+        self.settings = None
+        self.lookups = []
+        self.sent = []
+        self.expire_next_send = False
+
+    def load_settings(self, path):
+        with open(path) as f:
+            self.settings = json.load(f)
+
+    def dump_settings(self, path):
+        FakeClient.dumps += 1
+        with open(path, 'w') as f:
+            json.dump({'session': f'token-{FakeClient.dumps}'}, f)
+
+    def login(self, username, password):
+        FakeClient.logins.append('resumed' if self.settings else 'fresh')
+
+    def user_id_from_username(self, username):
+        self.lookups.append(username)
+        if username == 'ghost':
+            raise KeyError(username)
+        return f'id-{username}'
+
+    def direct_send(self, message, user_ids):
+        if self.expire_next_send:
+            self.expire_next_send = False
+            raise LoginRequired()
+        self.sent.append((message, user_ids))
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    FakeClient.logins = []
+    FakeClient.dumps = 0
+    clients = []
+
+    def factory():
+        clients.append(FakeClient())
+        return clients[-1]
+
+    def _make():
+        return InstagramSessionManager(client_factory=factory, settings_path=str(tmp_path / 'ig.json'),
+                                       credentials=lambda: ('me', 'secret'))
+
+    _make.clients = clients
+    return _make
+
+
+def test_one_login_and_cached_user_ids(make_manager):
+    manager = make_manager()
+    for text in ('hi', 'there', 'again'):
+        assert manager.send_sync('Alice', text, timeout=5) is True
+    client = make_manager.clients[0]
+    assert FakeClient.logins == ['fresh']
+    assert client.lookups == ['alice']
+    assert client.sent == [('hi', ['id-alice']), ('there', ['id-alice']), ('again', ['id-alice'])]
+
+
+def test_saved_session_is_resumed_by_a_new_process(make_manager):
+    make_manager().send_sync('bob', 'first', timeout=5)
+    make_manager().send_sync('bob', 'second', timeout=5)
+    assert FakeClient.logins == ['fresh', 'resumed']
+
+
+def test_expired_session_logs_in_again(make_manager, tmp_path):
+    manager = make_manager()
+    manager.client().expire_next_send = True
+    assert manager.send_sync('carol', 'hello', timeout=5) is True
+    # the dead saved session is not resumed; the new one replaces it on disk
+    assert FakeClient.logins == ['fresh', 'fresh']
+    assert make_manager.clients[-1].sent == [('hello', ['id-carol'])]
+    with open(tmp_path / 'ig.json') as f:
+        assert json.load(f) == {'session': 'token-2'}
+
+
+def test_unknown_user_fails_the_send(make_manager):
+    manager = make_manager()
+    with pytest.raises(LookupError):
+        manager.send_sync('ghost', 'boo', timeout=5)
+    assert manager.send_sync('12345', 'numeric ok', timeout=5) is True
+    assert manager.stats()['failed'] == 1
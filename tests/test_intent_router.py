@@ -0,0 +1,54 @@
+import pytest
+from engine.intent_router import classify
+
+
+@pytest.mark.parametrize("cmd,expected", [
+    ("open notepad", "open"),
+    ("open youtube", "open_youtube"),
+    ("play dosti song on youtube", "play_youtube"),
+    ("play lofi", "ai"),
+    ("send message to praveen", "contact"),
+    ("video call to mom", "contact"),
+    ("send telegram hi to alice", "telegram"),
+    ("open_and_type notepad and type hi", "open_and_type"),
+    ("what is the time", "ai"),
+])
+def test_classify(cmd, expected):
+    assert classify(cmd).name == expected
+
+
+def test_structured_open_and_type():
+    cmd = {'type': 'open_and_type', 'query': 'notepad and type hi', 'original': 'notepad and type hi'}
+    assert classify(cmd).name == 'open_and_type'
+
+
+def test_overlapping_keywords():
+    intent = classify("Send Message to Bob on WhatsApp")
+    assert intent.has('send message', 'send', 'message', 'whatsapp')
+    assert intent.has_word('bob')
+    assert not intent.has('phone call')
+
+
+def test_cache_key_is_normalized():
+    from engine.intent_router import _classify
+    _classify.cache_clear()
+    assert classify("Open Notepad ").name == 'open'
+    assert classify("open notepad").name == 'open'
+    assert _classify.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("cmd,expected", [
+    ("open youtube", "open"),
+    ("open chrome and play song on youtube", "open"),
+    ("Play Dosti Song On YouTube", "play_youtube"),
+    ("send message to praveen", "contact"),
+    ("play lofi", "ai"),
+])
+def test_single_command_table(cmd, expected):
+    assert classify(cmd, table='single_command').name == expected
+
+
+def test_keywords_are_computed_on_demand():
+    intent = classify("send telegram message to alice")
+    assert intent.keywords == {'telegram', 'send', 'message'}
+    assert not intent.has('send message')
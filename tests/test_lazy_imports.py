@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+from engine import lazy_imports
+
+
+@pytest.fixture
+def heavy_module(tmp_path, monkeypatch):
+    (tmp_path / 'jarvis_fake_heavy.py').write_text("LOADED = True\ndef double(x):\n    return 2 * x\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'jarvis_fake_heavy'
+    sys.modules.pop('jarvis_fake_heavy', None)
+    lazy_imports._modules.pop('jarvis_fake_heavy', None)
+    lazy_imports._profile.pop('jarvis_fake_heavy', None)
+
+
+def test_import_is_deferred_until_first_use(heavy_module):
+    mod = lazy_imports.lazy_import(heavy_module)
+    assert heavy_module not in sys.modules
+    assert not lazy_imports.is_loaded(heavy_module)
+    assert 'not loaded' in repr(mod)
+
+    assert mod.double(21) == 42
+    assert heavy_module in sys.modules and lazy_imports.is_loaded(heavy_module)
+    assert lazy_imports.lazy_import(heavy_module) is mod
+
+
+def test_profile_reports_cost(heavy_module):
+    mod = lazy_imports.lazy_import(heavy_module)
+    row = next(r for r in lazy_imports.import_profile() if r['module'] == heavy_module)
+    assert row['seconds'] is None
+    assert mod.LOADED
+    row = next(r for r in lazy_imports.import_profile() if r['module'] == heavy_module)
+    assert row['seconds'] >= 0
+    assert heavy_module in lazy_imports.report()
+
+
+def test_missing_module_fails_at_use():
+    mod = lazy_imports.lazy_import('jarvis_module_that_does_not_exist')
+    with pytest.raises(ImportError):
+        mod.anything
+    lazy_imports._modules.pop('jarvis_module_that_does_not_exist', None)
+    lazy_imports._profile.pop('jarvis_module_that_does_not_exist', None)
@@ -0,0 +1,53 @@
+from engine.llm_client import LLMClient, StubLLMBackend, iter_sentences, normalize_prompt
+
+
+def test_iter_sentences_cuts_across_chunks():
+    chunks = ['Hel', 'lo there. How ', 'are you? I am', ' fine! Trailing']
+    assert list(iter_sentences(chunks)) == ['Hello there.', 'How are you?', 'I am fine!', 'Trailing']
+
+
+def test_numbers_and_abbreviations_do_not_end_sentences():
+    text = 'Steps:\n1. Open it. It costs 3.5 dollars, e.g. for Dr. Smith. Done!'
+    chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+    assert list(iter_sentences(chunks)) == ['Steps:\n1. Open it.', 'It costs 3.5 dollars, e.g. for Dr. Smith.',
+                                            'Done!']
+
+
+def test_markdown_is_stripped_from_whole_blocks():
+    from engine.helper import markdown_to_text
+    chunks = ['**Note', ' one. Note', ' two.** Use `a.', ' b` here. ', 'Bye']
+    assert list(iter_sentences(chunks, markdown_to_text)) == ['Note one.', 'Note two.', 'Use a. b here.', 'Bye']
+
+
+def test_first_sentence_arrives_before_stream_ends():
+    produced = []
+
+    class SlowBackend(StubLLMBackend):
+        def stream(self, prompt):
+            for word in super().stream(prompt):
+                produced.append(word)
+                yield word
+
+    client = LLMClient(SlowBackend({'q': 'One two. Three four five six.'}))
+    sentences = client.stream_sentences('q')
+    assert next(sentences) == 'One two.'
+    assert len(produced) < 6
+    assert list(sentences) == ['Three four five six.']
+
+
+def test_repeated_prompt_is_answered_from_cache():
+    backend = StubLLMBackend({'What is Python?': 'A language. It is popular.'})
+    client = LLMClient(backend)
+    assert list(client.stream_sentences('What is Python?')) == ['A language.', 'It is popular.']
+    assert list(client.stream_sentences('  what is   python ')) == ['A language.', 'It is popular.']
+    assert client.generate('WHAT IS PYTHON?') == 'A language. It is popular.'
+    assert backend.calls == ['What is Python?']
+    assert client.stats()['cache']['hits'] == 2
+
+
+def test_cache_is_bounded():
+    client = LLMClient(StubLLMBackend(lambda p: p.upper()), cache_size=2)
+    for prompt in ('a', 'b', 'c'):
+        client.generate(prompt)
+    assert len(client.cache) == 2
+    assert normalize_prompt('Hello,  World?') == 'hello, world'
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+
+import pytest
+
+from engine import command_registry as registry_module
+from engine import contact_index as index_module
+from engine import table_pages
+from engine.command_registry import CommandRegistry
+from engine.contact_index import ContactIndex
+from engine.db_writer import DBWriter
+from engine.repositories import CommandRepository, Contact, ContactRepository, Info, InfoRepository
+from engine.table_pages import ChangeTracker
+from engine.thread_safe_db import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    path = str(tmp_path / 'jarvis.db')
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE contacts (id integer primary key, name VARCHAR(200), mobile_no VARCHAR(255), '
+                'email VARCHAR(255) NULL, address VARCHAR(255) NULL)')
+    con.execute('CREATE TABLE sys_command(id integer primary key, name VARCHAR(100), path VARCHAR(1000))')
+    con.execute('CREATE TABLE info(name VARCHAR(100), designation VARCHAR(50), mobileno VARCHAR(40), '
+                'email VARCHAR(200), city VARCHAR(300))')
+    con.commit()
+    con.close()
+    pool = ConnectionPool(path, max_size=8)
+
+    def _load_contacts():
+        with pool.connection() as conn:
+            return conn.execute('SELECT id, name, mobile_no FROM contacts').fetchall()
+
+    # keep the side effects on fresh globals instead of the app's singletons
+    monkeypatch.setattr(index_module, 'contact_index', ContactIndex(loader=_load_contacts))
+    monkeypatch.setattr(registry_module, 'command_registry', CommandRegistry(loader=lambda: ([], [])))
+    monkeypatch.setattr(table_pages, 'change_tracker', ChangeTracker())
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture
+def writer(pool):
+    return DBWriter(pool)
+
+
+def test_contacts_keep_index_and_change_log_current(pool, writer):
+    repo = ContactRepository(pool, writer)
+    index = index_module.contact_index
+    assert index.best('anil') is None
+
+    contact_id = repo.add('Anil Verma', '+919000000006').result(5)
+    assert repo.get(contact_id) == Contact(contact_id, 'Anil Verma', '+919000000006', None, None)
+    assert index.best('anil').id == contact_id
+    assert table_pages.change_tracker.changes_since('contacts', 0)[1]['upsert'] == [contact_id]
+
+    repo.delete(str(contact_id)).result(5)
+    assert repo.get(contact_id) is None
+    assert index.best('anil') is None
+
+    assert repo.add_many([('A', '1', None, None), ('B', '2', None, None)]).result(5) == 2
+    assert [c.name for c in repo.all()] == ['A', 'B']
+    assert table_pages.change_tracker.changes_since('contacts', 0)[1] is None
+
+
+def test_commands_refresh_registry(pool, writer):
+    repo = CommandRepository('sys_command', 'path', pool, writer)
+    versions = []
+    registry_module.command_registry.add_listener(versions.append)
+    command_id = repo.add('notepad', 'C:/notepad.exe').result(5)
+    assert repo.all()[0].target == 'C:/notepad.exe'
+    repo.delete(command_id).result(5)
+    assert repo.all() == []
+    assert len(versions) == 2
+
+
+def test_info_upsert(pool, writer):
+    repo = InfoRepository(pool, writer)
+    assert repo.get() is None
+    repo.save('Tony', 'CEO', '1', 'tony@example.com', 'NYC')
+    repo.save('Tony Stark', 'CEO', '1', 'tony@example.com', 'NYC').result(5)
+    assert repo.get() == Info('Tony Stark', 'CEO', '1', 'tony@example.com', 'NYC')
+    with pool.connection() as conn:
+        assert conn.execute('SELECT COUNT(*) FROM info').fetchone()[0] == 1
+
+
+def test_concurrent_writers_and_readers(pool, writer):
+    repo = ContactRepository(pool, writer)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                repo.add(f'Person {n}-{i}', str(n * 100 + i))
+                repo.all()
+            repo.add(f'Person {n}-last', str(n)).result(5)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(repo.all()) == 126
@@ -0,0 +1,70 @@
+import pytest
+
+from engine.speech_service import SpeechService, whisper_language
+
+
+class _Segment:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, beam_size=5, language=None):
+        self.calls.append((len(audio), beam_size, language))
+        return iter([_Segment(' hello'), _Segment(' world ')]), None
+
+
+def test_preloads_warms_up_and_serves_requests():
+    model = FakeModel()
+    service = SpeechService(model_factory=lambda size, device: model)
+    service.start()
+    assert service.wait_ready(timeout=5)
+    status = service.status()
+    assert status['state'] == 'ready'
+    assert status['load_seconds'] is not None and status['warmup_seconds'] is not None
+    # warm-up decode ran on one second of 16 kHz silence
+    assert model.calls == [(16000, 1, 'en')]
+
+    assert service.transcribe([0.0] * 10, language='te-IN', timeout=5) == 'hello world'
+    assert model.calls[-1] == (10, 5, 'te')
+
+
+def test_unavailable_model_fails_requests():
+    def factory(size, device):
+        raise ImportError('faster_whisper missing')
+
+    service = SpeechService(model_factory=factory)
+    assert not service.wait_ready(timeout=5)
+    assert not service.is_available()
+    with pytest.raises(RuntimeError):
+        service.transcribe([0.0], timeout=5)
+
+
+@pytest.mark.parametrize("lang,expected", [("en-IN", "en"), ("auto", None), ("", None), ("hi", "hi")])
+def test_whisper_language(lang, expected):
+    assert whisper_language(lang) == expected
+
+
+class FakeAudioData:
+    def __init__(self, raw):
+        self.raw = raw
+        self.requested = None
+
+    def get_raw_data(self, convert_rate=None, convert_width=None):
+        self.requested = (convert_rate, convert_width)
+        return self.raw
+
+
+def test_audio_to_float32_converts_in_memory():
+    import numpy as np
+    from engine.speech_service import audio_to_float32
+
+    pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+    audio = FakeAudioData(pcm.tobytes())
+    samples = audio_to_float32(audio)
+    assert audio.requested == (16000, 2)
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [0.0, 0.5, -1.0, 32767 / 32768.0]
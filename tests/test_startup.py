@@ -0,0 +1,46 @@
+import threading
+import time
+
+from engine.startup import StartupOrchestrator
+
+
+def test_stages_run_concurrently_and_are_timed():
+    gate = threading.Event()
+    orch = StartupOrchestrator()
+    orch.add('slow', lambda: gate.wait(5) and 'model')
+    orch.add('port', lambda: 8001)
+    orch.add('broken', lambda: 1 / 0)
+    orch.run()
+
+    # a fast stage is usable while a slow one is still running
+    assert orch.wait('port', timeout=5) == 8001
+    assert orch.is_ready('port') and not orch.is_ready()
+    assert orch.status()['stages']['slow']['state'] == 'running'
+
+    gate.set()
+    assert orch.wait('slow', timeout=5) == 'model'
+    assert orch.wait('broken', timeout=5) is None
+    deadline = time.time() + 5
+    while not orch.is_ready() and time.time() < deadline:
+        time.sleep(0.01)
+
+    status = orch.status()
+    assert status['ready']
+    assert status['stages']['broken']['state'] == 'failed'
+    assert 'division' in status['stages']['broken']['error']
+    assert all(s['seconds'] is not None for s in status['stages'].values())
+
+
+def test_parallel_stages_take_the_longest_not_the_sum():
+    orch = StartupOrchestrator()
+    for name in ('a', 'b', 'c'):
+        orch.add(name, lambda: time.sleep(0.2))
+    t0 = time.perf_counter()
+    orch.run()
+    for name in ('a', 'b', 'c'):
+        orch.wait(name, timeout=5)
+    assert time.perf_counter() - t0 < 0.5
+
+
+def test_empty_orchestrator_is_ready():
+    assert StartupOrchestrator().run().is_ready()
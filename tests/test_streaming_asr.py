@@ -0,0 +1,61 @@
+from concurrent.futures import Future
+
+import numpy as np
+
+from engine.streaming_asr import StreamingTranscriber
+
+CHUNK = 1600  # 0.1 s at 16 kHz
+
+
+def _chunk(amplitude):
+    return (np.ones(CHUNK, dtype=np.int16) * amplitude).tobytes()
+
+
+class FakeDecoder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, samples):
+        self.calls.append(len(samples))
+        future = Future()
+        future.set_result(f"words {len(samples) // CHUNK}")
+        return future
+
+
+def test_partials_then_final_reuses_last_partial():
+    decoder = FakeDecoder()
+    partials = []
+    st = StreamingTranscriber(decoder, energy_threshold=300, pause_seconds=0.3,
+                              partial_interval=0.3, preroll_seconds=0.2, on_partial=partials.append)
+    for _ in range(5):
+        assert st.feed(_chunk(0)) is None
+    assert not st.speaking
+
+    results = [st.feed(_chunk(5000)) for _ in range(10)]
+    assert results == [None] * 10 and st.speaking
+    # one chunk of pre-roll plus the voiced onset chunk open the utterance
+    assert partials == ["words 4", "words 7", "words 10"]
+
+    final = [st.feed(_chunk(0)) for _ in range(3)]
+    assert final == [None, None, "words 13"]
+    assert not st.speaking
+    # the in-flight partial already covered all the speech, so no extra full decode
+    assert decoder.calls == [4 * CHUNK, 7 * CHUNK, 10 * CHUNK, 13 * CHUNK]
+    assert len(st.last_utterance) == 14 * CHUNK * 2
+
+def test_final_decodes_full_utterance_when_partial_is_stale():
+    decoder = FakeDecoder()
+    st = StreamingTranscriber(decoder, energy_threshold=300, pause_seconds=0.2,
+                              partial_interval=10.0, preroll_seconds=0.0)
+    for _ in range(3):
+        st.feed(_chunk(5000))
+    st.feed(_chunk(0))
+    final = st.feed(_chunk(0))
+    assert final == "words 5"
+    assert decoder.calls == [5 * CHUNK]
+
+
+def test_finish_without_speech_returns_empty():
+    st = StreamingTranscriber(FakeDecoder())
+    st.feed(_chunk(0))
+    assert st.finish() == ''
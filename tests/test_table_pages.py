@@ -0,0 +1,81 @@
+import sqlite3
+from contextlib import contextmanager
+
+import pytest
+
+from engine.table_pages import ChangeTracker, fetch_changes, fetch_page
+
+
+class _DB:
+    def __init__(self, path):
+        self.con = sqlite3.connect(path)
+
+    @contextmanager
+    def get_connection(self):
+        cursor = self.con.cursor()
+        yield cursor
+        self.con.commit()
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = _DB(str(tmp_path / 'jarvis.db'))
+    db.con.execute('CREATE TABLE contacts (id integer primary key, name, mobile_no, email, address)')
+    db.con.executemany('INSERT INTO contacts (name, mobile_no) VALUES (?, ?)',
+                       [(f'Person {i}', f'90000{i:05d}') for i in range(1, 121)] + [('100%_real', '1')])
+    db.con.commit()
+    return db
+
+
+def test_pages_and_search(db):
+    tracker = ChangeTracker()
+    page = fetch_page('contacts', offset=50, limit=50, db=db, tracker=tracker)
+    assert page['total'] == 121 and len(page['rows']) == 50
+    assert page['rows'][0][:3] == [51, 'Person 51', '9000000051']
+
+    found = fetch_page('contacts', search='person 11', db=db, tracker=tracker)
+    assert [r[1] for r in found['rows']] == ['Person 11'] + [f'Person {i}' for i in range(110, 120)]
+    # LIKE wildcards in the search term are literal
+    assert fetch_page('contacts', search='0%_', db=db, tracker=tracker)['total'] == 1
+    assert fetch_page('contacts', limit=10000, db=db, tracker=tracker)['limit'] == 200
+
+    with pytest.raises(ValueError):
+        fetch_page('info', db=db, tracker=tracker)
+
+
+def test_changes_since_cursor(db):
+    tracker = ChangeTracker()
+    cursor = fetch_page('contacts', db=db, tracker=tracker)['cursor']
+    assert fetch_changes('contacts', cursor, db=db, tracker=tracker)['upserted'] == []
+
+    new_id = db.con.execute("INSERT INTO contacts (name, mobile_no) VALUES ('Anil', '9111111111')").lastrowid
+    tracker.record('contacts', 'upsert', new_id)
+    db.con.execute('DELETE FROM contacts WHERE id = 3')
+    tracker.record('contacts', 'delete', '3')
+    db.con.commit()
+
+    diff = fetch_changes('contacts', cursor, db=db, tracker=tracker)
+    assert not diff['reset']
+    assert [r[1] for r in diff['upserted']] == ['Anil']
+    assert diff['deleted'] == ['3']
+    assert diff['total'] == 121
+    assert fetch_changes('contacts', diff['cursor'], db=db, tracker=tracker)['upserted'] == []
+
+
+def test_inserted_then_deleted_row_is_reported_deleted(db):
+    tracker = ChangeTracker()
+    tracker.record('contacts', 'upsert', 999)
+    assert fetch_changes('contacts', 0, db=db, tracker=tracker)['deleted'] == [999]
+
+
+def test_stale_cursor_or_bulk_change_asks_for_reload(db):
+    tracker = ChangeTracker(max_log=2)
+    for row_id in (1, 2, 3):
+        tracker.record('contacts', 'upsert', row_id)
+    assert fetch_changes('contacts', 0, db=db, tracker=tracker)['reset']
+    assert not fetch_changes('contacts', 1, db=db, tracker=tracker)['reset']
+
+    cursor = tracker.reset('contacts')
+    assert fetch_changes('contacts', cursor - 1, db=db, tracker=tracker)['reset']
+    assert not fetch_changes('contacts', cursor, db=db, tracker=tracker)['reset']
+    assert fetch_changes('contacts', 'garbage', db=db, tracker=tracker)['reset']
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import TimeoutError
+
+import pytest
+
+from engine.telegram_session import TelegramSessionManager
+
+
+class FakeTelegramClient:
+    def __init__(self, fail_connects=0, authorized=True, send_delay=0):
+        self.fail_connects = fail_connects
+        self.authorized = authorized
+        self.send_delay = send_delay
+        self.started = False
+        self.connected = False
+        self.connect_calls = 0
+        self.lookups = []
+        self.sent = []
+
+    async def connect(self):
+        self.connect_calls += 1
+        if self.fail_connects:
+            self.fail_connects -= 1
+            raise ConnectionError('network down')
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def is_user_authorized(self):
+        return self.authorized
+
+    async def start(self):
+        self.started = True
+
+    async def get_input_entity(self, peer):
+        self.lookups.append(peer)
+        return f'entity:{peer}'
+
+    async def send_message(self, entity, message):
+        if not self.connected:
+            raise ConnectionError('not connected')
+        await asyncio.sleep(self.send_delay)
+        self.sent.append((entity, message))
+
+    async def disconnect(self):
+        self.connected = False
+
+
+@pytest.fixture
+def manager_for():
+    managers = []
+
+    def _make(client, **kwargs):
+        m = TelegramSessionManager(client_factory=lambda: client, backoff_initial=0.01, **kwargs)
+        managers.append(m)
+        return m
+
+    yield _make
+    for m in managers:
+        m.stop()
+
+
+def test_one_connection_serves_many_sends(manager_for):
+    client = FakeTelegramClient()
+    manager = manager_for(client)
+    for name in ('alice', 'bob', 'carol'):
+        assert manager.send_sync(name, f'hi {name}', timeout=5) is True
+    assert client.connect_calls == 1
+    assert [m for _, m in client.sent] == ['hi alice', 'hi bob', 'hi carol']
+    stats = manager.stats()
+    assert stats['sent'] == 3 and stats['connected'] and stats['avg_ms'] is not None
+
+
+def test_queued_messages_to_one_peer_share_entity_lookup(manager_for):
+    client = FakeTelegramClient()
+    manager = manager_for(client, batch_window=0.2)
+    futures = [manager.send('alice', f'msg {i}') for i in range(3)] + [manager.send('bob', 'yo')]
+    assert [f.result(5) for f in futures] == [True] * 4
+    assert client.lookups == ['alice', 'bob']
+    assert client.sent == [('entity:alice', 'msg 0'), ('entity:alice', 'msg 1'),
+                           ('entity:alice', 'msg 2'), ('entity:bob', 'yo')]
+    assert manager.stats()['batches'] == 1
+
+
+def test_reconnects_with_backoff(manager_for):
+    client = FakeTelegramClient(fail_connects=2)
+    manager = manager_for(client)
+    assert manager.send_sync('alice', 'hello', timeout=5) is True
+    assert client.connect_calls == 3
+    assert manager.stats()['reconnects'] == 2
+
+    # a dropped connection is re-established on the next send
+    client.connected = False
+    assert manager.send_sync('alice', 'again', timeout=5) is True
+    assert client.connect_calls == 4
+
+
+def test_gives_up_after_max_attempts(manager_for):
+    client = FakeTelegramClient(fail_connects=10)
+    manager = manager_for(client, max_connect_attempts=2)
+    with pytest.raises(ConnectionError):
+        manager.send_sync('alice', 'hello', timeout=5)
+    assert manager.stats()['failed'] == 1
+
+
+def test_unauthorized_session_fails_fast(manager_for):
+    client = FakeTelegramClient(authorized=False)
+    manager = manager_for(client)
+    with pytest.raises(RuntimeError, match='not authorized'):
+        manager.send_sync('alice', 'hello', timeout=5)
+    assert client.connect_calls == 1 and not client.started
+
+
+def test_timed_out_send_is_withdrawn(manager_for):
+    client = FakeTelegramClient(send_delay=0.3)
+    manager = manager_for(client)
+    first = manager.send('alice', 'slow')
+    with pytest.raises(TimeoutError):
+        manager.send_sync('bob', 'too late', timeout=0.05)
+    assert first.result(5) is True
+    assert manager.send_sync('carol', 'next', timeout=5) is True
+    assert [m for _, m in client.sent] == ['slow', 'next']
@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+
+from engine.thread_safe_db import ConnectionPool, pooled_cursor
+
+
+def _make_pool(tmp_path, **kwargs):
+    path = str(tmp_path / "pool.db")
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE sys_command(id integer primary key, name VARCHAR(100), path VARCHAR(1000))")
+    con.commit()
+    con.close()
+    return ConnectionPool(path, **kwargs)
+
+
+def test_connections_are_reused_and_wal_enabled(tmp_path):
+    pool = _make_pool(tmp_path, max_size=2)
+    for _ in range(5):
+        with pool.connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    stats = pool.stats()
+    assert mode.lower() == "wal"
+    assert stats['created'] == 1
+    assert stats['reused'] == 4
+    assert stats['in_use'] == 0 and stats['idle'] == 1
+
+
+def test_reentrant_checkout_shares_connection(tmp_path):
+    pool = _make_pool(tmp_path, max_size=1, timeout=0.5)
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    assert pool.stats()['open'] == 1
+
+
+def test_pool_is_bounded_under_concurrency(tmp_path):
+    pool = _make_pool(tmp_path, max_size=3)
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(20):
+            with pool.connection() as conn:
+                conn.execute("SELECT COUNT(*) FROM sys_command").fetchone()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = pool.stats()
+    assert stats['open'] <= 3
+    assert stats['created'] + stats['reused'] == 160
+    pool.close_all()
+    assert pool.stats()['open'] == 0
+
+
+def _names(pool):
+    with pool.connection() as conn:
+        return [r[0] for r in conn.execute("SELECT name FROM sys_command ORDER BY id")]
+
+
+def test_failed_nested_block_is_undone_when_outer_commits(tmp_path):
+    pool = _make_pool(tmp_path)
+    with pooled_cursor(pool) as outer:
+        outer.execute("INSERT INTO sys_command (name, path) VALUES ('kept', 'a')")
+        try:
+            with pooled_cursor(pool) as inner:
+                inner.execute("INSERT INTO sys_command (name, path) VALUES ('partial', 'b')")
+                raise ValueError('inner failed')
+        except ValueError:
+            pass
+        with pooled_cursor(pool) as inner:
+            inner.execute("INSERT INTO sys_command (name, path) VALUES ('nested', 'c')")
+    assert _names(pool) == ['kept', 'nested']
+
+
+def test_nested_block_does_not_commit_before_outer(tmp_path):
+    pool = _make_pool(tmp_path)
+    try:
+        with pooled_cursor(pool) as outer:
+            outer.execute("SELECT COUNT(*) FROM sys_command")
+            with pooled_cursor(pool) as inner:
+                inner.execute("INSERT INTO sys_command (name, path) VALUES ('inner', 'a')")
+            raise ValueError('outer failed')
+    except ValueError:
+        pass
+    assert _names(pool) == []
+
+
+def test_leaked_transaction_is_rolled_back(tmp_path):
+    pool = _make_pool(tmp_path, max_size=1)
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO sys_command (name, path) VALUES ('leaked', 'a')")
+    with pooled_cursor(pool) as cursor:
+        cursor.execute("INSERT INTO sys_command (name, path) VALUES ('committed', 'b')")
+    assert _names(pool) == ['committed']
@@ -0,0 +1,87 @@
+import pytest
+
+from engine import translator as translator_module
+from engine.translator import (GoogleTranslateBackend, StubTranslationBackend, TranslationCache, Translator,
+                               detect_script, needs_translation)
+
+
+@pytest.fixture
+def make_translator(tmp_path):
+    caches = []
+
+    def _make(mapping):
+        cache = TranslationCache(str(tmp_path / 'translations.db'))
+        caches.append(cache)
+        return Translator(backend=StubTranslationBackend(mapping), cache=cache)
+
+    yield _make
+    for cache in caches:
+        cache.close()
+
+
+def test_detector_skips_english():
+    assert detect_script('open notepad and type hello') == 'latin'
+    assert detect_script('నేను బాగున్నాను') == 'telugu'
+    assert detect_script('मैं ठीक हूँ') == 'devanagari'
+    assert not needs_translation('Hello, how are you today?')
+    assert needs_translation('nenu chaala bagunnanu')
+    assert needs_translation('నేను బాగున్నాను')
+    assert not needs_translation('Please send the meeting notes to my office today')
+
+
+def test_other_latin_languages_are_translated():
+    for text in ('hola como estas', 'bonjour je suis content', 'mujhe gaana sunao'):
+        assert needs_translation(text), text
+
+
+def test_sentences_are_batched_and_cached_on_disk(make_translator):
+    mapping = {'నేను బాగున్నాను.': 'I am fine.', 'మీరు ఎలా ఉన్నారు?': 'How are you?'}
+    first = make_translator(mapping)
+    assert first.translate('నేను బాగున్నాను. మీరు ఎలా ఉన్నారు?') == 'I am fine. How are you?'
+    assert len(first.backend.calls) == 1
+    assert first.backend.calls[0][0] == list(mapping)
+
+    # a fresh translator over the same file answers from disk
+    second = make_translator({})
+    assert second.translate('మీరు ఎలా ఉన్నారు?\nనేను బాగున్నాను.') == 'How are you?\nI am fine.'
+    assert second.backend.calls == []
+
+
+def test_backend_failure_returns_original(make_translator):
+    def boom(text, target):
+        raise RuntimeError('offline')
+
+    t = make_translator(boom)
+    assert t.translate('నేను బాగున్నాను') == 'నేను బాగున్నాను'
+
+
+def test_detect_and_translate_telugu_uses_no_backend_for_english(monkeypatch, make_translator):
+    t = make_translator({'nenu chaala bagunnanu': 'I am very well'})
+    monkeypatch.setattr(translator_module, 'translator', t)
+    assert translator_module.detect_and_translate_telugu('open the door please') == 'open the door please'
+    assert t.backend.calls == []
+    assert translator_module.detect_and_translate_telugu('nenu chaala bagunnanu') == 'I am very well'
+
+
+def test_spanish_goes_to_the_backend(monkeypatch, make_translator):
+    t = make_translator({'hola como estas': 'hello how are you'})
+    monkeypatch.setattr(translator_module, 'translator', t)
+    assert translator_module.detect_and_translate_telugu('hola como estas') == 'hello how are you'
+
+
+def test_google_response_keeps_every_segment():
+    result = [[['I am fine. ', 'నేను బాగున్నాను. ', None], ['How are you?', 'మీరు ఎలా ఉన్నారు?', None]], None, 'te']
+    assert GoogleTranslateBackend.parse(result) == 'I am fine. How are you?'
+
+
+def test_google_batch_splits_lines(monkeypatch):
+    backend = GoogleTranslateBackend(max_chars=12)
+    sent = []
+
+    def fake_request(text, target):
+        sent.append(text)
+        return text.upper()
+
+    monkeypatch.setattr(backend, '_request', fake_request)
+    assert backend.translate_batch(['abc', 'def', 'ghijklmnop'], 'en') == ['ABC', 'DEF', 'GHIJKLMNOP']
+    assert sent == ['abc\ndef', 'ghijklmnop']
@@ -0,0 +1,79 @@
+import json
+
+from engine.tts_engine import HeadlessTTSBackend, TTSEngineManager
+from engine.tts_pipeline import TTSPipeline
+
+
+class Voice:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+class VoiceCountingBackend(HeadlessTTSBackend):
+    enumerations = 0
+
+    def __init__(self):
+        super().__init__()
+        self.properties['voices'] = [Voice('v-david', 'Microsoft David'), Voice('v-zira', 'Microsoft Zira')]
+
+    def getProperty(self, name):
+        if name == 'voices':
+            VoiceCountingBackend.enumerations += 1
+        return super().getProperty(name)
+
+
+def test_voice_choice_is_cached_across_runs(tmp_path):
+    VoiceCountingBackend.enumerations = 0
+    path = str(tmp_path / 'voice.json')
+    first = TTSEngineManager(VoiceCountingBackend, voice_cache_path=path)
+    assert first.get().getProperty('voice') == 'v-zira'
+    assert first.status()['voice_cached'] is False
+
+    second = TTSEngineManager(VoiceCountingBackend, voice_cache_path=path)
+    engine = second.get()
+    assert engine.getProperty('voice') == 'v-zira'
+    assert engine.getProperty('rate') == 150
+    assert second.status()['voice_cached'] is True
+    assert VoiceCountingBackend.enumerations == 1
+
+
+class StrictVoiceBackend(VoiceCountingBackend):
+    """Like pyttsx3: an unknown voice id is ignored without raising."""
+
+    def setProperty(self, name, value):
+        if name == 'voice' and value not in [v.id for v in self.properties['voices']]:
+            return
+        super().setProperty(name, value)
+
+
+def test_stale_cached_voice_is_replaced(tmp_path):
+    path = tmp_path / 'voice.json'
+    path.write_text(json.dumps({'voice_id': 'v-uninstalled', 'name': 'Gone'}))
+    manager = TTSEngineManager(StrictVoiceBackend, voice_cache_path=str(path))
+    assert manager.get().getProperty('voice') == 'v-zira'
+    assert manager.status()['voice_cached'] is False
+    assert json.loads(path.read_text())['voice_id'] == 'v-zira'
+
+
+def test_pipeline_warms_engine_and_reports_latency(tmp_path):
+    manager = TTSEngineManager(HeadlessTTSBackend, voice_cache_path=str(tmp_path / 'voice.json'))
+    pipeline = TTSPipeline(manager.get, on_spoken=manager.record)
+    pipeline.start()
+    assert manager.wait_ready(5)
+
+    assert pipeline.say('Hello there. Welcome').wait(5)
+    assert manager.get().spoken == ['Hello there.', 'Welcome']
+    status = manager.status()
+    assert status['state'] == 'ready' and status['utterances'] == 1
+    assert status['last_wait_ms'] is not None and status['avg_speak_ms'] is not None
+
+
+def test_unavailable_engine_is_reported(tmp_path):
+    def broken():
+        raise OSError('no audio device')
+
+    manager = TTSEngineManager(broken, voice_cache_path=str(tmp_path / 'voice.json'))
+    assert manager.get() is None
+    assert manager.wait_ready(1) is False
+    assert manager.status()['error'] == 'no audio device'
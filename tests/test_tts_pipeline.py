@@ -0,0 +1,120 @@
+import threading
+
+from engine.tts_pipeline import HIGH, LOW, TTSPipeline, split_chunks
+
+
+class FakeEngine:
+    def __init__(self):
+        self.queued = []
+        self.runs = []
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+
+    def say(self, text):
+        self.queued.append(text)
+
+    def runAndWait(self):
+        self.started.set()
+        self.release.wait(5)
+        self.runs.append(self.queued)
+        self.queued = []
+
+    def stop(self):
+        self.release.set()
+
+
+def _blocked_pipeline():
+    """A pipeline whose worker is busy speaking 'warm up' until engine.release is set."""
+    engine = FakeEngine()
+    engine.release.clear()
+    pipeline = TTSPipeline(lambda: engine)
+    first = pipeline.say('warm up')
+    assert engine.started.wait(5)
+    return pipeline, engine, first
+
+
+def test_waiting_utterances_share_one_run_loop():
+    pipeline, engine, first = _blocked_pipeline()
+    a = pipeline.say('Hello there. How are you?')
+    b = pipeline.say('Bye')
+    engine.release.set()
+    assert b.wait(5) and a.done() and first.done()
+    assert engine.runs == [['warm up'], ['Hello there.', 'How are you?', 'Bye']]
+
+
+def test_priority_and_stale_announcements():
+    pipeline, engine, _ = _blocked_pipeline()
+    low = pipeline.say('low', priority=LOW)
+    stale = pipeline.say('Executing 3 commands', key='status')
+    fresh = pipeline.say('Completed 3 tasks', key='status')
+    urgent = pipeline.say('urgent', priority=HIGH)
+    engine.release.set()
+    assert low.wait(5) and fresh.wait(5)
+    assert stale.cancelled and stale.done()
+    # one priority and key per run, most urgent first
+    assert engine.runs[1:] == [['urgent'], ['Completed 3 tasks'], ['low']]
+    assert not urgent.cancelled
+
+
+def test_cancel_by_key_leaves_other_speech_alone():
+    class StatusEngine(FakeEngine):
+        """Blocks on 'warm up' until `warmed` is set and on the status line until release."""
+
+        def __init__(self):
+            super().__init__()
+            self.warmed = threading.Event()
+            self.status_started = threading.Event()
+
+        def runAndWait(self):
+            if 'warm up' in self.queued:
+                self.started.set()
+                self.warmed.wait(5)
+            if 'Executing 3 commands' in self.queued:
+                self.status_started.set()
+                self.release.wait(5)
+            self.runs.append(self.queued)
+            self.queued = []
+
+    engine = StatusEngine()
+    engine.release.clear()
+    pipeline = TTSPipeline(lambda: engine)
+    pipeline.say('warm up')
+    assert engine.started.wait(5)
+    status = pipeline.say('Executing 3 commands', key='status')
+    other = pipeline.say('Reminder')
+    engine.warmed.set()
+    assert engine.status_started.wait(5)
+    assert pipeline.cancel('status') == 1
+    assert status.wait(5) and status.cancelled
+    assert other.wait(5) and not other.cancelled
+    # the other utterance was not batched with (and cut off by) the cancelled one
+    assert engine.runs[1:] == [['Executing 3 commands'], ['Reminder']]
+
+
+def test_cancel_drops_queue_and_stops_current():
+    pipeline, engine, first = _blocked_pipeline()
+    queued = pipeline.say('never spoken')
+    assert pipeline.cancel() == 2
+    assert first.wait(5) and queued.cancelled and first.cancelled
+    after = pipeline.say('next')
+    assert after.wait(5)
+    assert all('never spoken' not in run for run in engine.runs)
+
+
+def test_on_spoken_runs_before_waiters_wake():
+    seen = []
+    pipeline = TTSPipeline(lambda: FakeEngine(), on_spoken=lambda group, start, end: seen.append(group[0].text))
+    assert pipeline.say('hello').wait(5)
+    assert seen == ['hello']
+
+
+def test_missing_engine_prints(capsys):
+    pipeline = TTSPipeline(lambda: None)
+    assert pipeline.say('hello').wait(5)
+    assert 'Jarvis: hello' in capsys.readouterr().out
+
+
+def test_split_chunks():
+    assert split_chunks('One, two. Three!') == ['One', 'two.', 'Three!']
+    assert split_chunks('   ') == ['   ']
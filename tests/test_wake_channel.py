@@ -0,0 +1,70 @@
+import threading
+import time
+
+from engine.wake_channel import WakeMetrics, WakeReceiver, WakeSender, create_channel
+
+
+def test_wake_event_crosses_pipe_with_preroll():
+    recv_conn, send_conn = create_channel()
+    got = []
+    arrived = threading.Event()
+    metrics = WakeMetrics()
+
+    def on_wake(event):
+        got.append(event)
+        arrived.set()
+
+    WakeReceiver(recv_conn, on_wake, metrics=metrics).start()
+    assert WakeSender(send_conn).send('jarvis', b'\x01\x00' * 8, 16000)
+    assert arrived.wait(2)
+
+    event = got[0]
+    assert event.keyword == 'jarvis'
+    assert event.preroll == b'\x01\x00' * 8
+    assert event.sample_rate == 16000
+    assert metrics.stats()['wakes'] == 1
+    assert metrics.stats()['last_transport_ms'] < 1000
+
+
+def test_listen_latency_recorded_once_per_wake():
+    metrics = WakeMetrics()
+    assert metrics.mark_listening() is None
+
+    recv_conn, send_conn = create_channel()
+    done = threading.Event()
+    WakeReceiver(recv_conn, lambda event: done.set(), metrics=metrics).start()
+    WakeSender(send_conn).send('alexa')
+    assert done.wait(2)
+    assert metrics.pending()
+
+    ms = metrics.mark_listening()
+    assert ms is not None and ms >= 0
+    assert not metrics.pending()
+    assert metrics.mark_listening() is None
+    assert metrics.stats()['last_listen_ms'] == round(ms, 1)
+
+
+def test_stale_wake_is_not_counted():
+    metrics = WakeMetrics(stale_after=0.01)
+
+    class _Event:
+        timestamp = time.time() - 1
+
+    metrics.mark_wake(_Event())
+    assert not metrics.pending()
+    assert metrics.mark_listening() is None
+    assert metrics.stats()['last_listen_ms'] is None
+
+
+def test_sender_reports_closed_channel_for_fallback():
+    recv_conn, send_conn = create_channel()
+    recv_conn.close()
+    assert WakeSender(send_conn).send('jarvis') is False
+
+
+def test_receiver_stops_when_hotword_process_exits():
+    recv_conn, send_conn = create_channel()
+    receiver = WakeReceiver(recv_conn, lambda event: None, metrics=WakeMetrics()).start()
+    send_conn.close()
+    receiver.join(2)
+    assert not receiver._thread.is_alive()
@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from engine.cache import TTLCache
+from engine.http_client import HttpClient
+from engine.youtube_search import YouTubeSearch, parse_video_ids
+
+VIDEOS = {
+    'aaaaaaaaaa1': ('Dosti Song (Lyric Video) - full album jukebox', 'Random Uploader'),
+    'aaaaaaaaaa2': ('Dosti Song', 'T-Series Official'),
+    'aaaaaaaaaa3': ('Something else entirely', 'Someone'),
+}
+OEMBED_DELAY = 0.2
+
+
+class _StubYouTube(BaseHTTPRequestHandler):
+    hits = []
+    failing = set()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.hits.append(parsed.path)
+        if parsed.path == '/results':
+            body = ''.join(f'{{"videoId":"{vid}"}}' for vid in VIDEOS).encode()
+            ctype = 'text/html'
+        elif parsed.path == '/oembed':
+            time.sleep(OEMBED_DELAY)
+            vid = parse_qs(urlparse(parse_qs(parsed.query)['url'][0]).query)['v'][0]
+            if vid in self.failing:
+                self.send_error(503)
+                return
+            title, author = VIDEOS[vid]
+            body = json.dumps({'title': title, 'author_name': author}).encode()
+            ctype = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubYouTube.hits = []
+    _StubYouTube.failing = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubYouTube)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_rank_fetches_metadata_concurrently_and_picks_exact_title(stub_server):
+    search = YouTubeSearch(base_url=stub_server)
+    t0 = time.monotonic()
+    url, title = search.best('dosti song')
+    elapsed = time.monotonic() - t0
+
+    assert url == f'{stub_server}/watch?v=aaaaaaaaaa2'
+    assert title == 'Dosti Song'
+    assert _StubYouTube.hits.count('/oembed') == len(VIDEOS)
+    # three serial oEmbed calls would take at least 3 * OEMBED_DELAY
+    assert elapsed < OEMBED_DELAY * len(VIDEOS)
+
+
+def test_repeat_search_is_served_from_cache(stub_server):
+    search = YouTubeSearch(base_url=stub_server)
+    first = search.rank('Dosti Song')
+    hits = len(_StubYouTube.hits)
+
+    assert search.rank('dosti song ') == first
+    assert len(_StubYouTube.hits) == hits
+
+    # a new term re-reads the results page but reuses cached video metadata
+    search.rank('dosti')
+    assert _StubYouTube.hits[hits:] == ['/results']
+
+
+def test_ranking_with_missing_metadata_is_not_cached(stub_server):
+    search = YouTubeSearch(base_url=stub_server)
+    _StubYouTube.failing = {'aaaaaaaaaa2'}
+    assert search.best('dosti song')[0] == f'{stub_server}/watch?v=aaaaaaaaaa1'
+    assert len(search.search_cache) == 0
+
+    _StubYouTube.failing = set()
+    assert search.best('dosti song')[0] == f'{stub_server}/watch?v=aaaaaaaaaa2'
+    assert len(search.search_cache) == 1
+
+
+def test_unreachable_server_returns_nothing():
+    search = YouTubeSearch(base_url='http://127.0.0.1:9', client=HttpClient(retries=0), search_timeout=1)
+    assert search.best('anything') == (None, None)
+    assert len(search.search_cache) == 0
+
+
+def test_parse_video_ids_falls_back_to_watch_links():
+    html = '<a href="/watch?v=bbbbbbbbbb1">x</a><a href="/watch?v=bbbbbbbbbb1">'
+    assert parse_video_ids(html) == ['bbbbbbbbbb1']
+    assert parse_video_ids('"videoId":"ccccccccccc" /watch?v=bbbbbbbbbb1') == ['ccccccccccc']
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(maxsize=4, ttl=10, clock=lambda: now[0])
+    cache.put('k', 'v')
+    assert cache.get('k') == 'v'
+    now[0] = 10.0
+    assert cache.get('k') is None
+    assert cache.stats()['hits'] == 1 and len(cache) == 0
@@ -0,0 +1,81 @@
+# Hotword loop benchmark over a WAV file (no microphone needed).
+# Compares the old inline loop (struct.unpack_from with a format string built
+# per frame) with HotwordDetector. Without --porcupine a stand-in engine only
+# does the hand-off to C that Porcupine.process() does (a ctypes array built
+# from the samples), so the numbers are the plumbing overhead.
+# Usage: python tools/bench_hotword.py [file.wav] [--porcupine]
+import ctypes
+import os
+import struct
+import sys
+import tempfile
+import time
+import wave
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from engine.hotword import HotwordDetector, KeywordEngine, PorcupineEngine, WavFileSource
+
+
+class HandoffOnlyEngine(KeywordEngine):
+    def process(self, pcm):
+        (ctypes.c_short * len(pcm))(*pcm)
+        return -1
+
+
+def make_wav(seconds=60, sample_rate=16000):
+    fd, path = tempfile.mkstemp(suffix='.wav')
+    os.close(fd)
+    noise = (np.random.default_rng(0).standard_normal(seconds * sample_rate) * 800).astype(np.int16)
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(noise.tobytes())
+    return path
+
+
+def bench_legacy(path, engine):
+    fl = engine.frame_length
+    frames = 0
+    t0 = time.perf_counter()
+    with wave.open(path, 'rb') as wf:
+        while True:
+            data = wf.readframes(fl)
+            if len(data) < fl * 2:
+                break
+            pcm = struct.unpack_from("h" * fl, data)
+            engine.process(pcm)
+            frames += 1
+    return frames, time.perf_counter() - t0
+
+
+def bench_detector(path, engine):
+    t0 = time.perf_counter()
+    stats = HotwordDetector(engine, WavFileSource(path, engine.frame_length), lambda i, d: None).run()
+    return stats['frames'], time.perf_counter() - t0
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    engine = PorcupineEngine() if '--porcupine' in sys.argv else HandoffOnlyEngine()
+    path = args[0] if args else make_wav()
+    frame_ms = engine.frame_length * 1000.0 / engine.sample_rate
+    try:
+        for label, fn in (('inline loop', bench_legacy), ('HotwordDetector', bench_detector)):
+            frames, seconds = fn(path, engine)
+            per_frame_us = seconds / frames * 1e6
+            print(f"{label:>15}: {frames} frames  {per_frame_us:7.1f} us/frame  "
+                  f"({per_frame_us / 10.0 / frame_ms:.2f}% of one core in real time)")
+    finally:
+        engine.delete()
+        if not args:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
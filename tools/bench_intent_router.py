@@ -0,0 +1,98 @@
+# Micro-benchmark: intent router vs the legacy substring if/elif chain
+# Usage: python tools/bench_intent_router.py [iterations]
+import os
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from engine import intent_router
+from engine.intent_router import classify
+
+UTTERANCES = [
+    "open notepad",
+    "open youtube",
+    "play dosti song on youtube",
+    "open chrome and open calculator",
+    "send message to praveen",
+    "phone call to mom",
+    "send telegram message to alice hello",
+    "what is the capital of france",
+    "open_and_type notepad and type hello world",
+    "tell me a joke about computers and science",
+]
+
+
+def legacy_classify(command, command_type=None):
+    """Replica of the chain TaskManager.execute_command used before the router."""
+    command_lower = (command or '').lower()
+    if "open" in command_lower and "youtube" in command_lower:
+        return 'open_youtube'
+    elif command_lower.startswith('open_and_type') or 'open_and_type' in command_lower:
+        return 'open_and_type'
+    elif command_type == 'open_and_type':
+        return 'open_and_type'
+    elif "play" in command_lower and ("youtube" in command_lower or "on youtube" in command_lower):
+        return 'play_youtube'
+    elif "open" in command_lower:
+        return 'open'
+    elif "send message" in command_lower or "phone call" in command_lower or "video call" in command_lower:
+        return 'contact'
+    elif "telegram" in command_lower and ("send" in command_lower or "message" in command_lower):
+        return 'telegram'
+    return 'ai'
+
+
+def legacy_single_command(query):
+    """Replica of the chain command.execute_single_command used before the router."""
+    query = (query or '').lower()
+    if "open" in query:
+        return 'open'
+    elif "on youtube" in query:
+        return 'play_youtube'
+    elif "send message" in query or "phone call" in query or "video call" in query:
+        return 'contact'
+    return 'ai'
+
+
+def _run_legacy():
+    for u in UTTERANCES:
+        legacy_classify(u)
+
+
+def _run_router_cold():
+    intent_router._classify.cache_clear()
+    for u in UTTERANCES:
+        classify(u)
+
+
+def _run_router_uncached():
+    # the table walk alone, without the cache lookup or cache_clear()
+    walk = intent_router._classify.__wrapped__
+    for u in UTTERANCES:
+        walk(u, None, 'task')
+
+
+def _run_router():
+    for u in UTTERANCES:
+        classify(u)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    for u in UTTERANCES:
+        assert classify(u).name == legacy_classify(u), u
+        assert classify(u, table='single_command').name == legacy_single_command(u), u
+
+    total = iterations * len(UTTERANCES)
+    for label, fn in (('legacy chain', _run_legacy), ('router (cold)', _run_router_cold),
+                      ('router (uncached)', _run_router_uncached), ('router (cached)', _run_router)):
+        elapsed = timeit.timeit(fn, number=iterations)
+        print(f"{label:17s} {total / elapsed:12.0f} classifications/s  ({elapsed * 1e6 / total:.2f} us each)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Startup benchmark: time to import the engine modules in a fresh interpreter,
+# with heavy third-party imports deferred (default) vs. imported eagerly.
+# Usage: python tools/bench_startup.py [runs] [module ...]
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_MODULES = ['engine.features', 'engine.task_manager']
+
+CHILD = r'''
+import sys, time
+t0 = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - t0
+from engine import lazy_imports
+print(f"ELAPSED {elapsed:.6f}")
+print(lazy_imports.report())
+'''
+
+
+def run_once(modules, eager):
+    env = dict(os.environ, JARVIS_HEADLESS='1', JARVIS_EAGER_IMPORTS='1' if eager else '0')
+    proc = subprocess.run([sys.executable, '-c', CHILD] + modules, cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'import failed')
+    lines = proc.stdout.splitlines()
+    elapsed = next(float(l.split()[1]) for l in lines if l.startswith('ELAPSED '))
+    report = '\n'.join(lines[lines.index('lazy imports:'):])
+    return elapsed, report
+
+
+def main():
+    args = sys.argv[1:]
+    runs = int(args.pop(0)) if args and args[0].isdigit() else 5
+    modules = args or DEFAULT_MODULES
+    print(f"importing {', '.join(modules)} ({runs} fresh interpreters each)")
+    for label, eager in (('lazy', False), ('eager', True)):
+        try:
+            results = [run_once(modules, eager) for _ in range(runs)]
+        except RuntimeError as e:
+            print(f"{label:>5}: failed ({e})")
+            continue
+        times = [r[0] for r in results]
+        print(f"{label:>5}: median {statistics.median(times) * 1000:8.1f} ms  min {min(times) * 1000:8.1f} ms")
+        if eager:
+            print(results[-1][1])
+
+
+if __name__ == '__main__':
+    main()
@@ -62,6 +62,25 @@ def load_audio(file: str, sr: int = SAMPLE_RATE):
     return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
 
 
+def load_pcm16(data: bytes):
+    """
+    Read raw little-endian 16-bit mono PCM that is already at SAMPLE_RATE,
+    e.g. frames captured from a microphone, without writing a file or spawning ffmpeg
+
+    Parameters
+    ----------
+    data: bytes
+        The PCM samples
+
+    Returns
+    -------
+    A NumPy array containing the audio waveform, in float32 dtype.
+    """
+    audio = np.frombuffer(data, np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
+
+
 def pad_or_trim(array, length: int = N_SAMPLES, *, axis: int = -1):
     """
     Pad or trim the audio array to N_SAMPLES, as expected by the encoder.
@@ -108,7 +127,7 @@ def mel_filters(device, n_mels: int) -> torch.Tensor:
 
 
 def log_mel_spectrogram(
-    audio: Union[str, np.ndarray, torch.Tensor],
+    audio: Union[str, bytes, np.ndarray, torch.Tensor],
     n_mels: int = 80,
     padding: int = 0,
     device: Optional[Union[str, torch.device]] = None,
@@ -118,8 +137,9 @@ def log_mel_spectrogram(
 
     Parameters
     ----------
-    audio: Union[str, np.ndarray, torch.Tensor], shape = (*)
-        The path to audio or either a NumPy array or Tensor containing the audio waveform in 16 kHz
+    audio: Union[str, bytes, np.ndarray, torch.Tensor], shape = (*)
+        The path to audio, raw 16-bit PCM bytes in 16 kHz, or either a NumPy array or Tensor
+        containing the audio waveform in 16 kHz
 
     n_mels: int
         The number of Mel-frequency filters, only 80 and 128 are supported
@@ -138,6 +158,8 @@ def log_mel_spectrogram(
     if not torch.is_tensor(audio):
         if isinstance(audio, str):
             audio = load_audio(audio)
+        elif isinstance(audio, (bytes, bytearray, memoryview)):
+            audio = load_pcm16(audio)
         audio = torch.from_numpy(audio)
 
     if device is not None:
@@ -39,6 +39,13 @@ $(document).ready(function () {
         $("#SiriWave").attr("hidden", true);
     }
 
+    // Hotword heard: Python is already capturing, only switch to the listening view
+    eel.expose(ShowListening)
+    function ShowListening() {
+        $("#Oval").attr("hidden", true);
+        $("#SiriWave").attr("hidden", false);
+    }
+
     // Allow Python to hide mic status if needed
     eel.expose(hideMicStatus)
     function hideMicStatus() {
@@ -242,9 +242,40 @@ $(document).ready(function () {
     // Settings Code
 
     eel.personalInfo()();
-    eel.displaySysCommand()();
-    eel.displayWebCommand()();
-    eel.displayPhoneBookCommand()();
+    loadTablePage('sys_command');
+    loadTablePage('web_command');
+    loadTablePage('contacts');
+
+    // Search box and pager above each settings table
+    let searchTimers = {};
+    $(".table-search").on("input", function () {
+        let table = $(this).data("table");
+        let search = $(this).val();
+        clearTimeout(searchTimers[table]);
+        searchTimers[table] = setTimeout(function () {
+            tableState[table].search = search;
+            tableState[table].offset = 0;
+            loadTablePage(table);
+        }, 250);
+    });
+
+    $(".table-pager .table-prev").click(function () {
+        let table = $(this).closest(".table-pager").data("table");
+        let state = tableState[table];
+        if (state.offset > 0) {
+            state.offset = Math.max(0, state.offset - PAGE_SIZE);
+            loadTablePage(table);
+        }
+    });
+
+    $(".table-pager .table-next").click(function () {
+        let table = $(this).closest(".table-pager").data("table");
+        let state = tableState[table];
+        if (state.offset + PAGE_SIZE < state.total) {
+            state.offset += PAGE_SIZE;
+            loadTablePage(table);
+        }
+    });
 
 
 
@@ -295,38 +326,6 @@ $(document).ready(function () {
     });
 
 
-    // Display System Command Method
-    eel.expose(displaySysCommand)
-    function displaySysCommand(array) {
-
-        let data = JSON.parse(array);
-        console.log(data)
-
-        let placeholder = document.querySelector("#TableData");
-        let out = "";
-        let index = 0
-        for (let i = 0; i < data.length; i++) {
-            index++
-            out += `
-                    <tr>
-                        <td class="text-light"> ${index} </td>
-                        <td class="text-light"> ${data[i][1]} </td>
-                        <td class="text-light"> ${data[i][2]} </td>
-                        <td class="text-light"> <button id="${data[i][0]}" onClick="SysDeleteID(this.id)" class="btn btn-sm btn-glow-red">Delete</button></td>
-                        
-                    </tr>
-            `;
-
-            // console.log(data[i][0])
-            // console.log(data[i][1])
-
-
-        }
-
-        placeholder.innerHTML = out;
-
-    }
-
     // Add System Command Button
     $("#SysCommandAddBtn").click(function () {
 
@@ -334,13 +333,14 @@ $(document).ready(function () {
         let value = $("#SysCommandValue").val();
 
         if (key.length > 0 && value.length) {
-            eel.addSysCommand(key, value)
+            eel.addSysCommand(key, value)(function () {
+                refreshTable('sys_command');
+            });
 
             swal({
                 title: "Updated Successfully",
                 icon: "success",
             });
-            eel.displaySysCommand()();
             $("#SysCommandKey").val("");
             $("#SysCommandValue").val("");
 
@@ -358,38 +358,6 @@ $(document).ready(function () {
     });
 
 
-    // Display Web Commands Table
-    eel.expose(displayWebCommand)
-    function displayWebCommand(array) {
-
-        let data = JSON.parse(array);
-        console.log(data)
-
-        let placeholder = document.querySelector("#WebTableData");
-        let out = "";
-        let index = 0
-        for (let i = 0; i < data.length; i++) {
-            index++
-            out += `
-                    <tr>
-                        <td class="text-light"> ${index} </td>
-                        <td class="text-light"> ${data[i][1]} </td>
-                        <td class="text-light"> ${data[i][2]} </td>
-                        <td class="text-light"> <button id="${data[i][0]}" onClick="WebDeleteID(this.id)" class="btn btn-sm btn-glow-red">Delete</button></td>
-                        
-                    </tr>
-            `;
-
-            // console.log(data[i][0])
-            // console.log(data[i][1])
-
-
-        }
-
-        placeholder.innerHTML = out;
-
-    }
-
 
     // Add Web Commands
 
@@ -399,13 +367,14 @@ $(document).ready(function () {
         let value = $("#WebCommandValue").val();
 
         if (key.length > 0 && value.length) {
-            eel.addWebCommand(key, value)
+            eel.addWebCommand(key, value)(function () {
+                refreshTable('web_command');
+            });
 
             swal({
                 title: "Updated Successfully",
                 icon: "success",
             });
-            eel.displayWebCommand()();
             $("#WebCommandKey").val("");
             $("#WebCommandValue").val("");
 
@@ -423,38 +392,6 @@ $(document).ready(function () {
     });
 
 
-    // Display Phone Book
-
-    eel.expose(displayPhoneBookCommand)
-    function displayPhoneBookCommand(array) {
-
-        let data = JSON.parse(array);
-        console.log(data)
-
-        let placeholder = document.querySelector("#ContactTableData");
-        let out = "";
-        let index = 0
-        for (let i = 0; i < data.length; i++) {
-            index++
-            out += `
-                    <tr>
-                        <td class="text-light"> ${index} </td>
-                        <td class="text-light"> ${data[i][1]} </td>
-                        <td class="text-light"> ${data[i][2]} </td>
-                        <td class="text-light"> ${data[i][3]} </td>
-                        <td class="text-light"> ${data[i][4]} </td>
-                        <td class="text-light"> <button id="${data[i][0]}" onClick="ContactDeleteID(this.id)" class="btn btn-sm btn-glow-red">Delete</button></td>
-                        
-                    </tr>
-            `;
-
-
-        }
-
-        placeholder.innerHTML = out;
-
-    }
-
     // Add Contacts to database
 
     $("#AddContactBtn").click(function () {
@@ -473,7 +410,9 @@ $(document).ready(function () {
                 City = "";
             }
 
-            eel.InsertContacts(Name, MobileNo, Email, City)
+            eel.InsertContacts(Name, MobileNo, Email, City)(function () {
+                refreshTable('contacts');
+            });
 
             swal({
                 title: "Updated Successfully",
@@ -484,7 +423,6 @@ $(document).ready(function () {
             $("#InputContactMobileNo").val("");
             $("#InputContactEmail").val("");
             $("#InputContactCity").val("");
-            eel.displayPhoneBookCommand()()
 
         }
         else {
@@ -507,8 +445,9 @@ function SysDeleteID(clicked_id) {
 
 
     // console.log(clicked_id);
-    eel.deleteSysCommand(clicked_id)
-    eel.displaySysCommand()();
+    eel.deleteSysCommand(clicked_id)(function () {
+        refreshTable('sys_command');
+    });
 
 }
 
@@ -516,15 +455,113 @@ function WebDeleteID(clicked_id) {
 
 
     // console.log(clicked_id);
-    eel.deleteWebCommand(clicked_id)
-    eel.displayWebCommand()();
+    eel.deleteWebCommand(clicked_id)(function () {
+        refreshTable('web_command');
+    });
 
 
 }
 function ContactDeleteID(clicked_id) {
 
     // console.log(clicked_id);
-    eel.deletePhoneBookCommand(clicked_id)
-    eel.displayPhoneBookCommand()();
+    eel.deletePhoneBookCommand(clicked_id)(function () {
+        refreshTable('contacts');
+    });
+
+}
+
+
+// Settings tables are fetched a page at a time (offset/limit/search) from Python;
+// after an add or delete only the rows changed since the page's cursor are pulled
+const PAGE_SIZE = 50;
 
-}
\ No newline at end of file
+const settingsTables = {
+    sys_command: { body: "#TableData", deleteFn: "SysDeleteID", columns: [1, 2] },
+    web_command: { body: "#WebTableData", deleteFn: "WebDeleteID", columns: [1, 2] },
+    contacts: { body: "#ContactTableData", deleteFn: "ContactDeleteID", columns: [1, 2, 3, 4] },
+};
+
+let tableState = {};
+for (let table in settingsTables) {
+    tableState[table] = { offset: 0, search: "", cursor: null, total: 0, rows: [] };
+}
+
+function escapeCell(value) {
+    if (value === null || value === undefined) {
+        return "";
+    }
+    return $("<div>").text(value).html();
+}
+
+function renderTable(table) {
+    let config = settingsTables[table];
+    let state = tableState[table];
+    let out = "";
+    for (let i = 0; i < state.rows.length; i++) {
+        let row = state.rows[i];
+        out += `<tr><td class="text-light"> ${state.offset + i + 1} </td>`;
+        for (let c of config.columns) {
+            out += `<td class="text-light"> ${escapeCell(row[c])} </td>`;
+        }
+        out += `<td class="text-light"> <button id="${row[0]}" onClick="${config.deleteFn}(this.id)" class="btn btn-sm btn-glow-red">Delete</button></td></tr>`;
+    }
+    document.querySelector(config.body).innerHTML = out;
+
+    let first = state.total ? state.offset + 1 : 0;
+    let last = state.offset + state.rows.length;
+    let pager = $(`.table-pager[data-table="${table}"]`);
+    pager.find(".table-range").text(`${first}-${last} of ${state.total}`);
+    pager.find(".table-prev").prop("disabled", state.offset == 0);
+    pager.find(".table-next").prop("disabled", last >= state.total);
+}
+
+function loadTablePage(table) {
+    let state = tableState[table];
+    eel.getTablePage(table, state.offset, PAGE_SIZE, state.search)(function (page) {
+        state.rows = page.rows;
+        state.total = page.total;
+        state.cursor = page.cursor;
+        // e.g. the last row of the last page was deleted
+        if (state.rows.length == 0 && state.offset > 0) {
+            state.offset = Math.max(0, state.offset - PAGE_SIZE);
+            loadTablePage(table);
+            return;
+        }
+        renderTable(table);
+    });
+}
+
+function refreshTable(table) {
+    let state = tableState[table];
+    // a filtered page can't be patched from unfiltered changes
+    if (state.cursor === null || state.search) {
+        loadTablePage(table);
+        return;
+    }
+    eel.getTableChanges(table, state.cursor)(function (diff) {
+        if (diff.reset) {
+            loadTablePage(table);
+            return;
+        }
+        state.cursor = diff.cursor;
+        state.total = diff.total;
+        let deleted = diff.deleted.map(String);
+        let before = state.rows.length;
+        state.rows = state.rows.filter(row => !deleted.includes(String(row[0])));
+        // rows shifted up from the next page; fetch the page again to fill the gap
+        if (state.rows.length < before && state.offset + state.rows.length < state.total) {
+            loadTablePage(table);
+            return;
+        }
+        for (let row of diff.upserted) {
+            let i = state.rows.findIndex(r => String(r[0]) == String(row[0]));
+            if (i >= 0) {
+                state.rows[i] = row;
+            } else if (state.rows.length < PAGE_SIZE && state.offset + state.rows.length < state.total) {
+                // new ids are the largest, so they belong at the end of the list
+                state.rows.push(row);
+            }
+        }
+        renderTable(table);
+    });
+}